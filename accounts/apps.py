@@ -7,3 +7,6 @@ from django.db.models.signals import post_save
 class AccountsConfig(AppConfig):
     name = 'accounts'
 
+    def ready(self) -> None:
+        # connect the signal receivers once the models are loaded
+        from accounts.signals import block_signals, friend_signals, relationship_signals
@@ -1,29 +1,32 @@
 import logging
 
+from asgiref.sync                 import sync_to_async
 from django.contrib.auth.backends import ModelBackend
 from django.core.handlers.wsgi    import WSGIRequest
-from django.db.models             import Q
+from django.http                  import HttpRequest
 from typing                       import Optional
 
-from accounts.models.user             import User
-from accounts.querysets.user_queryset import UserQuerySet
+from accounts.backends.authentication_cache import AuthenticationCache
+from accounts.models.user                   import User
+from core.metrics.timed                     import timed
 
 
 logger = logging.getLogger('accounts')
 
 class AccountsBackend(ModelBackend):
     """
-    The EmailBackend class handles authentication for a user when they use their
-    email to log in.
+    The AccountsBackend class handles authentication for a user when they
+    use either their username or their email to log in.
     """
 
     user: Optional[User] = None
     
+    @timed
     def authenticate(
         self,
         request: WSGIRequest,
         **kwargs: dict
-    ) -> User:
+    ) -> Optional[User]:
         """
         Parameters:
             request  -> the WSGIRequest object sent when 'submit'
@@ -32,28 +35,107 @@ class AccountsBackend(ModelBackend):
             **kwargs -> the dictionary of inputs gathered from the form
 
         Returns:
-            A user object if the user was authenticated properly, otherwise an error
-            will be raised
+            A user object if the user was authenticated properly, otherwise None
+            is returned so the remaining backends can be tried
         """
-        logger.info('Started AccountsBackend.authenticate method')
+        username: Optional[str] = kwargs.get('username', kwargs.get(User.USERNAME_FIELD))
+        password: Optional[str] = kwargs.get('password')
 
-        username: str = kwargs['username']
-        password: str = kwargs['password']
+        if username is None or password is None:
+            return None
 
-        query: UserQuerySet = User.get_user(
-            username=username,
-            email=email
-        )
+        self.user = self._get_candidate(identifier=username)
 
-        # if the QuerySet returned a successful find
-        if query.exists():
-            self.user = query.first()
-            if not self.user.authenticate(password=password)
-                self.user = None
-        else:
+        if self.user and not self.user.authenticate(password=password):
             self.user = None
 
-        logger.info('Completed AccountsBackend.authenticate method')
         return self.user
 
-        
+    @timed
+    async def aauthenticate(
+        self,
+        request: HttpRequest,
+        **kwargs: dict
+    ) -> Optional[User]:
+        """
+        Parameters:
+            request  -> the request object sent when 'submit' is hit on the
+                        frontend
+
+            **kwargs -> the dictionary of inputs gathered from the form
+
+        Returns:
+            A user object if the user was authenticated properly, otherwise None
+            is returned so the remaining backends can be tried
+
+        The aauthenticate method is the coroutine counterpart of authenticate.
+        The user is looked up on the database thread and the password is
+        verified by the password executor, so the event loop is free to serve
+        other requests while the password is being checked.
+        """
+        username: Optional[str] = kwargs.get('username', kwargs.get(User.USERNAME_FIELD))
+        password: Optional[str] = kwargs.get('password')
+
+        if username is None or password is None:
+            return None
+
+        self.user = await sync_to_async(self._get_candidate)(identifier=username)
+
+        if self.user and not await self.user.aauthenticate(password=password):
+            self.user = None
+
+        return self.user
+
+    def _get_candidate(
+        self,
+        *,
+        identifier: str
+    ) -> Optional[User]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+
+        Returns:
+            The User instance whose password should be checked, or None if the
+            login can be rejected without checking a password
+        """
+        entry: Optional[dict] = AuthenticationCache.get(identifier)
+
+        if entry is None or (
+            entry is not AuthenticationCache.MISSING
+            and (entry['is_banned'] or not entry['is_active'])
+        ):
+            # unknown, banned and inactive users are rejected without a query
+            logger.info('Rejected AccountsBackend.authenticate from the cache')
+            return None
+
+        if entry is AuthenticationCache.MISSING:
+            return self._get_login_user(identifier=identifier)
+
+        user: Optional[User] = User.objects.filter(pk=entry['pk']).first()
+
+        if AuthenticationCache.entry(identifier, user) != entry:
+            # the user changed since the entry was cached
+            user = self._get_login_user(identifier=identifier)
+
+        return user
+
+    def _get_login_user(
+        self,
+        *,
+        identifier: str
+    ) -> Optional[User]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+
+        Returns:
+            The matching User instance, or None if no user matches
+
+        The _get_login_user method looks the user up with a single fetch against
+        the index of either the email or the username and caches the result.
+        """
+        user: Optional[User] = User.get_login_user(identifier=identifier)
+        AuthenticationCache.set(identifier, user)
+
+        return user
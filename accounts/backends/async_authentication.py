@@ -0,0 +1,72 @@
+import inspect
+import re
+
+from asgiref.sync                import sync_to_async
+from django.conf                 import settings
+from django.contrib.auth         import load_backend
+from django.contrib.auth.signals import user_login_failed
+from django.core.exceptions      import PermissionDenied
+from django.http                 import HttpRequest
+from typing                      import Optional
+
+from accounts.models.user import User
+
+# the same keys django.contrib.auth hides from the user_login_failed signal
+SENSITIVE_CREDENTIALS = re.compile('api|token|key|secret|password|signature', re.I)
+CLEANSED_SUBSTITUTE   = '********************'
+
+
+async def aauthenticate(
+    request: Optional[HttpRequest]=None,
+    **credentials: dict
+) -> Optional[User]:
+    """
+    Parameters:
+        request       -> the request object sent when 'submit' is hit on the
+                         frontend
+        **credentials -> the dictionary of inputs gathered from the form
+
+    Returns:
+        A user object tagged with the path of the backend that authenticated
+        it, otherwise None
+
+    The aauthenticate function is the coroutine counterpart of
+    django.contrib.auth.authenticate. Backends providing an aauthenticate
+    coroutine are awaited directly and the remaining backends are run on the
+    database thread.
+    """
+    for backend_path in settings.AUTHENTICATION_BACKENDS:
+        backend = load_backend(backend_path)
+
+        try:
+            inspect.signature(backend.authenticate).bind(request, **credentials)
+        except TypeError:
+            # the backend does not accept these credentials
+            continue
+
+        if hasattr(backend, 'aauthenticate'):
+            authenticate = backend.aauthenticate
+        else:
+            authenticate = sync_to_async(backend.authenticate)
+
+        try:
+            user: Optional[User] = await authenticate(request, **credentials)
+        except PermissionDenied:
+            break
+
+        if user is None:
+            continue
+
+        user.backend = backend_path
+        return user
+
+    await sync_to_async(user_login_failed.send)(
+        sender=__name__,
+        credentials={
+            key: CLEANSED_SUBSTITUTE if SENSITIVE_CREDENTIALS.search(key) else value
+            for key, value in credentials.items()
+        },
+        request=request
+    )
+
+    return None
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from django.conf         import settings
+from django.core.cache   import cache
+from django.utils.crypto import salted_hmac
+from typing              import Iterable, Optional, Tuple
+
+from accounts.querysets.user_queryset import split_login
+
+
+class AuthenticationCache:
+    """
+    The AuthenticationCache class keeps a short-lived record of what each
+    login identifier resolved to. Unknown identifiers are stored as None so
+    repeated attempts against accounts that do not exist, are banned or are
+    inactive can be rejected without reaching the database. Known users are
+    stored with their ban and active flags along with a version of their
+    password hash, which is used to spot stale entries.
+
+    Unknown identifiers are only stored when the AUTHENTICATION_CACHE_MISSES
+    setting is on, which needs a cache shared by every worker. With a cache
+    held in the memory of one process, a signup invalidates the entry of
+    that process only and the others would keep rejecting the new user.
+    """
+
+    MISSING = object()
+
+    key_prefix: str = 'accounts:login'
+    timeout   : int = 60
+
+    @classmethod
+    def _key(
+        cls,
+        field: str,
+        login: str
+    ) -> str:
+        return f'{cls.key_prefix}:{field}:{login}'
+
+    @classmethod
+    def entry(
+        cls,
+        identifier: str,
+        user: Optional[settings.AUTH_USER_MODEL]
+    ) -> Optional[dict]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+            user       -> the user the identifier resolved to, if any
+
+        Returns:
+            The dictionary cached for the user, or None if there is no user
+        """
+        if user is None:
+            return None
+
+        field, _ = split_login(identifier)
+
+        return {
+            'pk'              : user.pk,
+            'login'           : getattr(user, field).lower(),
+            'is_banned'       : user.is_banned,
+            'is_active'       : user.is_active,
+            'password_version': salted_hmac(cls.key_prefix, user.password).hexdigest(),
+        }
+
+    @classmethod
+    def get(
+        cls,
+        identifier: str
+    ) -> Optional[dict]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+
+        Returns:
+            The cached entry of the identifier, None if the identifier is known
+            not to match any user or AuthenticationCache.MISSING if the
+            identifier is not cached
+        """
+        return cache.get(cls._key(*split_login(identifier)), cls.MISSING)
+
+    @classmethod
+    def set(
+        cls,
+        identifier: str,
+        user: Optional[settings.AUTH_USER_MODEL]
+    ) -> Optional[dict]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+            user       -> the user the identifier resolved to, if any
+
+        Returns:
+            The entry stored for the identifier
+        """
+        entry = cls.entry(identifier, user)
+
+        if entry is not None or getattr(settings, 'AUTHENTICATION_CACHE_MISSES', False):
+            cache.set(cls._key(*split_login(identifier)), entry, cls.timeout)
+
+        return entry
+
+    @classmethod
+    def invalidate(
+        cls,
+        user: settings.AUTH_USER_MODEL
+    ) -> None:
+        """
+        Parameters:
+            user -> the user whose cached entries are removed
+
+        Returns:
+            None
+
+        The invalidate class method removes the entries of both identifiers
+        of the user, including any entry recording that they did not exist.
+        """
+        cls.invalidate_many([user])
+
+    @classmethod
+    def invalidate_many(
+        cls,
+        users: Iterable[settings.AUTH_USER_MODEL]
+    ) -> None:
+        """
+        Parameters:
+            users -> the users whose cached entries are removed
+
+        Returns:
+            None
+        """
+        cls.invalidate_logins((user.email, user.username) for user in users)
+
+    @classmethod
+    def invalidate_logins(
+        cls,
+        logins: Iterable[Tuple[Optional[str], Optional[str]]]
+    ) -> None:
+        """
+        Parameters:
+            logins -> (email, username) tuples whose cached entries are
+                      removed, either of which may be None
+
+        Returns:
+            None
+        """
+        cache.delete_many([
+            cls._key(field, login.lower())
+            for email, username in logins
+            for field, login in (('email', email), ('username', username))
+            if login
+        ])
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from django.apps import apps
+from django.db   import transaction
+from itertools   import islice
+from typing      import Dict, Iterable, Iterator, List, Set
+from uuid        import UUID
+
+from accounts.indexes.friend_index import FriendIndex
+
+
+class RecommendationEngine:
+    """
+    The RecommendationEngine class computes the "people you may know"
+    candidates of profiles and stores the top ranked ones as Recommendation
+    rows. Candidates are friends of friends ranked by their number of mutual
+    friends, excluding existing friends, blocked profiles and anyone with a
+    pending friend request in either direction. Profiles are processed in
+    chunks using the FriendIndex, so no self-join on the friends through
+    table is ever issued.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int=20,
+        chunk_size: int=500
+    ) -> None:
+        self.limit      = limit
+        self.chunk_size = chunk_size
+
+    def refresh(
+        self,
+        profile_ids: Iterable[UUID]
+    ) -> int:
+        """
+        Parameters:
+            profile_ids -> the primary keys of the profiles being recomputed
+
+        Returns:
+            An integer representing the number of recommendations stored
+
+        The refresh method recomputes and replaces the recommendations of the
+        given profiles. It is used for a whole chunk of the graph by the batch
+        mode and for the neighborhood of changed friendships incrementally.
+        """
+        Recommendation = apps.get_model('accounts', 'Recommendation')
+
+        profile_ids = set(profile_ids)
+        adjacency   = FriendIndex.get_many(profile_ids)
+        second_hop  = FriendIndex.get_many(set().union(*adjacency.values()))
+        excluded    = self._excluded(profile_ids)
+
+        recommendations = []
+        for profile_id in profile_ids:
+            friends = adjacency[profile_id]
+
+            candidates: Counter = Counter()
+            for friend_id in friends:
+                candidates.update(second_hop[friend_id])
+
+            for profile in friends | excluded[profile_id] | {profile_id}:
+                candidates.pop(profile, None)
+
+            recommendations.extend(
+                Recommendation(
+                    profile_id=profile_id,
+                    candidate_id=candidate_id,
+                    mutual_friends=mutual_friends
+                )
+                for candidate_id, mutual_friends in candidates.most_common(self.limit)
+            )
+
+        with transaction.atomic():
+            Recommendation.objects.filter(profile__in=profile_ids).delete()
+            Recommendation.objects.bulk_create(recommendations, batch_size=1000)
+
+        return len(recommendations)
+
+    def refresh_all(
+        self,
+        profile_ids: Iterable[UUID]=None
+    ) -> Iterator[int]:
+        """
+        Parameters:
+            profile_ids -> the primary keys of the profiles being recomputed,
+                           every profile is recomputed when omitted
+
+        Returns:
+            An iterator yielding the number of profiles processed in each chunk
+
+        The refresh_all method streams the profiles through the engine one
+        chunk at a time so memory stays bounded by the chunk size.
+        """
+        if profile_ids is None:
+            profile_ids = apps.get_model('accounts', 'Profile').objects.order_by(
+                'pk'
+            ).values_list(
+                'pk',
+                flat=True
+            ).iterator(chunk_size=self.chunk_size)
+
+        profile_ids = iter(profile_ids)
+
+        while True:
+            chunk: List[UUID] = list(islice(profile_ids, self.chunk_size))
+            if not chunk:
+                break
+
+            self.refresh(chunk)
+            yield len(chunk)
+
+    def neighborhood(
+        self,
+        profile_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        """
+        Parameters:
+            profile_ids -> the primary keys of profiles whose friends changed
+
+        Returns:
+            A set of the given profiles and all of their friends, which are the
+            profiles whose friends of friends changed along with them
+        """
+        adjacency = FriendIndex.get_many(profile_ids)
+
+        return set(adjacency).union(*adjacency.values())
+
+    def _excluded(
+        self,
+        profile_ids: Set[UUID]
+    ) -> Dict[UUID, Set[UUID]]:
+        """
+        Parameters:
+            profile_ids -> the primary keys of the profiles being recomputed
+
+        Returns:
+            A dictionary mapping each profile primary key to the profiles that
+            must never be recommended to it
+        """
+        Profile      = apps.get_model('accounts', 'Profile')
+        Relationship = apps.get_model('accounts', 'Relationship')
+
+        excluded: Dict[UUID, Set[UUID]] = defaultdict(set)
+
+        # blocks are symmetrical, so both directions are stored as rows
+        for from_profile, to_profile in Profile.blocks.through.objects.filter(
+            from_profile__in=profile_ids
+        ).values_list('from_profile', 'to_profile'):
+            excluded[from_profile].add(to_profile)
+
+        for sender, receiver in Relationship.objects.filter(
+            sender__profile__in=profile_ids
+        ).values_list('sender__profile', 'receiver__profile'):
+            excluded[sender].add(receiver)
+
+        for sender, receiver in Relationship.objects.filter(
+            receiver__profile__in=profile_ids
+        ).values_list('sender__profile', 'receiver__profile'):
+            excluded[receiver].add(sender)
+
+        return excluded
@@ -1,11 +1,13 @@
 import logging
 
+from asgiref.sync              import sync_to_async
 from django                    import forms
 from django.core.exceptions    import ValidationError
 from django.utils.translation  import ugettext_lazy as _
 from typing                    import Optional
 
 from accounts.models.user import User
+from core.metrics.timed   import timed
 
 
 logger = logging.getLogger('accounts')
@@ -46,6 +48,7 @@ class UserRegistrationForm(forms.ModelForm):
             'email',
         )
 
+    @timed
     def clean_username(self) -> str:
         """
         Parameters:
@@ -55,17 +58,24 @@ class UserRegistrationForm(forms.ModelForm):
             A string representing the validated username if the length of the username
             is not zero
         """
-        logger.info('Started UserRegistrationForm.clean_username')
-
         username: str = self.cleaned_data['username']
 
         if len(username) == 0:
             logger.warning('The username entered is zero characters')
             raise ValidationError(_('Your username must be at least one character in length.'))
+
+        if '@' in username:
+            # identifiers containing @ are treated as email addresses when logging in
+            logger.warning('The username entered contains the @ character')
+            raise ValidationError(_('Your username must not contain the @ character.'))
+
+        if User.objects.find_by_login(identifier=username).exists():
+            logger.warning('The username entered differs from an existing username only by case')
+            raise ValidationError(_('A user with that username already exists.'))
         
-        logger.info('Completed UserRegistrationForm.clean_username')
         return username
 
+    @timed
     def clean_first_name(self) -> str:
         """
         Parameters:
@@ -75,8 +85,6 @@ class UserRegistrationForm(forms.ModelForm):
             A string representing the validated first name if the length of the first name
             is not zero
         """
-        logger.info('Started UserRegistrationForm.clean_first_name')
-
         first_name: str = self.cleaned_data['first_name']
 
         if len(first_name) == 0:
@@ -85,9 +93,9 @@ class UserRegistrationForm(forms.ModelForm):
         else:
             first_name = first_name.title()
 
-        logger.info('Completed UserRegistrationForm.clean_first_name')
         return first_name
 
+    @timed
     def clean_last_name(self) -> str:
         """
         Parameters:
@@ -97,8 +105,6 @@ class UserRegistrationForm(forms.ModelForm):
             A string representing the validated last name if the length of the last name
             is not zero
         """
-        logger.info('Started UserRegistrationForm.clean_last_name')
-
         last_name: str = self.cleaned_data['last_name']
 
         if len(last_name) == 0:
@@ -107,9 +113,9 @@ class UserRegistrationForm(forms.ModelForm):
         else:
             last_name = last_name.title()
 
-        logger.info('Completed UserRegistrationForm.clean_last_name')
         return last_name
 
+    @timed
     def clean_email(self) -> str:
         """
         Parameters:
@@ -122,8 +128,6 @@ class UserRegistrationForm(forms.ModelForm):
         TODO:
             validate email based on email regex
         """
-        logger.info('Started UserRegistrationForm.clean_email')
-
         email: str = self.cleaned_data['email']
 
         if len(email) == 0:
@@ -131,10 +135,14 @@ class UserRegistrationForm(forms.ModelForm):
             raise ValidationError(_('Your email address must not be zero characters long.'))
         else:
             email = email.lower()
+
+        if User.objects.find_by_login(identifier=email).exists():
+            logger.warning('The email entered differs from an existing email address only by case')
+            raise ValidationError(_('A user with that email address already exists.'))
         
-        logger.info('Completed UserRegistrationForm.clean_email')
         return email
 
+    @timed
     def clean_password_confirmation(self) -> str:
         """
         Parameters:
@@ -147,8 +155,6 @@ class UserRegistrationForm(forms.ModelForm):
         TODO:
             defined a set regex pattern for passwords
         """
-        logger.info('Started UserRegistrationForm.clean_password_confirmation')
-
         password             : str = self.cleaned_data['password']
         password_confirmation: str = self.cleaned_data['password_confirmation']
 
@@ -158,9 +164,9 @@ class UserRegistrationForm(forms.ModelForm):
             if password != password_confirmation:
                 raise ValidationError(_('Your password inputs do not match. Please re-enter your password information.'))
 
-        logger.info('Completed UserRegistrationForm.clean_password_confirmation')
         return password_confirmation
 
+    @timed
     def save(
         self,
         commit: bool=True
@@ -173,12 +179,29 @@ class UserRegistrationForm(forms.ModelForm):
         Returns:
             A User object created with the submitted form data
         """
-        logger.info('Started UserRegistrationForm.save')
-
         self.user = super().save(commit=False)
         self.user.set_password(self.cleaned_data['password'])
         if commit:
             self.user.save()
 
-        logger.info('Completed UserRegistrationForm.save')
+        return self.user
+
+    @timed
+    async def asave(self) -> User:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A User object created with the submitted form data
+
+        The asave method is the coroutine counterpart of save. The password
+        is hashed by the password executor while the event loop keeps
+        serving other requests and the user is then saved on the database
+        thread.
+        """
+        self.user = super().save(commit=False)
+        await self.user.aset_password(self.cleaned_data['password'])
+        await sync_to_async(self.user.save)()
+
         return self.user
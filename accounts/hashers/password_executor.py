@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import django
+
+from concurrent.futures          import Executor, Future, ProcessPoolExecutor
+from django.apps                 import apps
+from django.conf                 import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.signals         import setting_changed
+from django.dispatch             import receiver
+from django.utils.module_loading import import_string
+from functools                   import lru_cache
+from typing                      import Iterable, List, Optional
+
+
+def _initialize_worker() -> None:
+    """
+    The _initialize_worker function prepares a freshly spawned worker process
+    so the configured password hashers can be loaded inside of it.
+    """
+    if not apps.ready:
+        django.setup()
+
+
+class PasswordExecutor:
+    """
+    The PasswordExecutor class is the base class of the pluggable password
+    hashing executors. It hashes passwords inline and is meant to be
+    subclassed by executors that move the hashing work elsewhere.
+    """
+
+    def __init__(self, **options: dict) -> None:
+        self.options = options
+
+    def submit(
+        self,
+        password: Optional[str]
+    ) -> Future:
+        """
+        Parameters:
+            password -> the raw password being hashed
+
+        Returns:
+            A Future resolving to the encoded password
+        """
+        future: Future = Future()
+        future.set_result(make_password(password))
+
+        return future
+
+    def hash(
+        self,
+        password: Optional[str]
+    ) -> str:
+        """
+        Parameters:
+            password -> the raw password being hashed
+
+        Returns:
+            A string representing the encoded password
+        """
+        return self.submit(password).result()
+
+    def hash_many(
+        self,
+        passwords: Iterable[Optional[str]]
+    ) -> List[str]:
+        """
+        Parameters:
+            passwords -> the raw passwords being hashed
+
+        Returns:
+            A list of the encoded passwords in the same order as the raw
+            passwords were given
+        """
+        return [make_password(password) for password in passwords]
+
+    async def ahash(
+        self,
+        password: Optional[str]
+    ) -> str:
+        """
+        Parameters:
+            password -> the raw password being hashed
+
+        Returns:
+            A string representing the encoded password
+
+        The ahash method hashes the password in the default thread pool of the
+        running event loop so async views never hash on the loop itself.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            make_password,
+            password
+        )
+
+    async def acheck(
+        self,
+        password: Optional[str],
+        encoded: str
+    ) -> bool:
+        """
+        Parameters:
+            password -> the raw password entered by the user
+            encoded  -> the encoded password stored for the user
+
+        Returns:
+            True if the raw password matches the encoded password, otherwise False
+
+        The acheck method verifies the password in the default thread pool of
+        the running event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            check_password,
+            password,
+            encoded
+        )
+
+    def shutdown(self) -> None:
+        ...
+
+
+class ProcessPoolPasswordExecutor(PasswordExecutor):
+    """
+    The ProcessPoolPasswordExecutor class hashes passwords in a pool of
+    worker processes so the hashing cost is spread across every core
+    instead of holding the calling worker for its whole duration.
+    """
+
+    _executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.options.get('max_workers'),
+                initializer=_initialize_worker
+            )
+
+        return self._executor
+
+    def submit(
+        self,
+        password: Optional[str]
+    ) -> Future:
+        return self.executor.submit(make_password, password)
+
+    def hash_many(
+        self,
+        passwords: Iterable[Optional[str]]
+    ) -> List[str]:
+        return list(self.executor.map(
+            make_password,
+            passwords,
+            chunksize=self.options.get('chunksize', 16)
+        ))
+
+    async def ahash(
+        self,
+        password: Optional[str]
+    ) -> str:
+        return await asyncio.wrap_future(self.submit(password))
+
+    async def acheck(
+        self,
+        password: Optional[str],
+        encoded: str
+    ) -> bool:
+        return await asyncio.wrap_future(
+            self.executor.submit(check_password, password, encoded)
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+@lru_cache(maxsize=None)
+def get_password_executor() -> PasswordExecutor:
+    """
+    Parameters:
+        None
+
+    Returns:
+        The PasswordExecutor instance configured by the PASSWORD_EXECUTOR
+        setting, falling back to inline hashing when it is not set
+    """
+    config: dict = getattr(settings, 'PASSWORD_EXECUTOR', {})
+
+    backend = import_string(
+        config.get('BACKEND', 'accounts.hashers.password_executor.PasswordExecutor')
+    )
+
+    return backend(**config.get('OPTIONS', {}))
+
+
+@receiver(setting_changed)
+def reset_password_executor(
+    *,
+    setting: str,
+    **kwargs: dict
+) -> None:
+    """
+    The reset_password_executor receiver rebuilds the executor whenever the
+    PASSWORD_EXECUTOR or PASSWORD_HASHERS settings are overridden.
+    """
+    if setting in ('PASSWORD_EXECUTOR', 'PASSWORD_HASHERS'):
+        if get_password_executor.cache_info().currsize:
+            get_password_executor().shutdown()
+        get_password_executor.cache_clear()
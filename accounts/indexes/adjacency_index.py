@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from django.core.cache import cache
+from django.db         import transaction
+from typing            import Dict, FrozenSet, Iterable, Optional, Set
+from uuid              import UUID
+
+
+class AdjacencyIndex:
+    """
+    The AdjacencyIndex class is the base class of the graph indexes kept in
+    the configured cache. Every node maps to the frozen set of its neighbors'
+    primary keys, and subclasses only define how the missing entries of a
+    batch are loaded from the database.
+
+    The entries are only shared by the workers when the configured cache is.
+    With the LocMemCache the settings default to, every process keeps its own
+    copy and an invalidation only reaches the process that made the change,
+    so the others may serve a stale entry until it times out. Deployments
+    running several workers should point CACHE_BACKEND at a shared cache.
+    """
+
+    key_prefix: str = 'accounts:adjacency'
+    timeout   : int = 60 * 60
+
+    @classmethod
+    def _key(
+        cls,
+        node_id: UUID
+    ) -> str:
+        return f'{cls.key_prefix}:{node_id}'
+
+    @classmethod
+    def _load(
+        cls,
+        node_ids: Set[UUID]
+    ) -> Dict[UUID, Set[UUID]]:
+        """
+        Parameters:
+            node_ids -> the primary keys of the nodes missing from the cache
+
+        Returns:
+            A dictionary mapping each node primary key to the set of its
+            neighbors' primary keys, loaded with a single query
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def get_many(
+        cls,
+        node_ids: Iterable[UUID]
+    ) -> Dict[UUID, FrozenSet[UUID]]:
+        """
+        Parameters:
+            node_ids -> the primary keys of the nodes being looked up
+
+        Returns:
+            A dictionary mapping each requested node primary key to the frozen
+            set of its neighbors' primary keys
+
+        The get_many class method reads every entry with a single cache lookup
+        and loads all of the missing entries at once before storing them back
+        in the cache.
+        """
+        keys: Dict[str, UUID] = {
+            cls._key(node_id): node_id
+            for node_id in node_ids
+        }
+
+        adjacency: Dict[UUID, FrozenSet[UUID]] = {
+            keys[key]: neighbor_ids
+            for key, neighbor_ids in cache.get_many(keys).items()
+        }
+
+        missing: Set[UUID] = set(keys.values()) - adjacency.keys()
+
+        if missing:
+            loaded: Dict[UUID, FrozenSet[UUID]] = {
+                node_id: frozenset(neighbor_ids)
+                for node_id, neighbor_ids in cls._load(missing).items()
+            }
+
+            cache.set_many(
+                {cls._key(node_id): neighbor_ids for node_id, neighbor_ids in loaded.items()},
+                cls.timeout
+            )
+            adjacency.update(loaded)
+
+        return adjacency
+
+    @classmethod
+    def get(
+        cls,
+        node_id: UUID
+    ) -> FrozenSet[UUID]:
+        """
+        Parameters:
+            node_id -> the primary key of the node being looked up
+
+        Returns:
+            The frozen set of the node's neighbors' primary keys
+        """
+        return cls.get_many([node_id])[node_id]
+
+    @classmethod
+    def invalidate(
+        cls,
+        node_ids: Iterable[UUID],
+        *,
+        using: Optional[str]=None
+    ) -> None:
+        """
+        Parameters:
+            node_ids -> the primary keys of the nodes whose neighbors changed
+            using    -> the database whose transaction made the change
+
+        Returns:
+            None
+
+        The invalidate class method removes the entries of the given nodes so
+        they are reloaded on their next lookup. They are removed right away
+        and again once the transaction commits, since a concurrent lookup may
+        cache the adjacency it read before the change was committed.
+        """
+        keys = [cls._key(node_id) for node_id in node_ids]
+
+        cache.delete_many(keys)
+
+        transaction.on_commit(lambda: cache.delete_many(keys), using=using)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from django.apps import apps
+from django.db   import models
+from typing      import Dict, Iterable, List, Set
+from uuid        import UUID
+
+from accounts.indexes.adjacency_index import AdjacencyIndex
+
+
+class BlockIndex(AdjacencyIndex):
+    """
+    The BlockIndex class keeps the Profile.blocks graph in the configured
+    cache. It is keyed by user primary keys rather than profile primary keys
+    so friend requests, which reference users, and profiles, which carry
+    their user_id, can both be checked without loading any related rows.
+    Blocks are symmetrical, so every entry holds the users blocked in either
+    direction and each check is a set membership test.
+    """
+
+    key_prefix: str = 'accounts:blocks'
+
+    @classmethod
+    def _load(
+        cls,
+        node_ids: Set[UUID]
+    ) -> Dict[UUID, Set[UUID]]:
+        Blocks = apps.get_model('accounts', 'Profile').blocks.through
+
+        loaded: Dict[UUID, Set[UUID]] = {user_id: set() for user_id in node_ids}
+        for from_user, to_user in Blocks.objects.filter(
+            from_profile__user__in=node_ids
+        ).values_list('from_profile__user', 'to_profile__user'):
+            loaded[from_user].add(to_user)
+
+        return loaded
+
+    @staticmethod
+    def user_id(instance: models.Model) -> UUID:
+        """
+        Parameters:
+            instance -> a user or a profile
+
+        Returns:
+            The primary key of the user, or of the user owning the profile
+        """
+        return getattr(instance, 'user_id', instance.pk)
+
+    @classmethod
+    def is_blocked(
+        cls,
+        first: models.Model,
+        second: models.Model
+    ) -> bool:
+        """
+        Parameters:
+            first  -> a user or a profile
+            second -> another user or profile
+
+        Returns:
+            True if either side has blocked the other, otherwise False
+        """
+        return cls.user_id(second) in cls.get(cls.user_id(first))
+
+    @classmethod
+    def filter_blocked(
+        cls,
+        viewer: models.Model,
+        instances: Iterable[models.Model]
+    ) -> List[models.Model]:
+        """
+        Parameters:
+            viewer    -> the user or profile the instances are shown to
+            instances -> the users or profiles being shown
+
+        Returns:
+            A list of the instances that neither block nor are blocked by the
+            viewer, in their original order
+
+        The filter_blocked class method checks a whole listing against a
+        single cached block set of the viewer.
+        """
+        blocked = cls.get(cls.user_id(viewer))
+
+        return [
+            instance for instance in instances
+            if cls.user_id(instance) not in blocked
+        ]
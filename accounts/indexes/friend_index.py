@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from django.apps import apps
+from typing      import Dict, Set
+from uuid        import UUID
+
+from accounts.indexes.adjacency_index import AdjacencyIndex
+
+
+class FriendIndex(AdjacencyIndex):
+    """
+    The FriendIndex class keeps an adjacency index of the Profile.friends
+    graph in the configured cache. Every profile maps to the frozen set of
+    its friends' primary keys so mutual friend lookups are set operations
+    instead of self-joins on the friends through table.
+    """
+
+    key_prefix: str = 'accounts:friends'
+
+    @classmethod
+    def _load(
+        cls,
+        node_ids: Set[UUID]
+    ) -> Dict[UUID, Set[UUID]]:
+        Friends = apps.get_model('accounts', 'Profile').friends.through
+
+        loaded: Dict[UUID, Set[UUID]] = {profile_id: set() for profile_id in node_ids}
+        for from_profile, to_profile in Friends.objects.filter(
+            from_profile__in=node_ids
+        ).values_list('from_profile', 'to_profile'):
+            loaded[from_profile].add(to_profile)
+
+        return loaded
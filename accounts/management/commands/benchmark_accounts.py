@@ -0,0 +1,311 @@
+import json
+import random
+import time
+import uuid
+
+from asgiref.sync                import async_to_sync
+from django.contrib.auth.models  import AnonymousUser
+from django.core.management      import call_command
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db                   import connections, transaction
+from django.test                 import RequestFactory
+from io                          import StringIO
+from typing                      import Callable, Dict, Iterator, List, Tuple
+
+from accounts.backends.accounts_backend            import AccountsBackend
+from accounts.models.relationship                  import Relationship
+from accounts.models.user                          import User
+from accounts.tests.factories.profile_factory      import ProfileFactory
+from accounts.tests.factories.relationship_factory import RelationshipFactory
+from accounts.tests.factories.user_factory         import UserFactory
+from accounts.views.profile_detail_view            import ProfileDetailView
+
+
+def user_count(value: str) -> int:
+    """
+    Parameters:
+        value -> a number of users, optionally suffixed with k or m
+
+    Returns:
+        An integer representing the number of users, so 10k, 100k and 1m can
+        be given on the command line
+    """
+    multipliers = {'k': 1000, 'm': 1000000}
+    suffix      = value[-1:].lower()
+
+    if suffix in multipliers:
+        return int(value[:-1]) * multipliers[suffix]
+
+    return int(value)
+
+
+class Command(BaseCommand):
+    """
+    The benchmark_accounts command measures the hot paths of the accounts
+    app on a synthetic graph. It seeds users, profiles, friendships and
+    pending friend requests, then measures the queries and wall time of every
+    call of each scenario and writes the results as JSON. A scenario whose
+    queries per call or 95th percentile time exceeds its threshold is a
+    regression, and the command fails once the report is written. Every run
+    is rolled back once it completes.
+    """
+
+    help = 'Benchmarks the queries and wall time of the accounts hot paths.'
+
+    # queries per call are exact for a given schema, the times are ceilings
+    # meant to catch order of magnitude regressions on the CI machines
+    THRESHOLDS: Dict[str, Dict[str, float]] = {
+        'create_user'               : {'queries_per_call': 3, 'p95_ms': 250.0},
+        'relationship_accept'       : {'queries_per_call': 10, 'p95_ms': 50.0},
+        'relationship_update_status': {'queries_per_call': 1, 'p95_ms': 25.0},
+        'authenticate'              : {'queries_per_call': 1, 'p95_ms': 250.0},
+        'profile_view'              : {'queries_per_call': 2, 'p95_ms': 50.0},
+    }
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=user_count, default=10000, help='10k, 100k or 1m users, or any number.')
+        parser.add_argument('--friends', type=int, default=10, help='Friendships seeded per user.')
+        parser.add_argument('--calls', type=int, default=200, help='Calls measured per scenario.')
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--thresholds', help='A JSON file overriding the thresholds of some scenarios.')
+        parser.add_argument('--output', help='Writes the JSON report to this file instead of stdout.')
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        database: str = options['database']
+
+        thresholds: Dict[str, Dict[str, float]] = {
+            name: dict(threshold) for name, threshold in self.THRESHOLDS.items()
+        }
+        if options['thresholds']:
+            with open(options['thresholds']) as file:
+                for name, threshold in json.load(file).items():
+                    thresholds.setdefault(name, {}).update(threshold)
+
+        with transaction.atomic(using=database):
+            seeded = self._seed(**options)
+
+            started = time.perf_counter()
+            results = {
+                name: self._measure(database, calls)
+                for name, calls in self._scenarios(seeded, **options)
+            }
+            elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True, using=database)
+
+        regressions: List[str] = [
+            f'{name} {metric} {results[name][metric]} > {limit}'
+            for name, threshold in thresholds.items() if name in results
+            for metric, limit in threshold.items()
+            if results[name][metric] > limit
+        ]
+
+        report = json.dumps(
+            {
+                'vendor'     : connections[database].vendor,
+                'users'      : options['users'],
+                'friends'    : options['friends'],
+                'calls'      : options['calls'],
+                'seconds'    : round(elapsed, 3),
+                'results'    : results,
+                'thresholds' : thresholds,
+                'regressions': regressions,
+            },
+            indent=4
+        )
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                file.write(report + '\n')
+        else:
+            self.stdout.write(report)
+
+        if regressions:
+            raise CommandError(f'{len(regressions)} regressions: {"; ".join(regressions)}')
+
+    def _seed(
+        self,
+        *,
+        database: str,
+        users: int,
+        friends: int,
+        calls: int,
+        batch_size: int,
+        **options: dict
+    ) -> List[Tuple[uuid.UUID, str]]:
+        """
+        Parameters:
+            database   -> the database the graph is seeded in
+            users      -> the number of users seeded
+            friends    -> the number of friendships seeded per user
+            calls      -> the number of calls measured per scenario
+            batch_size -> the number of rows inserted per INSERT statement
+
+        Returns:
+            A list holding the pk and username of every seeded user
+
+        The _seed method inserts the graph with the bulk mode of the
+        factories, so seeding skips the per-object save paths and the
+        password hashing of the users, who cannot log in, then recounts the
+        counters of the profiles.
+        """
+        seeded     : List[Tuple[uuid.UUID, str]] = []
+        profile_ids: List[uuid.UUID]             = []
+
+        # the bulk mode of UserFactory also inserts the profile of every user
+        for batch in UserFactory.bulk_create_batches(
+            (
+                {
+                    'username': f'benchmark_user_{index}',
+                    'email'   : f'benchmark_user_{index}@benchmark.com',
+                    'password': None
+                }
+                for index in range(users)
+            ),
+            batch_size=batch_size,
+            using=database
+        ):
+            seeded.extend((user.pk, user.username) for user in batch)
+            profile_ids.extend(user.profile.pk for user in batch)
+
+        ProfileFactory.bulk_create_friendships(
+            (
+                (profile_id, friend_id)
+                for profile_id in profile_ids
+                for friend_id in random.sample(profile_ids, min(friends, len(profile_ids)))
+                if friend_id != profile_id
+            ),
+            batch_size=batch_size,
+            using=database
+        )
+
+        # the scenarios accepting and updating requests each get their own
+        pairs = set()
+        while len(pairs) < min(calls * 2, users * (users - 1)):
+            pairs.add(tuple(random.sample(seeded, 2)))
+
+        RelationshipFactory.bulk_create_rows(
+            (
+                {'sender_id': sender[0], 'receiver_id': receiver[0]}
+                for sender, receiver in pairs
+            ),
+            batch_size=batch_size,
+            using=database
+        )
+
+        # the bulk mode skips the counters of the profiles, which are recounted
+        call_command(
+            'reconcile_profile_counts',
+            chunk_size=batch_size,
+            database=database,
+            stdout=StringIO()
+        )
+
+        return seeded
+
+    def _scenarios(
+        self,
+        seeded: List[Tuple[uuid.UUID, str]],
+        *,
+        database: str,
+        calls: int,
+        **options: dict
+    ) -> Iterator[Tuple[str, List[Callable]]]:
+        """
+        Parameters:
+            seeded   -> the pk and username of every seeded user
+            database -> the database the scenarios run against
+            calls    -> the number of calls measured per scenario
+
+        Returns:
+            A generator of (name, calls) tuples where calls is the list of
+            callables making up the measured calls of the scenario
+        """
+        requests: List[Relationship] = list(
+            Relationship.objects.using(database).order_by('pk')[:calls * 2]
+        )
+        created: List[str] = [f'benchmark_login_{index}' for index in range(calls)]
+
+        yield 'create_user', [
+            lambda username=username: User.objects.db_manager(database).create_user(
+                email=f'{username}@benchmark.com',
+                username=username,
+                password=username
+            )
+            for username in created
+        ]
+
+        yield 'relationship_accept', [
+            request.accept for request in requests[:calls]
+        ]
+
+        yield 'relationship_update_status', [
+            lambda request=request: request.update_status(status=Relationship.RequestOptions.VIEWED)
+            for request in requests[calls:]
+        ]
+
+        # half of the logins use the username and the other half the email
+        backend = AccountsBackend()
+        yield 'authenticate', [
+            lambda username=username, index=index: backend.authenticate(
+                None,
+                username=username if index % 2 else f'{username}@benchmark.com',
+                password=username
+            )
+            for index, username in enumerate(created)
+        ]
+
+        # every call renders a different profile so the page cache stays cold
+        view = async_to_sync(ProfileDetailView)
+        factory = RequestFactory()
+
+        def render(username: str) -> None:
+            request = factory.get(f'/accounts/{username}/')
+            request.user = AnonymousUser()
+
+            view(request, username=username)
+
+        yield 'profile_view', [
+            lambda username=username: render(username)
+            for _, username in random.sample(seeded, min(calls, len(seeded)))
+        ]
+
+    @staticmethod
+    def _measure(database: str, calls: List[Callable]) -> Dict[str, float]:
+        """
+        Parameters:
+            database -> the database whose queries are counted
+            calls    -> the callables making up the measured calls
+
+        Returns:
+            A dictionary holding the number of calls, the mean and maximum
+            queries per call and the mean, median and 95th percentile wall
+            time of a call in milliseconds
+        """
+        queries: List[int]   = []
+        times  : List[float] = []
+
+        def count(execute: Callable, sql: str, *args: tuple) -> object:
+            queries[-1] += 1
+            return execute(sql, *args)
+
+        # unlike CaptureQueriesContext, execute_wrapper has no cap on the number of queries
+        with connections[database].execute_wrapper(count):
+            for call in calls:
+                queries.append(0)
+
+                started = time.perf_counter()
+                call()
+                times.append((time.perf_counter() - started) * 1000)
+
+        times.sort()
+
+        return {
+            'calls'           : len(calls),
+            'queries_per_call': max(queries, default=0),
+            'mean_queries'    : round(sum(queries) / max(len(queries), 1), 2),
+            'mean_ms'         : round(sum(times) / max(len(times), 1), 3),
+            'p50_ms'          : round(times[len(times) // 2], 3) if times else 0.0,
+            'p95_ms'          : round(times[int(len(times) * 0.95)], 3) if times else 0.0,
+        }
@@ -0,0 +1,195 @@
+import random
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db                   import connections, transaction
+from django.db.utils             import DatabaseError
+from typing                      import Callable, List, Optional, Tuple
+
+from accounts.models.profile      import Profile
+from accounts.models.relationship import Relationship
+from accounts.models.user         import User
+from core.utils.time_ordered_uuid import time_ordered_uuid
+
+
+class Command(BaseCommand):
+    """
+    The benchmark_key_locality command measures how random uuid4 primary keys
+    compare with time-ordered ones. For each key kind it seeds users, profiles
+    and friendships, times the inserts and the friend list joins and reports
+    the size of the friends table indexes. It then inserts friend requests in
+    stages, reports the insert rate of every stage and the leaf pages and leaf
+    density of the primary key index, where extra pages at a lower density
+    are the footprint of page splits. PostgreSQL reads them from pgstatindex
+    when the pgstattuple extension is installed, and SQLite, the stand-in
+    used in CI, from the dbstat table. Every run is rolled back once it
+    completes.
+    """
+
+    help = 'Benchmarks graph inserts, joins and primary key index page splits for each key default.'
+
+    KEYS = (
+        ('uuid4', uuid.uuid4),
+        ('time-ordered', time_ordered_uuid),
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--friends', type=int, default=10)
+        parser.add_argument('--joins', type=int, default=2000)
+        parser.add_argument('--requests', type=int, default=20000)
+        parser.add_argument('--stages', type=int, default=4)
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        for name, key in self.KEYS:
+            with transaction.atomic(using=options['database']):
+                self._run(name, key, **options)
+
+                transaction.set_rollback(True, using=options['database'])
+
+    def _run(
+        self,
+        name: str,
+        key: Callable[[], uuid.UUID],
+        *,
+        database: str,
+        users: int,
+        friends: int,
+        joins: int,
+        requests: int,
+        stages: int,
+        batch_size: int,
+        **options: dict
+    ) -> None:
+        Friends = Profile.friends.through
+
+        started = time.perf_counter()
+
+        seeded: List[User] = User.objects.using(database).bulk_create(
+            (
+                User(
+                    uuid=key(),
+                    username=f'benchmark_user_{index}',
+                    email=f'benchmark_user_{index}@benchmark.com',
+                    password='!'
+                )
+                for index in range(users)
+            ),
+            batch_size=1000
+        )
+        profile_ids: List[uuid.UUID] = [
+            profile.pk for profile in Profile.objects.using(database).bulk_create(
+                (Profile(uuid=key(), user=user) for user in seeded),
+                batch_size=1000
+            )
+        ]
+
+        nodes_elapsed = time.perf_counter() - started
+
+        edges = {}
+        for profile_id in profile_ids:
+            for friend_id in random.sample(profile_ids, min(friends, len(profile_ids))):
+                if friend_id != profile_id:
+                    edges[(profile_id, friend_id)] = Friends(from_profile_id=profile_id, to_profile_id=friend_id)
+                    edges[(friend_id, profile_id)] = Friends(from_profile_id=friend_id, to_profile_id=profile_id)
+
+        started = time.perf_counter()
+        Friends.objects.using(database).bulk_create(edges.values(), batch_size=1000)
+        edges_elapsed = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for profile_id in random.choices(profile_ids, k=joins):
+            list(Profile.objects.using(database).filter(friends=profile_id).values_list('pk', 'user__username'))
+        joins_elapsed = time.perf_counter() - started
+
+        index_size = self._index_size(database, Friends._meta.db_table)
+
+        self.stdout.write(
+            f'{name:<13} '
+            f'{len(profile_ids) * 2 / nodes_elapsed:10.0f} user+profile rows/s  '
+            f'{len(edges) / edges_elapsed:10.0f} friend rows/s  '
+            f'{joins / joins_elapsed:8.0f} joins/s  '
+            f'friends indexes {index_size / 1024 if index_size is not None else float("nan"):9.0f} KiB'
+        )
+
+        user_ids: List[uuid.UUID] = [user.pk for user in seeded]
+        pairs   : List[Tuple[uuid.UUID, uuid.UUID]] = list({
+            tuple(random.sample(user_ids, 2)) for _ in range(requests)
+        })
+        stage_size = max(-(-len(pairs) // stages), 1)
+
+        rates: List[str] = []
+        for start in range(0, len(pairs), stage_size):
+            stage = pairs[start:start + stage_size]
+
+            started = time.perf_counter()
+            for offset in range(0, len(stage), batch_size):
+                Relationship.objects.using(database).bulk_create(
+                    Relationship(uuid=key(), sender_id=sender, receiver_id=receiver)
+                    for sender, receiver in stage[offset:offset + batch_size]
+                )
+            rates.append(f'{len(stage) / (time.perf_counter() - started):8.0f}')
+
+        self.stdout.write(f'{"":<13} request inserts/s by stage {" ".join(rates)}')
+
+        pages = self._primary_key_pages(database, Relationship._meta.db_table)
+        if pages is None:
+            self.stdout.write(f'{"":<13} primary key index statistics are unavailable')
+        else:
+            self.stdout.write(
+                f'{"":<13} primary key index {pages[0]:6d} leaf pages  '
+                f'{pages[1]:5.1f}% leaf density'
+            )
+
+    @staticmethod
+    def _index_size(database: str, table: str) -> Optional[int]:
+        connection = connections[database]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SELECT pg_indexes_size(%s::regclass)', [connection.ops.quote_name(table)])
+            elif connection.vendor == 'sqlite':
+                cursor.execute(
+                    'SELECT SUM(pgsize) FROM dbstat WHERE name IN '
+                    '(SELECT name FROM sqlite_master WHERE type = %s AND tbl_name = %s)',
+                    ['index', table]
+                )
+            else:
+                return None
+
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _primary_key_pages(database: str, table: str) -> Optional[Tuple[int, float]]:
+        connection = connections[database]
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                try:
+                    with transaction.atomic(using=database):
+                        cursor.execute(
+                            'SELECT leaf_pages, avg_leaf_density FROM pgstatindex(('
+                            'SELECT indexrelid FROM pg_index '
+                            'WHERE indrelid = %s::regclass AND indisprimary'
+                            ')::regclass)',
+                            [connection.ops.quote_name(table)]
+                        )
+                        return cursor.fetchone()
+                except DatabaseError:
+                    return None
+
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'PRAGMA index_list({connection.ops.quote_name(table)})')
+                index = next((row[1] for row in cursor.fetchall() if row[3] == 'pk'), None)
+
+                cursor.execute(
+                    'SELECT COUNT(*), 100.0 * SUM(pgsize - unused) / SUM(pgsize) '
+                    'FROM dbstat WHERE name = %s AND pagetype = %s',
+                    [index, 'leaf']
+                )
+                return cursor.fetchone()
+
+            return None
@@ -0,0 +1,83 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db                   import connections, transaction
+from django.db.models            import Q
+from django.test.utils           import CaptureQueriesContext
+from typing                      import Callable, List, Optional
+
+from accounts.models.user import User
+
+
+class Command(BaseCommand):
+    """
+    The benchmark_login_lookup command compares the former OR-based login
+    lookup with the single-index lookup used by AccountsBackend. Users are
+    seeded inside a transaction that is rolled back once the run completes.
+    """
+
+    help = 'Benchmarks the user lookup performed when logging in.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--users', type=int, default=10000)
+        parser.add_argument('--lookups', type=int, default=2000)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        database: str = options['database']
+
+        with transaction.atomic(using=database):
+            User.objects.db_manager(database).bulk_create_users(
+                {
+                    'username': f'benchmark_user_{index}',
+                    'email'   : f'benchmark_user_{index}@benchmark.com',
+                    'password': None
+                }
+                for index in range(options['users'])
+            )
+
+            identifiers: List[str] = [
+                random.choice((
+                    f'benchmark_user_{index}',
+                    f'benchmark_user_{index}@benchmark.com'
+                ))
+                for index in random.choices(range(options['users']), k=options['lookups'])
+            ]
+
+            self._report('or lookup', database, identifiers, self._or_lookup)
+            self._report('index lookup', database, identifiers, self._index_lookup)
+
+            transaction.set_rollback(True, using=database)
+
+    def _or_lookup(self, database: str, identifier: str) -> Optional[User]:
+        query = User.objects.using(database).filter(
+            Q(username=identifier) | Q(email=identifier)
+        )
+
+        return query.first() if query.exists() else None
+
+    def _index_lookup(self, database: str, identifier: str) -> Optional[User]:
+        return User.objects.db_manager(database).find_by_login(
+            identifier=identifier
+        ).get()
+
+    def _report(
+        self,
+        name: str,
+        database: str,
+        identifiers: List[str],
+        lookup: Callable[[str, str], Optional[User]]
+    ) -> None:
+        with CaptureQueriesContext(connections[database]) as context:
+            started = time.perf_counter()
+            for identifier in identifiers:
+                lookup(database, identifier)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{name:<14} {len(identifiers)} lookups  '
+            f'{elapsed * 1000:9.1f} ms total  '
+            f'{elapsed * 1e6 / len(identifiers):8.1f} us/lookup  '
+            f'{len(context.captured_queries) / len(identifiers):.1f} queries/lookup'
+        )
@@ -0,0 +1,93 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db                   import connections, transaction
+from django.db.models            import ExpressionWrapper, IntegerField, Max, Value
+from django.db.models.functions  import Coalesce
+from typing                      import Callable, List
+
+from accounts.models.profile import Profile
+from accounts.models.user    import User
+
+
+class Command(BaseCommand):
+    """
+    The benchmark_profile_creation command measures the Profile insert paid
+    by every signup before and after order_with_respect_to was dropped. For
+    each path users are seeded without profiles, a profile is then created
+    for each of them through Profile.create_profile and the run is rolled
+    back once it completes. The _order column is gone, so the old path
+    replays the aggregate Django ran before every insert of a model ordered
+    with respect to its user, over friend_count in place of _order, which
+    has the same type and is read through the same unique user index.
+    """
+
+    help = 'Benchmarks the Profile creation performed during signup with and without the _order aggregate.'
+
+    PATHS = (
+        ('order_with_respect_to', True),
+        ('created, uuid', False),
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--profiles', type=int, default=5000)
+        parser.add_argument('--database', default='default')
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        for name, aggregate in self.PATHS:
+            with transaction.atomic(using=options['database']):
+                self._run(name, aggregate, **options)
+
+                transaction.set_rollback(True, using=options['database'])
+
+    def _run(
+        self,
+        name: str,
+        aggregate: bool,
+        *,
+        database: str,
+        profiles: int,
+        **options: dict
+    ) -> None:
+        manager = Profile.objects.db_manager(database)
+
+        users: List[User] = User.objects.using(database).bulk_create(
+            (
+                User(
+                    username=f'benchmark_user_{index}',
+                    email=f'benchmark_user_{index}@benchmark.com',
+                    password='!'
+                )
+                for index in range(profiles)
+            ),
+            batch_size=1000
+        )
+
+        queries: List[str] = []
+
+        def count(execute: Callable, sql: str, *args: tuple) -> object:
+            queries.append(sql)
+            return execute(sql, *args)
+
+        # unlike CaptureQueriesContext, execute_wrapper has no cap on the number of queries
+        with connections[database].execute_wrapper(count):
+            started = time.perf_counter()
+            for user in users:
+                if aggregate:
+                    manager.filter(user=user).aggregate(
+                        _order__max=Coalesce(
+                            ExpressionWrapper(Max('friend_count') + Value(1), output_field=IntegerField()),
+                            Value(0)
+                        )
+                    )
+
+                manager.create_profile(user=user)
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            f'{name:<22} '
+            f'{len(users)} profiles  '
+            f'{elapsed * 1000:9.1f} ms total  '
+            f'{len(users) / elapsed:8.0f} profiles/s  '
+            f'{len(queries) / len(users):.1f} queries/profile'
+        )
@@ -0,0 +1,49 @@
+from datetime                    import timedelta
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils                import timezone
+
+from accounts.engines.recommendation_engine import RecommendationEngine
+from accounts.models.profile                import Profile
+
+
+class Command(BaseCommand):
+    """
+    The compute_recommendations command is the offline batch mode of the
+    RecommendationEngine. It streams the profile graph in chunks, either in
+    full or only around the profiles modified recently.
+    """
+
+    help = 'Computes and stores the friend recommendations of every profile.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--chunk-size', type=int, default=500)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument(
+            '--modified-within',
+            type=int,
+            metavar='MINUTES',
+            help='Only refresh profiles modified within the given number of minutes and their friends.'
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        engine = RecommendationEngine(
+            limit=options['limit'],
+            chunk_size=options['chunk_size']
+        )
+
+        profile_ids = None
+        if options['modified_within'] is not None:
+            # adding a friend touches the profile, so recently modified
+            # profiles and their friends are the ones whose candidates changed
+            profile_ids = engine.neighborhood(
+                Profile.objects.filter(
+                    modified__gte=timezone.now() - timedelta(minutes=options['modified_within'])
+                ).values_list('pk', flat=True)
+            )
+
+        processed: int = 0
+        for chunk in engine.refresh_all(profile_ids):
+            processed += chunk
+            self.stdout.write(f'Processed {processed} profiles')
+
+        self.stdout.write(self.style.SUCCESS(f'Refreshed recommendations for {processed} profiles'))
@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.db                   import transaction
+from typing                      import List
+
+from accounts.models.profile import Profile
+
+
+class Command(BaseCommand):
+    """
+    The reconcile_profile_counts command repairs the drift of the
+    friend_count and pending_incoming_count columns of Profile, such as the
+    drift left by rows inserted in bulk. It streams the profiles in chunks of
+    primary keys, so it never holds the whole table in memory, and recounts
+    each chunk while its rows are locked, so a concurrent adjustment is never
+    overwritten by a stale count.
+    """
+
+    help = 'Recounts the friend and pending friend request counters of every profile.'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--database', default='default')
+        parser.add_argument('--dry-run', action='store_true', help='Reports the drift without repairing it.')
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        profiles = Profile.objects.db_manager(options['database'])
+
+        checked : int = 0
+        repaired: int = 0
+        last_pk       = None
+
+        while True:
+            # keyset pagination keeps every chunk an index range scan
+            chunk = profiles.order_by('pk')
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+
+            with transaction.atomic(using=profiles.db):
+                drifted: List[Profile] = []
+                rows = list(
+                    chunk.select_for_update().with_actual_counts().only(
+                        'pk', *Profile.COUNTERS
+                    )[:options['chunk_size']]
+                )
+
+                if not rows:
+                    break
+
+                for profile in rows:
+                    if (
+                        profile.friend_count != profile.actual_friend_count
+                        or profile.pending_incoming_count != profile.actual_pending_incoming_count
+                    ):
+                        profile.friend_count           = profile.actual_friend_count
+                        profile.pending_incoming_count = profile.actual_pending_incoming_count
+                        drifted.append(profile)
+
+                if drifted and not options['dry_run']:
+                    profiles.bulk_update(drifted, Profile.COUNTERS)
+
+            checked  += len(rows)
+            repaired += len(drifted)
+            last_pk   = rows[-1].pk
+
+            self.stdout.write(f'Checked {checked} profiles')
+
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {repaired} of {checked} profiles'))
@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db   import models
+from typing      import Mapping
 
 from accounts.querysets.profile_queryset import ProfileQuerySet
 
@@ -20,3 +21,33 @@ class ProfileManager(models.Manager):
 
     def get_queryset(self) -> ProfileQuerySet:
         return ProfileQuerySet(self.model, using=self._db)
+
+    def for_detail_page(self) -> ProfileQuerySet:
+        return self.get_queryset().for_detail_page()
+
+    def friends_page(
+        self,
+        *,
+        profile: models.Model,
+        limit: int=12
+    ) -> ProfileQuerySet:
+        return self.get_queryset().friends_page(
+            profile=profile,
+            limit=limit
+        )
+
+    def adjust_counts(
+        self,
+        field: str,
+        deltas: Mapping[object, int],
+        *,
+        by: str='pk'
+    ) -> int:
+        return self.get_queryset().adjust_counts(
+            field,
+            deltas,
+            by=by
+        )
+
+    def with_actual_counts(self) -> ProfileQuerySet:
+        return self.get_queryset().with_actual_counts()
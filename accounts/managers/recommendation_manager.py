@@ -0,0 +1,24 @@
+from django.db import models
+
+from accounts.querysets.recommendation_queryset import RecommendationQuerySet
+
+
+class RecommendationManager(models.Manager):
+    """
+    The RecommendationManager class handles table-wide
+    database queries for the Recommendation class.
+    """
+
+    def get_queryset(self) -> RecommendationQuerySet:
+        return RecommendationQuerySet(self.model, using=self._db)
+
+    def for_profile(
+        self,
+        *,
+        profile: models.Model,
+        limit: int=10
+    ) -> RecommendationQuerySet:
+        return self.get_queryset().for_profile(
+            profile=profile,
+            limit=limit
+        )
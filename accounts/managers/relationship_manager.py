@@ -1,5 +1,6 @@
 from django.conf import settings
 from django.db   import models
+from typing      import Iterable, Optional, Tuple, Union
 
 from accounts.querysets.relationship_queryset import RelationshipQuerySet
 
@@ -38,3 +39,51 @@ class RelationshipManager(models.Manager):
             receiver=receiver
         )
 
+    def incoming(
+        self,
+        *,
+        user: settings.AUTH_USER_MODEL,
+        status: Optional[Union[str, Iterable[str]]]=None
+    ) -> RelationshipQuerySet:
+        return self.get_queryset().incoming(
+            user=user,
+            status=status
+        )
+
+    def outgoing(
+        self,
+        *,
+        user: settings.AUTH_USER_MODEL,
+        status: Optional[Union[str, Iterable[str]]]=None
+    ) -> RelationshipQuerySet:
+        return self.get_queryset().outgoing(
+            user=user,
+            status=status
+        )
+
+    def bulk_accept(
+        self,
+        pairs: Iterable[Tuple[settings.AUTH_USER_MODEL, settings.AUTH_USER_MODEL]],
+        *,
+        batch_size: int=1000
+    ) -> int:
+        """
+        Parameters:
+            pairs      -> an iterable of (sender, receiver) tuples, given either
+                          as users or as user primary keys
+            batch_size -> the number of friends through table rows inserted
+                          per INSERT statement
+
+        Returns:
+            An integer representing the number of friend requests accepted
+
+        The bulk_accept method accepts every pending friend request matching
+        one of the given pairs in a single transaction. Pairs without a
+        pending friend request are ignored.
+        """
+        return self.get_queryset().find_pairs(
+            pairs=pairs,
+            status=self.model.PENDING_STATUSES
+        ).accept_all(
+            batch_size=batch_size
+        )
@@ -1,6 +1,12 @@
-from django.contrib.auth.models import BaseUserManager
+from django.apps                 import apps
+from django.contrib.auth.models  import BaseUserManager
+from django.db                   import transaction
+from itertools                   import islice
+from typing                      import Iterable, Iterator, List
 
-from accounts.querysets.user_queryset import UserQuerySet
+from accounts.backends.authentication_cache import AuthenticationCache
+from accounts.hashers.password_executor     import get_password_executor
+from accounts.querysets.user_queryset       import UserQuerySet
 
 
 class UserManager(BaseUserManager):
@@ -36,7 +42,7 @@ class UserManager(BaseUserManager):
             raise ValueError('An email address must be supplied')
 
         if not username:
-            raise ValuError('A username must be supplied')
+            raise ValueError('A username must be supplied')
 
         user = self.model(
             email=self.normalize_email(email),
@@ -87,3 +93,80 @@ class UserManager(BaseUserManager):
             username=username,
             email=email
         )
+
+    def find_by_login(
+        self,
+        *,
+        identifier: str
+    ) -> UserQuerySet:
+        return self.get_queryset().find_by_login(
+            identifier=identifier
+        )
+
+    def bulk_create_users(
+        self,
+        rows: Iterable[dict],
+        *,
+        batch_size: int=1000
+    ) -> int:
+        """
+        Parameters:
+            rows       -> an iterable of dictionaries holding the username,
+                          email, password and any additional fields of each
+                          user being created
+            batch_size -> the number of users hashed and inserted per batch
+
+        Returns:
+            An integer representing the number of users created
+
+        The bulk_create_users method provisions users without going through
+        User.save. Each batch has its passwords hashed by the configured
+        password executor, then its users and their profiles are inserted
+        with one bulk INSERT each inside a single transaction.
+        """
+        Profile = apps.get_model('accounts', 'Profile')
+
+        rows: Iterator[dict] = iter(rows)
+        created: int = 0
+
+        while True:
+            batch: List[dict] = [dict(row) for row in islice(rows, batch_size)]
+            if not batch:
+                break
+
+            passwords = get_password_executor().hash_many(
+                row.pop('password', None) for row in batch
+            )
+
+            users = []
+            for row, password in zip(batch, passwords):
+                email    = row.pop('email', None)
+                username = row.pop('username', None)
+
+                if not email:
+                    raise ValueError('An email address must be supplied')
+
+                if not username:
+                    raise ValueError('A username must be supplied')
+
+                users.append(self.model(
+                    email=self.normalize_email(email),
+                    username=username,
+                    password=password,
+                    **row
+                ))
+
+            with transaction.atomic(using=self.db):
+                self.bulk_create(users)
+
+                Profile.objects.using(self.db).bulk_create(
+                    Profile(user=user)
+                    for user in users
+                )
+
+            # the bulk insert bypasses User.save, which clears cached failed logins
+            AuthenticationCache.invalidate_many(users)
+
+            created += len(users)
+
+        return created
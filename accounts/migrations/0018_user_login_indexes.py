@@ -0,0 +1,52 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:54
+
+import core.db.indexes.unique_index
+
+from django.db                  import migrations, models
+from django.db.models.functions import Lower
+
+
+def check_case_variant_duplicates(apps, schema_editor):
+    # the unique indexes below would fail halfway through on existing
+    # case-variant duplicates, so they are reported up front and left to be
+    # resolved by hand, as only a person can tell which account to keep
+    User  = apps.get_model('accounts', 'User')
+    users = User.objects.using(schema_editor.connection.alias)
+
+    duplicates = {}
+    for field in ('email', 'username'):
+        values = list(
+            users.annotate(
+                lowered=Lower(field)
+            ).order_by().values('lowered').annotate(
+                count=models.Count('*')
+            ).filter(count__gt=1).values_list('lowered', flat=True)
+        )
+
+        if values:
+            duplicates[field] = values
+
+    if duplicates:
+        raise ValueError(
+            'Cannot add the case-insensitive login indexes, these values are '
+            f'shared by several users when lowercased: {duplicates}'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_profile_friends_source_column'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_variant_duplicates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='user',
+            index=core.db.indexes.unique_index.UniqueIndex(Lower('email'), name='accounts_user_email_lower_uniq'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=core.db.indexes.unique_index.UniqueIndex(Lower('username'), name='accounts_user_name_lower_uniq'),
+        ),
+    ]
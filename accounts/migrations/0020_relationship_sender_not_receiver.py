@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-18 17:57
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_relationship_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='relationship',
+            constraint=models.CheckConstraint(check=models.Q(('sender', django.db.models.expressions.F('receiver')), _negated=True), name='accounts_rel_sender_not_receiver'),
+        ),
+    ]
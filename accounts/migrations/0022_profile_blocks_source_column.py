@@ -0,0 +1,40 @@
+# Generated by Django 3.2.25 on 2026-10-18 19:10
+
+from django.db import migrations
+
+
+def rename_blocks_source_column(apps, schema_editor):
+    # 0016 pointed blocks at Profile instead of User, which renamed the
+    # target column of the through table but left its source column named
+    # profile_id, so no query on blocks can run until it is renamed
+    Profile    = apps.get_model('accounts', 'Profile')
+    Blocks     = Profile.blocks.through
+    connection = schema_editor.connection
+    table      = Blocks._meta.db_table
+    column     = Blocks._meta.get_field('from_profile').column
+
+    with connection.cursor() as cursor:
+        columns = {
+            description.name
+            for description in connection.introspection.get_table_description(cursor, table)
+        }
+
+    if column not in columns and 'profile_id' in columns:
+        schema_editor.execute(
+            schema_editor.sql_rename_column % {
+                'table'     : schema_editor.quote_name(table),
+                'old_column': schema_editor.quote_name('profile_id'),
+                'new_column': schema_editor.quote_name(column),
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0021_recommendation'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_blocks_source_column, migrations.RunPython.noop),
+    ]
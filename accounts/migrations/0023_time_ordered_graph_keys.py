@@ -0,0 +1,29 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:03
+
+import core.utils.time_ordered_uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0022_profile_blocks_source_column'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='uuid',
+            field=models.UUIDField(default=core.utils.time_ordered_uuid.time_ordered_uuid, editable=False, primary_key=True, serialize=False, verbose_name='UUID'),
+        ),
+        migrations.AlterField(
+            model_name='relationship',
+            name='uuid',
+            field=models.UUIDField(default=core.utils.time_ordered_uuid.time_ordered_uuid, editable=False, primary_key=True, serialize=False, verbose_name='UUID'),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='uuid',
+            field=models.UUIDField(default=core.utils.time_ordered_uuid.time_ordered_uuid, editable=False, primary_key=True, serialize=False, verbose_name='UUID'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:04
+
+import core.utils.time_ordered_uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0023_time_ordered_graph_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recommendation',
+            name='uuid',
+            field=models.UUIDField(default=core.utils.time_ordered_uuid.time_ordered_uuid, editable=False, primary_key=True, serialize=False, verbose_name='UUID'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0024_time_ordered_time_stamp_keys'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='profile',
+            options={'ordering': ['created', 'uuid'], 'verbose_name': 'Profile', 'verbose_name_plural': 'Profiles'},
+        ),
+        migrations.AlterOrderWithRespectTo(
+            name='profile',
+            order_with_respect_to=None,
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['created', 'uuid'], name='accounts_profile_created_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 3.2.25 on 2026-10-18 18:27
+
+from django.db                  import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Profile      = apps.get_model('accounts', 'Profile')
+    Relationship = apps.get_model('accounts', 'Relationship')
+    Friends      = Profile.friends.through
+
+    Profile.objects.using(schema_editor.connection.alias).update(
+        friend_count=Coalesce(
+            models.Subquery(
+                Friends.objects.filter(
+                    from_profile=models.OuterRef('pk')
+                ).order_by().values('from_profile').annotate(
+                    count=models.Count('*')
+                ).values('count')
+            ),
+            0
+        ),
+        pending_incoming_count=Coalesce(
+            models.Subquery(
+                Relationship.objects.filter(
+                    receiver=models.OuterRef('user'),
+                    status__in=['S', 'V']
+                ).order_by().values('receiver').annotate(
+                    count=models.Count('*')
+                ).values('count')
+            ),
+            0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0025_profile_drop_order_with_respect_to'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='friend_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Friend Count'),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='pending_incoming_count',
+            field=models.IntegerField(default=0, editable=False, verbose_name='Pending Incoming Count'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
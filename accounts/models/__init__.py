@@ -1,3 +1,4 @@
-from .profile      import Profile
-from .relationship import Relationship
-from .user         import User
+from .profile        import Profile
+from .recommendation import Recommendation
+from .relationship   import Relationship
+from .user           import User
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import uuid
 
+from collections              import Counter
 from django.conf              import settings
-from django.db                import models
+from django.db                import models, transaction
 from django.utils.translation import ugettext_lazy as _
+from typing                   import Dict, Iterable, List, Optional
 
-from accounts.managers.profile_manager import ProfileManager
-from core.models.time_stamp            import TimeStamp
+from accounts.indexes.block_index        import BlockIndex
+from accounts.indexes.friend_index       import FriendIndex
+from accounts.managers.profile_manager   import ProfileManager
+from accounts.models.recommendation      import Recommendation
+from accounts.querysets.profile_queryset import ProfileQuerySet
+from core.models.time_stamp              import TimeStamp
 
 
 class Profile(TimeStamp):
@@ -30,13 +36,6 @@ class Profile(TimeStamp):
         PREFER_NOT_TO_SAY = 'X'
 
 
-    uuid = models.UUIDField(
-        _('UUID'), 
-        primary_key=True, 
-        default=uuid.uuid4, 
-        editable=False
-    )
-
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
@@ -61,16 +60,34 @@ class Profile(TimeStamp):
         blank=True
     )
 
+    friend_count = models.IntegerField(
+        _('Friend Count'),
+        default=0,
+        editable=False
+    )
+
+    pending_incoming_count = models.IntegerField(
+        _('Pending Incoming Count'),
+        default=0,
+        editable=False
+    )
+
+    # the counters are adjusted through ProfileQuerySet.adjust_counts, never by save
+    COUNTERS = ('friend_count', 'pending_incoming_count')
+
     objects = ProfileManager()
 
     class Meta:
         """
         Profile.Meta class to define database-specific criterion.
         """
-        db_table              = _('accounts-profile')
-        verbose_name          = _('Profile')
-        verbose_name_plural   = _('Profiles')
-        order_with_respect_to =   'user'
+        db_table            = _('accounts-profile')
+        ordering            =  ['created', 'uuid']
+        indexes             =  [
+            models.Index(fields=['created', 'uuid'], name='accounts_profile_created_idx'),
+        ]
+        verbose_name        = _('Profile')
+        verbose_name_plural = _('Profiles')
 
     def __str__(self) -> str:
         """
@@ -86,6 +103,38 @@ class Profile(TimeStamp):
         """
         return f'Profile instance for {self.user.email}'
 
+    def _do_update(
+        self,
+        base_qs: ProfileQuerySet,
+        using: str,
+        pk_val: uuid.UUID,
+        values: list,
+        update_fields: Optional[Iterable[str]],
+        forced_update: bool
+    ) -> bool:
+        """
+        Parameters:
+            base_qs       -> the QuerySet the UPDATE runs against
+            using         -> the database the profile is saved to
+            pk_val        -> the primary key of the profile
+            values        -> the (field, model, value) tuples being written
+            update_fields -> the fields given to save, or None
+            forced_update -> whether save was given force_update
+
+        Returns:
+            A boolean representing whether the UPDATE found the row
+
+        The _do_update method leaves the counter columns out of the UPDATE of
+        an existing profile unless save names them, so saving a profile loaded
+        before a concurrent friendship or friend request never writes back a
+        stale count. Inserts, including the one save falls back to when the
+        row is gone, still write them.
+        """
+        if update_fields is None:
+            values = [value for value in values if value[0].name not in self.COUNTERS]
+
+        return super()._do_update(base_qs, using, pk_val, values, update_fields, forced_update)
+
     @classmethod
     def create_profile(
         cls,
@@ -119,6 +168,51 @@ class Profile(TimeStamp):
         """
         return self.friends
 
+    def get_friends_page(
+        self,
+        *,
+        limit: int=12
+    ) -> ProfileQuerySet:
+        """
+        Parameters:
+            limit -> the maximum number of friends on the page
+
+        Returns:
+            A QuerySet of the first page of this instance's friends with their
+            users already loaded
+
+        The get_friends_page method lists friends for rendering without a lazy
+        query per friend.
+        """
+        return Profile.objects.friends_page(
+            profile=self,
+            limit=limit
+        )
+
+    def get_recommendations(
+        self,
+        *,
+        limit: int=10
+    ) -> List[Profile]:
+        """
+        Parameters:
+            limit -> the maximum number of recommendations returned
+
+        Returns:
+            A list of the profiles recommended to this instance, best first
+
+        The get_recommendations method only reads the top ranked candidates
+        stored by the RecommendationEngine, leaving out anyone blocked since
+        they were computed.
+        """
+        return BlockIndex.filter_blocked(self, [
+            recommendation.candidate
+            for recommendation in Recommendation.objects.for_profile(
+                profile=self,
+                limit=limit
+            )
+        ])
+
     def add_friend(
         self,
         profile: Profile
@@ -130,7 +224,108 @@ class Profile(TimeStamp):
         Returns:
             None
 
-        The add_friend method handles finalizing a friendship request.
+        The add_friend method handles finalizing a friendship request. Both
+        profiles are locked while the friendship is added, so the friend count
+        of each is incremented exactly once with an F() expression, and the
+        counts of the instances are kept in step.
+        """
+        profiles = Profile.objects.db_manager(self._state.db)
+
+        with transaction.atomic(using=profiles.db):
+            # locking both rows serializes the friendship changes between them
+            list(profiles.select_for_update().filter(
+                pk__in=[self.pk, profile.pk]
+            ).order_by('pk').values_list('pk'))
+
+            if not self.get_friends().filter(pk=profile.pk).exists():
+                # the m2m_changed receiver increments both friend counts
+                self.get_friends().add(profile)
+
+                self.friend_count    += 1
+                profile.friend_count += 1
+
+            self.save()
+
+    def mutual_friends(
+        self,
+        other: Profile
+    ) -> ProfileQuerySet:
         """
-        self.get_friends().add(profile)
-        self.save()
+        Parameters:
+            other -> the profile whose friends list is compared to this one
+
+        Returns:
+            A chainable QuerySet of the profiles that are friends with both
+            this instance and the other profile
+
+        The mutual_friends method intersects both adjacency entries of the
+        FriendIndex so only the final profile lookup reaches the database.
+        """
+        adjacency = FriendIndex.get_many([self.pk, other.pk])
+
+        return Profile.objects.filter(
+            pk__in=adjacency[self.pk] & adjacency[other.pk]
+        )
+
+    def mutual_counts(
+        self,
+        profiles: Iterable[Profile]
+    ) -> Dict[uuid.UUID, int]:
+        """
+        Parameters:
+            profiles -> the profiles, or profile primary keys, being compared
+                        to this instance
+
+        Returns:
+            A dictionary mapping each profile primary key to the number of
+            friends it has in common with this instance
+
+        The mutual_counts method answers every comparison from a single batch
+        lookup of the FriendIndex, so rendering mutual friend counts for a
+        page of profiles does not issue a query per profile.
+        """
+        profile_ids: List[uuid.UUID] = [
+            getattr(profile, 'pk', profile)
+            for profile in profiles
+        ]
+
+        adjacency = FriendIndex.get_many([self.pk, *profile_ids])
+        friends   = adjacency[self.pk]
+
+        return {
+            profile_id: len(friends & adjacency[profile_id])
+            for profile_id in profile_ids
+        }
+
+    def friends_of_friends(
+        self,
+        *,
+        limit: int=10
+    ) -> List[Profile]:
+        """
+        Parameters:
+            limit -> the maximum number of profiles returned
+
+        Returns:
+            A list of profiles that are not yet friends with this instance,
+            ordered by the number of mutual friends they share with it
+
+        The friends_of_friends method walks two hops of the FriendIndex and
+        then loads the highest ranked profiles with a single query. Profiles
+        blocked by or blocking this instance are left out.
+        """
+        friends = FriendIndex.get(self.pk)
+        blocked = BlockIndex.get(self.user_id)
+
+        candidates: Counter = Counter()
+        for friend_ids in FriendIndex.get_many(friends).values():
+            candidates.update(friend_ids - friends - {self.pk})
+
+        # at most one candidate per blocked user can be dropped below
+        ranked   = [profile_id for profile_id, _ in candidates.most_common(limit + len(blocked))]
+        profiles = Profile.objects.in_bulk(ranked)
+
+        return BlockIndex.filter_blocked(
+            self,
+            [profiles[profile_id] for profile_id in ranked if profile_id in profiles]
+        )[:limit]
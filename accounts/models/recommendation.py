@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.db                import models
+from django.utils.translation import ugettext_lazy as _
+
+from accounts.managers.recommendation_manager import RecommendationManager
+from core.models.time_stamp                   import TimeStamp
+
+
+class Recommendation(TimeStamp):
+    """
+    The Recommendation class stores one precomputed "people you may know"
+    candidate of a Profile instance along with the number of friends the
+    two profiles have in common.
+    """
+
+    profile = models.ForeignKey(
+        'accounts.Profile',
+        on_delete=models.CASCADE,
+        related_name='recommendations'
+    )
+
+    candidate = models.ForeignKey(
+        'accounts.Profile',
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+
+    mutual_friends = models.PositiveIntegerField(
+        _('Mutual Friends')
+    )
+
+    objects = RecommendationManager()
+
+    class Meta:
+        """
+        Recommendation.Meta class to define database-specific criterion.
+        """
+        db_table            = _('accounts-recommendation')
+        unique_together     =  ('profile', 'candidate')
+        verbose_name        = _('Recommendation')
+        verbose_name_plural = _('Recommendations')
+        indexes             =  [
+            models.Index(fields=['profile', '-mutual_friends'], name='accounts_rec_top_idx'),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Parameters:
+            None
+
+        Returns:
+            The desired string representation of the model for viewing
+            in the database.
+
+        The __str__ dunder method outputs the desired string representation
+        of the Recommendation instance.
+        """
+        return f'Recommendation of {self.candidate_id} for {self.profile_id}'
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import logging
-import uuid
 
+from django.apps              import apps
 from django.conf              import settings
-from django.db                import models
+from django.db                import models, router, transaction
 from django.db.models.query   import QuerySet
 from django.utils.translation import ugettext_lazy as _
+from typing                   import Dict, Iterable, Optional, Tuple
 
 from accounts.exception                       import AccountsException
+from accounts.indexes.block_index             import BlockIndex
 from accounts.managers.relationship_manager   import RelationshipManager
 from accounts.querysets.relationship_queryset import RelationshipQuerySet
+from core.metrics.timed                       import timed
 from core.models.time_stamp                   import TimeStamp
 
 logger = logging.getLogger('accounts')
@@ -35,13 +38,8 @@ class Relationship(TimeStamp):
         REJECTED = 'R'
         VIEWED   = 'V'
 
-
-    uuid = models.UUIDField(
-        _('UUID'),
-        primary_key=True,
-        default=uuid.uuid4,
-        editable=False
-    )
+    # the statuses counted by the receiver's Profile.pending_incoming_count
+    PENDING_STATUSES = (RequestOptions.SENT, RequestOptions.VIEWED)
 
     sender = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -86,9 +84,20 @@ class Relationship(TimeStamp):
         db_table            = _('accounts-relationship')
         ordering            =  ['created']
         unique_together     =  ('sender', 'receiver')
+        indexes             =  [
+            models.Index(fields=['receiver', 'status', 'created'], name='accounts_rel_inbox_idx'),
+            models.Index(fields=['sender', 'status', 'created'], name='accounts_rel_outbox_idx'),
+        ]
+        constraints         =  [
+            models.CheckConstraint(
+                check=~models.Q(sender=models.F('receiver')),
+                name='accounts_rel_sender_not_receiver'
+            ),
+        ]
         verbose_name        = _('Relationship')
         verbose_name_plural = _('Relationships')
 
+    @timed
     def save(
         self,
         *args: tuple,
@@ -103,17 +112,54 @@ class Relationship(TimeStamp):
 
         The save method saves the current relationship to the database and
         also assures that the sender and receiver of the instance cannot be
-        the same user.
+        the same user. The accounts_rel_sender_not_receiver check constraint
+        enforces the same rule for bulk inserts and queryset updates. New
+        friend requests between users who blocked each other are refused,
+        and a new pending request increments the pending_incoming_count of
+        its receiver in the same transaction.
         """
-        logger.info('Started Relationship.save')
-
-        if self.sender == self.receiver:
+        # comparing the raw ids keeps the sender and receiver from being loaded
+        if self.sender_id == self.receiver_id:
             logger.warning('The sender and receiver of this relationship are equal')
             raise AccountsException
 
-        super().save(*args, **kwargs)
+        if self._state.adding and self.receiver_id in BlockIndex.get(self.sender_id):
+            logger.warning('The sender and receiver of this relationship have blocked each other')
+            raise AccountsException
+
+        if not self._state.adding or self.status not in self.PENDING_STATUSES:
+            return super().save(*args, **kwargs)
+
+        with transaction.atomic(using=kwargs.get('using') or router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
+
+            apps.get_model('accounts', 'Profile').objects.using(self._state.db).adjust_counts(
+                'pending_incoming_count',
+                {self.receiver_id: 1},
+                by='user'
+            )
+
+    def delete(
+        self,
+        using: Optional[str]=None,
+        keep_parents: bool=False
+    ) -> Tuple[int, Dict[str, int]]:
+        """
+        Parameters:
+            using        -> the database the friend request is deleted from
+            keep_parents -> unused, Relationship has no parent model
+
+        Returns:
+            A tuple holding the number of friend requests deleted and a
+            dictionary of that number per model
+
+        The delete method goes through RelationshipQuerySet.delete, so
+        deleting a pending request decrements the pending_incoming_count of
+        its receiver.
+        """
+        using = using or router.db_for_write(type(self), instance=self)
 
-        logger.info('Completed Relationship.save')
+        return type(self).objects.using(using).filter(pk=self.pk).delete()
 
     @classmethod
     def create_relationship(
@@ -155,7 +201,25 @@ class Relationship(TimeStamp):
             sender=sender,
             receiver=receiver
         )
-    
+
+    @classmethod
+    def bulk_accept(
+        cls,
+        pairs: Iterable[Tuple[settings.AUTH_USER_MODEL, settings.AUTH_USER_MODEL]]
+    ) -> int:
+        """
+        Parameters:
+            pairs -> an iterable of (sender, receiver) tuples whose friend
+                     requests should be accepted
+
+        Returns:
+            An integer representing the number of friend requests accepted
+
+        The bulk_accept class method finalizes many friend requests at once
+        while keeping the acceptance logic inside the class itself.
+        """
+        return cls.objects.bulk_accept(pairs)
+
     def accept(self) -> None:
         """
         Parameters:
@@ -168,11 +232,8 @@ class Relationship(TimeStamp):
         two users and it also removes the request from the database after
         acceptance.
         """
-        self.sender.profile.add_friend(profile=self.receiver.profile)
-        self.receiver.profile.add_friend(profile=self.sender.profile)
-
-        # remove the request from the database because it has been accepted
-        self.delete()
+        # the request is removed from the database because it has been accepted
+        type(self).objects.filter(pk=self.pk).accept_all()
 
     def reject(self) -> None:
         """
@@ -183,8 +244,11 @@ class Relationship(TimeStamp):
             None
 
         The reject method is used to showcase that a friend request
-        was rejected by a user.
+        was rejected by a user. The status is written right away so the
+        pending_incoming_count of the receiver is decremented with it.
         """
+        type(self).objects.filter(pk=self.pk).reject()
+
         self.status = self.RequestOptions.REJECTED
 
     def mark_as_viewed(self) -> None:
@@ -210,8 +274,9 @@ class Relationship(TimeStamp):
 
         The cancel method ends the friend request by removing it from the database.
         """
-        self.delete()
+        type(self).objects.filter(pk=self.pk).cancel()
 
+    @timed
     def update_status(
         self,
         *,
@@ -227,11 +292,12 @@ class Relationship(TimeStamp):
         The update_status method takes in a RequestOptions enumerated
         value and updates the relationship's status accordingly.
         """
-        logger.info('Started Relationship.update_status')
-
         if status == self.RequestOptions.REJECTED:
+            # rejecting writes the status along with the receiver's pending count
             self.reject()
-        elif status == self.RequestOptions.VIEWED:
+            return
+
+        if status == self.RequestOptions.VIEWED:
             self.mark_as_viewed()
         elif status == self.RequestOptions.SENT:
             # this should not be used because SENT
@@ -239,6 +305,3 @@ class Relationship(TimeStamp):
             pass
 
         self.save()
-
-        logger.info('Completed Relationship.update_status')
-
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-import logging
-import uuid
-
-from django.contrib.auth.models import AbstractUser
-from django.db                  import models
-from django.utils.translation   import ugettext_lazy as _
-
-from accounts.managers.user_manager   import UserManager
-from accounts.models.profile          import Profile
-from accounts.querysets.user_queryset import UserQuerySet
-
-logger = logging.getLogger('accounts')
+from asgiref.sync                import sync_to_async
+from django.contrib.auth.hashers import get_hasher, identify_hasher
+from django.contrib.auth.models  import AbstractUser
+from django.db                   import models
+from django.db.models.functions  import Lower
+from django.utils.translation    import ugettext_lazy as _
+from typing                      import Optional
+
+from accounts.backends.authentication_cache import AuthenticationCache
+from accounts.hashers.password_executor     import get_password_executor
+from accounts.managers.user_manager         import UserManager
+from accounts.models.profile                import Profile
+from accounts.querysets.user_queryset       import UserQuerySet
+from core.db.indexes.unique_index           import UniqueIndex
+from core.metrics.timed                     import timed
+from core.utils.time_ordered_uuid           import time_ordered_uuid
 
 
 class User(AbstractUser):
@@ -24,7 +28,7 @@ class User(AbstractUser):
     uuid = models.UUIDField(
         _('UUID'), 
         primary_key=True, 
-        default=uuid.uuid4,
+        default=time_ordered_uuid,
         editable=False
     )
 
@@ -44,6 +48,9 @@ class User(AbstractUser):
     USERNAME_FIELD  = 'email'
     REQUIRED_FIELDS = ['username']
 
+    # the fields the cached login entries depend on
+    AUTHENTICATION_FIELDS = ('email', 'username', 'password', 'is_active', 'is_banned')
+
     class Meta:
         """
         User.Meta class to define database-specific criteria.
@@ -52,6 +59,15 @@ class User(AbstractUser):
         verbose_name        = _('User')
         verbose_name_plural = _('Users')
         ordering            =  ['email']
+        indexes             =  [
+            UniqueIndex(Lower('email'),    name='accounts_user_email_lower_uniq'),
+            UniqueIndex(Lower('username'), name='accounts_user_name_lower_uniq'),
+        ]
+
+    def __init__(self, *args: tuple, **kwargs: dict) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._authentication_state: dict = self._get_authentication_state()
 
     def __str__(self) -> str:
         """
@@ -67,6 +83,7 @@ class User(AbstractUser):
         """
         return self.email
 
+    @timed
     def save(
         self,
         *args: tuple,
@@ -82,16 +99,93 @@ class User(AbstractUser):
 
         The save method will save the current user into the database and
         also create a new Profile instance for the user if one does not
-        currently exist.
+        currently exist. The cached login entries of the user are removed
+        when it is created or when a field they depend on changes, so saving
+        last_login on every login keeps them.
         """
-        logger.info('Started User.save')
+        adding  : bool = self._state.adding
+        previous: dict = self._authentication_state
 
         super().save(*args, **kwargs)
-        
+
+        self._authentication_state = self._get_authentication_state()
+
+        # signups, bans, activation, login and password changes must not be
+        # answered from the cache, under the previous logins as well
+        if adding or self._authentication_state != previous:
+            AuthenticationCache.invalidate_logins([
+                (self.email, self.username),
+                (previous['email'], previous['username'])
+            ])
+
         if not hasattr(self, 'profile'):
             Profile.create_profile(user=self)
 
-        logger.info('Completed User.save')
+    def _get_authentication_state(self) -> dict:
+        # deferred fields are left out rather than loaded
+        return {field: self.__dict__.get(field) for field in self.AUTHENTICATION_FIELDS}
+
+    def set_password(
+        self,
+        raw_password: Optional[str]
+    ) -> None:
+        """
+        Parameters:
+            raw_password -> the password being assigned to the user
+
+        Returns:
+            None
+
+        The set_password method hashes the password through the configured
+        password executor rather than on the calling worker.
+        """
+        self.password  = get_password_executor().hash(raw_password)
+        self._password = raw_password
+
+    async def aset_password(
+        self,
+        raw_password: Optional[str]
+    ) -> None:
+        """
+        Parameters:
+            raw_password -> the password being assigned to the user
+
+        Returns:
+            None
+
+        The aset_password method is the coroutine counterpart of set_password
+        and awaits the password executor instead of blocking on it.
+        """
+        self.password  = await get_password_executor().ahash(raw_password)
+        self._password = raw_password
+
+    async def acheck_password(
+        self,
+        raw_password: Optional[str]
+    ) -> bool:
+        """
+        Parameters:
+            raw_password -> the password entered during authentication
+
+        Returns:
+            True if the password is correct, otherwise False
+
+        The acheck_password method is the coroutine counterpart of
+        check_password. The password is verified by the password executor
+        and, just like check_password, a correct password stored with
+        outdated hasher settings is rehashed and saved.
+        """
+        if not await get_password_executor().acheck(raw_password, self.password):
+            return False
+
+        preferred = get_hasher('default')
+        hasher    = identify_hasher(self.password)
+
+        if hasher.algorithm != preferred.algorithm or preferred.must_update(self.password):
+            await self.aset_password(raw_password)
+            await sync_to_async(self.save)(update_fields=['password'])
+
+        return True
 
     @classmethod
     def create_user(
@@ -130,6 +224,27 @@ class User(AbstractUser):
             email=email
         )
 
+    @classmethod
+    def get_login_user(
+        cls,
+        *,
+        identifier: str
+    ) -> Optional[User]:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+
+        Returns:
+            The matching User instance, or None if no user matches
+
+        The get_login_user class method fetches the user logging in with a
+        single query against one case-insensitive index.
+        """
+        try:
+            return cls.objects.find_by_login(identifier=identifier).get()
+        except (cls.DoesNotExist, cls.MultipleObjectsReturned):
+            return None
+
     def authenticate(
         self,
         *,
@@ -149,6 +264,22 @@ class User(AbstractUser):
         """
         return self.check_password(password) and not self.is_banned and self.is_active
 
+    async def aauthenticate(
+        self,
+        *,
+        password: str
+    ) -> bool:
+        """
+        Parameters:
+            password -> the password entered during authentication
+
+        Returns:
+            True if authentication tests passed successfully, otherwise False
+
+        The aauthenticate method is the coroutine counterpart of authenticate.
+        """
+        return await self.acheck_password(password) and not self.is_banned and self.is_active
+
     def ban(self) -> None:
         """
         Parameters:
@@ -1,5 +1,125 @@
-from django.db import models
+from __future__ import annotations
 
+from collections                import defaultdict
+from django.apps                import apps
+from django.db                  import models
+from django.db.models           import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from typing                     import Dict, List, Mapping
 
-class ProfileQuerySet(models.QuerySet):
-    ...
+from core.querysets.replica_queryset import ReplicaQuerySet
+
+
+class ProfileQuerySet(ReplicaQuerySet):
+    """
+    The ProfileQuerySet class is meant to handle
+    table-wide database queries by using the Django
+    built-in query functionality.
+    """
+
+    def for_detail_page(self) -> ProfileQuerySet:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A chainable QuerySet of profiles joined to their users
+
+        The for_detail_page method loads everything the profile page renders
+        about the profile itself in a single query, so Profile.__str__ does
+        not fire a lazy query. The friend count is read from its column.
+        """
+        return self.on_replica().select_related(
+            'user'
+        )
+
+    def friends_page(
+        self,
+        *,
+        profile: models.Model,
+        limit: int=12
+    ) -> ProfileQuerySet:
+        """
+        Parameters:
+            profile -> the profile whose friends are listed
+            limit   -> the maximum number of friends on the page
+
+        Returns:
+            A QuerySet of the first page of the profile's friends joined to
+            their users and ordered by username
+        """
+        return self.on_replica().filter(
+            friends=profile
+        ).select_related(
+            'user'
+        ).order_by(
+            'user__username'
+        )[:limit]
+
+    def adjust_counts(
+        self,
+        field: str,
+        deltas: Mapping[object, int],
+        *,
+        by: str='pk'
+    ) -> int:
+        """
+        Parameters:
+            field  -> the counter column being adjusted
+            deltas -> a mapping of profile keys to the amount added to their
+                      counter, which is negative to decrement it
+            by     -> the field the keys refer to, such as pk or user
+
+        Returns:
+            An integer representing the number of profiles updated
+
+        The adjust_counts method applies the amounts with F() expressions, so
+        concurrent adjustments never overwrite each other, and issues one
+        UPDATE per distinct amount rather than one per profile.
+        """
+        groups: Dict[int, List[object]] = defaultdict(list)
+        for key, delta in deltas.items():
+            if delta:
+                groups[delta].append(key)
+
+        return sum(
+            self.filter(**{f'{by}__in': keys}).update(**{field: F(field) + delta})
+            for delta, keys in groups.items()
+        )
+
+    def with_actual_counts(self) -> ProfileQuerySet:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A chainable QuerySet of profiles annotated with the
+            actual_friend_count and actual_pending_incoming_count counted
+            from the friends through table and the pending friend requests
+        """
+        Friends      = self.model.friends.through
+        Relationship = apps.get_model('accounts', 'Relationship')
+
+        return self.annotate(
+            actual_friend_count=Coalesce(
+                Subquery(
+                    Friends.objects.filter(
+                        from_profile=OuterRef('pk')
+                    ).order_by().values('from_profile').annotate(
+                        count=Count('*')
+                    ).values('count')
+                ),
+                0
+            ),
+            actual_pending_incoming_count=Coalesce(
+                Subquery(
+                    Relationship.objects.filter(
+                        receiver=OuterRef('user'),
+                        status__in=Relationship.PENDING_STATUSES
+                    ).order_by().values('receiver').annotate(
+                        count=Count('*')
+                    ).values('count')
+                ),
+                0
+            )
+        )
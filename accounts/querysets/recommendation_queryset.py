@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class RecommendationQuerySet(models.QuerySet):
+    """
+    The RecommendationQuerySet class is meant to handle
+    table-wide database queries by using the Django
+    built-in query functionality.
+    """
+
+    def for_profile(
+        self,
+        *,
+        profile: models.Model,
+        limit: int=10
+    ) -> RecommendationQuerySet:
+        """
+        Parameters:
+            profile -> the profile the recommendations were computed for
+            limit   -> the maximum number of recommendations returned
+
+        Returns:
+            A QuerySet of the profile's precomputed recommendations, best
+            first, with each candidate and its user already loaded
+        """
+        return self.filter(
+            profile=profile
+        ).select_related(
+            'candidate__user'
+        ).order_by(
+            '-mutual_friends',
+            'candidate_id'
+        )[:limit]
@@ -1,16 +1,44 @@
 from __future__ import annotations
 
-from django.conf import settings
-from django.db   import models
+from collections       import Counter
+from datetime          import datetime
+from django.apps       import apps
+from django.conf       import settings
+from django.db         import models, transaction
+from django.db.models  import F, Q
+from django.utils      import timezone
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+from functools         import reduce
+from operator          import or_
+from typing            import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from uuid              import UUID
 
+from accounts.exception              import AccountsException
+from accounts.indexes.friend_index   import FriendIndex
+from core.querysets.replica_queryset import ReplicaQuerySet
 
-class RelationshipQuerySet(models.QuerySet):
+
+class RelationshipPage(NamedTuple):
+    """
+    The RelationshipPage class holds one keyset-paginated page of
+    Relationship instances along with the cursor of the following page,
+    which is None on the last page.
+    """
+    relationships: list
+    next_cursor  : Optional[str]
+
+
+class RelationshipQuerySet(ReplicaQuerySet):
     """
     The RelationshipQuerySet class is meant to handle
     table-wide database queries by using the Django
     built-in query functionality.
     """
 
+    # pairs per OR-ed lookup, which keeps the expression within the depth
+    # SQLite allows
+    PAIR_BATCH_SIZE: int = 250
+
     def find(
         self,
         *,
@@ -30,7 +58,427 @@ class RelationshipQuerySet(models.QuerySet):
         Relationship instance so the .exists() method can be used upon
         its return.
         """
-        return self.filter(
+        return self.on_replica().filter(
             sender=sender,
             receiver=receiver
         )
+
+    def incoming(
+        self,
+        *,
+        user: settings.AUTH_USER_MODEL,
+        status: Optional[Union[str, Iterable[str]]]=None
+    ) -> RelationshipQuerySet:
+        """
+        Parameters:
+            user   -> The user who received the friend requests
+            status -> An optional status, or iterable of statuses, the friend
+                      requests are limited to
+
+        Returns:
+            A chainable QuerySet of the friend requests received by the user,
+            newest first
+
+        The incoming method filters and orders on the columns of the
+        (receiver, status, created) index so the inbox is read in index order.
+        """
+        return self.on_replica().filter(receiver=user)._with_status(status)._newest_first()
+
+    def outgoing(
+        self,
+        *,
+        user: settings.AUTH_USER_MODEL,
+        status: Optional[Union[str, Iterable[str]]]=None
+    ) -> RelationshipQuerySet:
+        """
+        Parameters:
+            user   -> The user who sent the friend requests
+            status -> An optional status, or iterable of statuses, the friend
+                      requests are limited to
+
+        Returns:
+            A chainable QuerySet of the friend requests sent by the user,
+            newest first
+
+        The outgoing method filters and orders on the columns of the
+        (sender, status, created) index so sent requests are read in index order.
+        """
+        return self.on_replica().filter(sender=user)._with_status(status)._newest_first()
+
+    def page(
+        self,
+        *,
+        cursor: Optional[str]=None,
+        limit: int=20
+    ) -> RelationshipPage:
+        """
+        Parameters:
+            cursor -> the cursor returned with the previous page, or None for
+                      the first page
+            limit  -> the maximum number of friend requests on the page
+
+        Returns:
+            A RelationshipPage holding the friend requests of the page and the
+            cursor of the following page
+
+        The page method paginates a newest first QuerySet by seeking past the
+        (created, uuid) key of the last request on the previous page, so every
+        page costs the same single query no matter how deep it is.
+        """
+        queryset = self._newest_first()
+
+        if cursor is not None:
+            created, pk = self._decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(created__lt=created) | Q(created=created, pk__lt=pk)
+            )
+
+        relationships = list(queryset[:limit + 1])
+
+        if len(relationships) <= limit:
+            return RelationshipPage(relationships, None)
+
+        relationships = relationships[:limit]
+
+        return RelationshipPage(
+            relationships,
+            self._encode_cursor(relationships[-1])
+        )
+
+    def mark_viewed(self) -> int:
+        """
+        Parameters:
+            None
+
+        Returns:
+            An integer representing the number of friend requests marked as viewed
+
+        The mark_viewed method moves every sent friend request in the QuerySet
+        to VIEWED with a single UPDATE. Rejected requests are left untouched.
+        """
+        return self._transition(
+            self.filter(status=self.model.RequestOptions.SENT),
+            self.model.RequestOptions.VIEWED
+        )
+
+    def reject(self) -> int:
+        """
+        Parameters:
+            None
+
+        Returns:
+            An integer representing the number of friend requests rejected
+
+        The reject method moves every friend request in the QuerySet that is
+        not rejected yet to REJECTED with a single UPDATE and decrements the
+        pending_incoming_count of their receivers in the same transaction.
+        """
+        self._read_for_write()
+
+        with transaction.atomic(using=self.db):
+            requests: List[Tuple] = list(
+                self.exclude(
+                    status=self.model.RequestOptions.REJECTED
+                ).exclude(
+                    sender=F('receiver')
+                ).select_for_update().values_list('pk', 'receiver', 'status')
+            )
+
+            if not requests:
+                return 0
+
+            rejected: int = self._transition(
+                self.model.objects.using(self.db).filter(pk__in=[pk for pk, _, _ in requests]),
+                self.model.RequestOptions.REJECTED
+            )
+
+            self._release_pending(requests)
+
+        return rejected
+
+    def cancel(self) -> int:
+        """
+        Parameters:
+            None
+
+        Returns:
+            An integer representing the number of friend requests cancelled
+
+        The cancel method removes every friend request in the QuerySet with a
+        single DELETE and decrements the pending_incoming_count of the
+        receivers of the pending ones in the same transaction.
+        """
+        deleted, _ = self.delete()
+
+        return deleted
+
+    def delete(self) -> Tuple[int, Dict[str, int]]:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A tuple holding the number of friend requests deleted and a
+            dictionary of that number per model, like QuerySet.delete
+
+        The delete method keeps the pending_incoming_count of the receivers
+        in step with every friend request deleted through the QuerySet or
+        through Relationship.delete.
+        """
+        self._read_for_write()
+
+        with transaction.atomic(using=self.db):
+            requests: List[Tuple] = list(
+                self.select_for_update().values_list('pk', 'receiver', 'status')
+            )
+
+            if not requests:
+                return 0, {}
+
+            return self._delete_requests(requests)
+
+    def _read_for_write(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The _read_for_write method routes the reads of a method that writes
+        the friend requests to the database they are written to, so the rows
+        it locks and counts are the rows it changes.
+        """
+        self._for_write = True
+
+    def _delete_requests(self, requests: List[Tuple]) -> Tuple[int, Dict[str, int]]:
+        """
+        Parameters:
+            requests -> the (pk, receiver, status) tuples of the locked friend
+                        requests being deleted
+
+        Returns:
+            A tuple holding the number of friend requests deleted and a
+            dictionary of that number per model
+        """
+        # the rows are deleted by primary key, so a request created since they
+        # were read is neither deleted nor left out of the counts
+        deleted = super(RelationshipQuerySet, self.model.objects.using(self.db).filter(
+            pk__in=[pk for pk, _, _ in requests]
+        )).delete()
+
+        self._release_pending(requests)
+
+        return deleted
+
+    def _release_pending(self, requests: Iterable[Tuple]) -> None:
+        """
+        Parameters:
+            requests -> the (pk, receiver, status) tuples of the friend
+                        requests that stopped being pending
+
+        Returns:
+            None
+        """
+        Profile = apps.get_model('accounts', 'Profile')
+
+        receivers: Counter = Counter(
+            receiver for _, receiver, status in requests
+            if status in self.model.PENDING_STATUSES
+        )
+
+        Profile.objects.using(self.db).adjust_counts(
+            'pending_incoming_count',
+            {receiver: -count for receiver, count in receivers.items()},
+            by='user'
+        )
+
+    @classmethod
+    def _pair_filters(
+        cls,
+        pairs: List[Tuple],
+        first: str,
+        second: str
+    ) -> Iterator[Q]:
+        # OR-ing the exact pairs reads only their rows, where filtering each
+        # column on its own reads every first and second combination
+        for start in range(0, len(pairs), cls.PAIR_BATCH_SIZE):
+            yield reduce(or_, (
+                Q(**{first: first_value, second: second_value})
+                for first_value, second_value in pairs[start:start + cls.PAIR_BATCH_SIZE]
+            ))
+
+    @staticmethod
+    def _transition(
+        queryset: RelationshipQuerySet,
+        status: str
+    ) -> int:
+        # comparing the raw columns keeps the sender and receiver from being loaded
+        return queryset.exclude(
+            sender=F('receiver')
+        ).update(
+            status=status,
+            modified=timezone.now()
+        )
+
+    def _with_status(
+        self,
+        status: Optional[Union[str, Iterable[str]]]
+    ) -> RelationshipQuerySet:
+        if status is None:
+            return self
+
+        if isinstance(status, str):
+            return self.filter(status=status)
+
+        return self.filter(status__in=list(status))
+
+    def _newest_first(self) -> RelationshipQuerySet:
+        return self.order_by('-created', '-pk')
+
+    @staticmethod
+    def _encode_cursor(relationship: models.Model) -> str:
+        return urlsafe_base64_encode(
+            f'{relationship.created.isoformat()}|{relationship.pk}'.encode()
+        )
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        try:
+            created, pk = urlsafe_base64_decode(cursor).decode().split('|')
+            return datetime.fromisoformat(created), UUID(pk)
+        except ValueError as error:
+            raise AccountsException('The pagination cursor is invalid') from error
+
+    def find_pairs(
+        self,
+        *,
+        pairs: Iterable[Tuple[settings.AUTH_USER_MODEL, settings.AUTH_USER_MODEL]],
+        status: Optional[Union[str, Iterable[str]]]=None
+    ) -> RelationshipQuerySet:
+        """
+        Parameters:
+            pairs  -> an iterable of (sender, receiver) tuples, given either as
+                      users or as user primary keys
+            status -> An optional status, or iterable of statuses, the friend
+                      requests are limited to
+
+        Returns:
+            A chainable QuerySet representing every Relationship instance that
+            matches one of the requested (sender, receiver) pairs
+
+        The find_pairs method reads the primary keys of the exact pairs
+        requested, PAIR_BATCH_SIZE pairs per query, so the final QuerySet is a
+        simple primary key lookup and no other request of the senders or the
+        receivers is read.
+        """
+        wanted = list({
+            (getattr(sender, 'pk', sender), getattr(receiver, 'pk', receiver))
+            for sender, receiver in pairs
+        })
+
+        if not wanted:
+            return self.none()
+
+        queryset = self._with_status(status)
+
+        return self.filter(
+            pk__in=[
+                pk
+                for batch in self._pair_filters(wanted, 'sender', 'receiver')
+                for pk in queryset.filter(batch).values_list('pk', flat=True)
+            ]
+        )
+
+    def accept_all(
+        self,
+        *,
+        batch_size: int=1000
+    ) -> int:
+        """
+        Parameters:
+            batch_size -> the number of friends through table rows inserted
+                          per INSERT statement
+
+        Returns:
+            An integer representing the number of friend requests accepted
+
+        The accept_all method finalizes every friend request in the QuerySet
+        inside a single transaction. Both directions of each friendship are
+        written to the Profile.friends through table with set-based inserts,
+        the affected profiles are touched with one UPDATE and the accepted
+        requests are removed with one DELETE. The affected profiles are
+        locked first, so the friend_count of each profile is incremented
+        once per friendship that did not exist yet, and the
+        pending_incoming_count of the receivers is decremented.
+        """
+        Profile = apps.get_model('accounts', 'Profile')
+        Friends = Profile.friends.through
+
+        self._read_for_write()
+
+        with transaction.atomic(using=self.db):
+            requests: List[Tuple] = list(
+                self.values_list('pk', 'sender', 'receiver', 'status')
+            )
+
+            if not requests:
+                return 0
+
+            user_ids = {
+                user_id
+                for _, sender, receiver, _ in requests
+                for user_id in (sender, receiver)
+            }
+
+            # the profiles are locked in a fixed order to avoid deadlocks
+            profiles = dict(
+                Profile.objects.using(self.db).select_for_update().filter(
+                    user__in=user_ids
+                ).order_by('pk').values_list('user', 'pk')
+            )
+
+            rows = {}
+            for _, sender, receiver, _ in requests:
+                sender_profile   = profiles[sender]
+                receiver_profile = profiles[receiver]
+
+                rows[(sender_profile, receiver_profile)] = Friends(
+                    from_profile_id=sender_profile,
+                    to_profile_id=receiver_profile
+                )
+                rows[(receiver_profile, sender_profile)] = Friends(
+                    from_profile_id=receiver_profile,
+                    to_profile_id=sender_profile
+                )
+
+            existing = {
+                row
+                for batch in self._pair_filters(list(rows), 'from_profile', 'to_profile')
+                for row in Friends.objects.using(self.db).filter(batch).values_list('from_profile', 'to_profile')
+            }
+            rows = {key: row for key, row in rows.items() if key not in existing}
+
+            Friends.objects.using(self.db).bulk_create(
+                rows.values(),
+                batch_size=batch_size,
+                ignore_conflicts=True
+            )
+
+            Profile.objects.using(self.db).filter(
+                pk__in=profiles.values()
+            ).update(modified=timezone.now())
+
+            Profile.objects.using(self.db).adjust_counts(
+                'friend_count',
+                Counter(from_profile for from_profile, _ in rows)
+            )
+
+            self._delete_requests([
+                (pk, receiver, status) for pk, _, receiver, status in requests
+            ])
+
+        # the bulk insert bypasses the m2m_changed signal
+        FriendIndex.invalidate(profiles.values(), using=self.db)
+
+        return len(requests)
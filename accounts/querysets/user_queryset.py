@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from django.db        import models
-from django.db.models import Q
+from django.db.models           import Q
+from django.db.models.functions import Lower
+from typing                     import Tuple
 
+from core.querysets.replica_queryset import ReplicaQuerySet
 
-class UserQuerySet(models.QuerySet):
+
+def split_login(identifier: str) -> Tuple[str, str]:
+    """
+    Parameters:
+        identifier -> the username or email address entered when logging in
+
+    Returns:
+        A tuple of the user field the identifier refers to and the
+        normalized value it is matched against
+    """
+    field: str = 'email' if '@' in identifier else 'username'
+
+    return field, identifier.strip().lower()
+
+
+class UserQuerySet(ReplicaQuerySet):
 
     def find(
         self,
@@ -12,6 +29,31 @@ class UserQuerySet(models.QuerySet):
         username: str,
         email: str
     ) -> UserQuerySet:
-        return self.filter(
+        return self.on_replica().filter(
             Q(username=username) | Q(email=email)
         )
+
+    def find_by_login(
+        self,
+        *,
+        identifier: str
+    ) -> UserQuerySet:
+        """
+        Parameters:
+            identifier -> the username or email address entered when logging in
+
+        Returns:
+            A chainable, unordered QuerySet matching at most one user
+
+        The find_by_login method decides whether the identifier is an email
+        address or a username and filters on the lower-cased value of only
+        that column, so the lookup is answered by a single functional index
+        instead of an OR across two columns.
+        """
+        field, login = split_login(identifier)
+
+        return self.annotate(
+            login=Lower(field)
+        ).filter(
+            login=login
+        ).order_by()
@@ -0,0 +1,46 @@
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch          import receiver
+from typing                   import Optional, Set
+from uuid                     import UUID
+
+from accounts.indexes.block_index import BlockIndex
+from accounts.models.profile      import Profile
+
+
+@receiver(m2m_changed, sender=Profile.blocks.through)
+def invalidate_block_index(
+    sender: type,
+    instance: Profile,
+    action: str,
+    pk_set: Optional[Set[UUID]],
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The invalidate_block_index receiver drops the cached block sets of both
+    sides of every block added to or removed from a profile. Clearing a
+    block list is handled before the rows are removed so the formerly
+    blocked users can still be found.
+    """
+    if action in ('post_add', 'post_remove'):
+        profiles = Profile.objects.filter(pk__in=pk_set)
+    elif action == 'pre_clear':
+        profiles = instance.blocks.all()
+    else:
+        return
+
+    BlockIndex.invalidate({instance.user_id, *profiles.values_list('user', flat=True)}, using=using)
+
+
+@receiver(pre_delete, sender=Profile)
+def invalidate_deleted_profile_blocks(
+    sender: type,
+    instance: Profile,
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The invalidate_deleted_profile_blocks receiver drops the cached block
+    sets of a profile that is about to be deleted and of everyone it blocks.
+    """
+    BlockIndex.invalidate({instance.user_id, *instance.blocks.values_list('user', flat=True)}, using=using)
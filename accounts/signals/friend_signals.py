@@ -0,0 +1,91 @@
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch          import receiver
+from typing                   import Optional, Set
+from uuid                     import UUID
+
+from accounts.indexes.friend_index import FriendIndex
+from accounts.models.profile       import Profile
+
+
+@receiver(m2m_changed, sender=Profile.friends.through)
+def invalidate_friend_index(
+    sender: type,
+    instance: Profile,
+    action: str,
+    pk_set: Optional[Set[UUID]],
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The invalidate_friend_index receiver drops the cached adjacency entries
+    of both sides of every friendship added to or removed from a profile.
+    Clearing a friends list is handled before the rows are removed so the
+    former friends can still be found.
+    """
+    if action in ('post_add', 'post_remove'):
+        FriendIndex.invalidate({instance.pk, *pk_set}, using=using)
+    elif action == 'pre_clear':
+        FriendIndex.invalidate({instance.pk, *instance.friends.values_list('pk', flat=True)}, using=using)
+
+
+@receiver(pre_delete, sender=Profile)
+def invalidate_deleted_profile(
+    sender: type,
+    instance: Profile,
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The invalidate_deleted_profile receiver drops the cached adjacency entries
+    of a profile that is about to be deleted and of all of its friends.
+    """
+    FriendIndex.invalidate({instance.pk, *instance.friends.values_list('pk', flat=True)}, using=using)
+
+
+@receiver(m2m_changed, sender=Profile.friends.through)
+def count_friends(
+    sender: type,
+    instance: Profile,
+    action: str,
+    pk_set: Optional[Set[UUID]],
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The count_friends receiver adjusts the friend_count of both sides of
+    every friendship added to or removed from a profile through its friends
+    manager. The friendships being removed are read before the rows are
+    deleted, so profiles that were not friends are not counted.
+    """
+    if action == 'post_add':
+        friends, delta = pk_set, 1
+    elif action == 'pre_remove':
+        friends, delta = set(instance.friends.using(using).filter(pk__in=pk_set).values_list('pk', flat=True)), -1
+    elif action == 'pre_clear':
+        friends, delta = set(instance.friends.using(using).values_list('pk', flat=True)), -1
+    else:
+        return
+
+    if friends:
+        Profile.objects.db_manager(using).adjust_counts(
+            'friend_count',
+            {**{pk: delta for pk in friends}, instance.pk: delta * len(friends)}
+        )
+
+
+@receiver(pre_delete, sender=Profile)
+def uncount_deleted_profile(
+    sender: type,
+    instance: Profile,
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The uncount_deleted_profile receiver decrements the friend_count of every
+    friend of a profile that is about to be deleted, since the cascade
+    removes their friendship rows without going through the friends manager.
+    """
+    Profile.objects.db_manager(using).adjust_counts(
+        'friend_count',
+        {pk: -1 for pk in instance.friends.using(using).values_list('pk', flat=True)}
+    )
@@ -0,0 +1,21 @@
+from django.db.models.signals import pre_delete
+from django.dispatch          import receiver
+
+from accounts.models.relationship import Relationship
+from accounts.models.user         import User
+
+
+@receiver(pre_delete, sender=User)
+def delete_sent_relationships(
+    sender: type,
+    instance: User,
+    using: str,
+    **kwargs: dict
+) -> None:
+    """
+    The delete_sent_relationships receiver deletes the friend requests sent
+    by a user who is about to be deleted through RelationshipQuerySet.delete,
+    so the pending_incoming_count of their receivers is decremented before
+    the cascade would remove the requests without it.
+    """
+    Relationship.objects.using(using).filter(sender=instance).delete()
@@ -0,0 +1,317 @@
+import logging
+
+from django.conf         import settings
+from django.contrib.auth import authenticate
+from django.test         import TestCase, override_settings
+from django.utils        import timezone
+from typing              import Optional
+
+from accounts.backends.authentication_cache import AuthenticationCache
+from accounts.models.user                   import User
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestAccountsBackend(TestCase):
+    """
+    The TestAccountsBackend class handles any necessary testing of the
+    AccountsBackend authentication backend.
+    """
+
+    _test_user: Optional[User] = None
+    _test_name: Optional[str]  = None
+
+    def setUp(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The setUp method generates the test user used in the
+        undermentioned methods.
+        """
+        try:
+            self._test_user = User.create_user(
+                email='test@test.com',
+                username='Test_User',
+                password='abc12321cba'
+            )
+        except Exception as error:
+            logger.exception('Failed Initialization of the Test Class')
+            self.fail()
+
+    def test_authenticate_with_username(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_authenticate_with_username method assures a user can log
+        in with their username in any case using a single query.
+        """
+        self._test_name = 'Test Authenticate With Username'
+        try:
+            with self.assertNumQueries(1):
+                user: Optional[User] = authenticate(username='test_user', password='abc12321cba')
+
+            self.assertEqual(user, self._test_user)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_authenticate_with_email(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_authenticate_with_email method assures a user can log
+        in with their email address in any case using a single query.
+        """
+        self._test_name = 'Test Authenticate With Email'
+        try:
+            with self.assertNumQueries(1):
+                user: Optional[User] = authenticate(username='TEST@test.com', password='abc12321cba')
+
+            self.assertEqual(user, self._test_user)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_authenticate_with_wrong_password(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_authenticate_with_wrong_password method assures an
+        incorrect password is rejected.
+        """
+        self._test_name = 'Test Authenticate With Wrong Password'
+        try:
+            self.assertIsNone(
+                authenticate(username='Test_User', password='wrong password')
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+
+    def test_authenticate_banned_user(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_authenticate_banned_user method assures a banned user
+        cannot log in even with the correct password.
+        """
+        self._test_name = 'Test Authenticate Banned User'
+        try:
+            self._test_user.ban()
+
+            self.assertIsNone(
+                authenticate(username='test@test.com', password='abc12321cba')
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #4 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #4 - {self._test_name}')
+
+    def test_authenticate_unknown_user(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_authenticate_unknown_user method assures an identifier
+        matching no user is rejected.
+        """
+        self._test_name = 'Test Authenticate Unknown User'
+        try:
+            self.assertIsNone(
+                authenticate(username='nobody', password='abc12321cba')
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #5 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #5 - {self._test_name}')
+
+    @override_settings(AUTHENTICATION_CACHE_MISSES=True)
+    def test_unknown_user_is_rejected_from_the_cache(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_unknown_user_is_rejected_from_the_cache method assures
+        repeated attempts for an unknown identifier do not reach the database
+        and that the identifier becomes usable once the user signs up.
+        """
+        self._test_name = 'Test Unknown User is Rejected From the Cache'
+        try:
+            self.assertIsNone(authenticate(username='newcomer', password='abc12321cba'))
+
+            with self.assertNumQueries(0):
+                self.assertIsNone(authenticate(username='NEWCOMER', password='abc12321cba'))
+
+            newcomer: User = User.create_user(
+                email='newcomer@test.com',
+                username='newcomer',
+                password='abc12321cba'
+            )
+
+            self.assertEqual(
+                authenticate(username='newcomer', password='abc12321cba'),
+                newcomer
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #6 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #6 - {self._test_name}')
+
+    def test_banning_invalidates_the_cache(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_banning_invalidates_the_cache method assures banning and
+        unbanning take effect immediately and that repeated attempts for a
+        banned user do not reach the database.
+        """
+        self._test_name = 'Test Banning Invalidates the Cache'
+        try:
+            self.assertIsNotNone(authenticate(username='Test_User', password='abc12321cba'))
+
+            self._test_user.ban()
+
+            self.assertIsNone(authenticate(username='Test_User', password='abc12321cba'))
+
+            with self.assertNumQueries(0):
+                self.assertIsNone(authenticate(username='Test_User', password='abc12321cba'))
+
+            self._test_user.unban()
+
+            self.assertEqual(
+                authenticate(username='Test_User', password='abc12321cba'),
+                self._test_user
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #7 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #7 - {self._test_name}')
+
+    def test_changing_password_invalidates_the_cache(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_changing_password_invalidates_the_cache method assures only
+        the new password is accepted after a password change.
+        """
+        self._test_name = 'Test Changing Password Invalidates the Cache'
+        try:
+            self.assertIsNotNone(authenticate(username='Test_User', password='abc12321cba'))
+
+            self._test_user.set_password('new password')
+            self._test_user.save()
+
+            self.assertIsNone(authenticate(username='Test_User', password='abc12321cba'))
+            self.assertEqual(
+                authenticate(username='Test_User', password='new password'),
+                self._test_user
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #8 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #8 - {self._test_name}')
+
+    def test_logging_in_keeps_the_cache(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_logging_in_keeps_the_cache method assures saving last_login,
+        as every login does, keeps the cached entry of the user, while
+        changing the username removes the entries of the old and new logins.
+        """
+        self._test_name = 'Test Logging In Keeps the Cache'
+        try:
+            self.assertIsNotNone(authenticate(username='Test_User', password='abc12321cba'))
+
+            self._test_user.last_login = timezone.now()
+            self._test_user.save(update_fields=['last_login'])
+
+            self.assertIsNot(AuthenticationCache.get('Test_User'), AuthenticationCache.MISSING)
+
+            self._test_user.username = 'Renamed_User'
+            self._test_user.save()
+
+            self.assertIs(AuthenticationCache.get('Test_User'), AuthenticationCache.MISSING)
+            self.assertIsNone(authenticate(username='Test_User', password='abc12321cba'))
+            self.assertEqual(
+                authenticate(username='Renamed_User', password='abc12321cba'),
+                self._test_user
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #9 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #9 - {self._test_name}')
+
+    def test_unknown_users_are_not_cached_in_process_memory(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_unknown_users_are_not_cached_in_process_memory method
+        assures unknown logins are not cached with the per-process cache the
+        settings default to, so another worker never rejects a new signup.
+        """
+        self._test_name = 'Test Unknown Users are not Cached in Process Memory'
+        try:
+            self.assertFalse(settings.AUTHENTICATION_CACHE_MISSES)
+
+            self.assertIsNone(authenticate(username='stranger', password='abc12321cba'))
+            self.assertIs(AuthenticationCache.get('stranger'), AuthenticationCache.MISSING)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #10 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #10 - {self._test_name}')
@@ -0,0 +1,222 @@
+import logging
+import psycopg2
+
+from django.db                          import connections
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
+from django.test                        import SimpleTestCase
+from psycopg2.pool                      import PoolError
+from types                              import SimpleNamespace
+from typing                             import List, Optional
+from unittest                           import mock
+
+from core.db.backends.postgresql.base import DatabaseWrapper, _pools
+
+logger = logging.getLogger('accounts.tests')
+
+
+class FakeConnection:
+    """
+    The FakeConnection class stands in for a psycopg2 connection, so the pool
+    and the health checks run without a PostgreSQL server. A broken
+    connection fails every statement the way a dropped one does.
+    """
+
+    def __init__(self) -> None:
+        self.closed         : int  = 0
+        self.broken         : bool = False
+        self.autocommit     : bool = True
+        self.isolation_level       = None
+        self.info                  = SimpleNamespace(
+            transaction_status=psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        )
+
+    def cursor(self) -> 'FakeConnection':
+        return self
+
+    def __enter__(self) -> 'FakeConnection':
+        return self
+
+    def __exit__(self, *args: tuple) -> None:
+        pass
+
+    def set_client_encoding(self, encoding: str) -> None:
+        pass
+
+    def get_parameter_status(self, parameter: str) -> str:
+        return 'UTC'
+
+    def execute(self, sql: str, params: Optional[tuple]=None) -> None:
+        if self.broken:
+            raise psycopg2.OperationalError('server closed the connection unexpectedly')
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = 1
+
+
+class TestPostgreSQLBackend(SimpleTestCase):
+    """
+    The TestPostgreSQLBackend class handles any necessary testing of the
+    connection pool and the health checks of the extended PostgreSQL
+    backend.
+    """
+
+    _test_name: Optional[str] = None
+
+    alias: str = 'pool_test'
+
+    def setUp(self) -> None:
+        self.opened: List[FakeConnection] = []
+
+        def open_connection(wrapper: PostgreSQLDatabaseWrapper, conn_params: dict) -> FakeConnection:
+            self.opened.append(FakeConnection())
+            return self.opened[-1]
+
+        # the connections the pool would open on the server are fakes
+        patcher = mock.patch.object(
+            PostgreSQLDatabaseWrapper,
+            'get_new_connection',
+            autospec=True,
+            side_effect=open_connection
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_pools.pop, self.alias, None)
+
+    def _wrapper(self, *, max_size: int=2, health_checks: bool=True) -> DatabaseWrapper:
+        return DatabaseWrapper(
+            {
+                **connections['default'].settings_dict,
+                'ENGINE'            : 'core.db.backends.postgresql',
+                'CONN_HEALTH_CHECKS': health_checks,
+                'POOL'              : {'MIN_SIZE': 0, 'MAX_SIZE': max_size},
+                'OPTIONS'           : {},
+            },
+            alias=self.alias
+        )
+
+    def test_closed_connections_return_to_the_pool(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_closed_connections_return_to_the_pool method assures closing
+        a connection hands it back to the pool, where the next checkout
+        reuses it, that the connections of every wrapper of an alias share
+        one pool and that the pool never opens more than MAX_SIZE of them.
+        """
+        self._test_name = 'Test Closed Connections Return to the Pool'
+        try:
+            first  = self._wrapper()
+            second = self._wrapper()
+
+            first.connect()
+            connection = first.connection
+
+            first.close()
+
+            self.assertIsNone(first.connection)
+            self.assertFalse(connection.closed)
+
+            first.connect()
+            second.connect()
+
+            self.assertIs(first.connection, connection)
+            self.assertIsNot(second.connection, connection)
+            self.assertEqual(len(self.opened), 2)
+
+            with self.assertRaises(PoolError):
+                self._wrapper().connect()
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_dropped_pooled_connections_are_replaced(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_dropped_pooled_connections_are_replaced method assures a
+        pooled connection the server dropped is discarded when it is checked
+        out, and that it is handed out unchecked without health checks.
+        """
+        self._test_name = 'Test Dropped Pooled Connections are Replaced'
+        try:
+            wrapper = self._wrapper()
+
+            wrapper.connect()
+            dropped = wrapper.connection
+            wrapper.close()
+
+            dropped.broken = True
+            wrapper.connect()
+
+            self.assertIsNot(wrapper.connection, dropped)
+            self.assertTrue(dropped.closed)
+            self.assertEqual(len(self.opened), 2)
+
+            wrapper.connection.broken = True
+            wrapper.settings_dict['CONN_HEALTH_CHECKS'] = False
+            wrapper.close()
+            wrapper.connect()
+
+            self.assertTrue(wrapper.connection.broken)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_persistent_connections_are_checked_once_per_request(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_persistent_connections_are_checked_once_per_request method
+        assures a persistent connection is pinged before its first use in a
+        request only, and replaced when the server has dropped it.
+        """
+        self._test_name = 'Test Persistent Connections are Checked Once Per Request'
+        try:
+            wrapper = self._wrapper(max_size=0)
+
+            wrapper.connect()
+            stale = wrapper.connection
+
+            with mock.patch.object(PostgreSQLDatabaseWrapper, 'close_if_unusable_or_obsolete'), \
+                 mock.patch.object(wrapper, 'is_usable', side_effect=[True, False]) as is_usable:
+                # a new connection needs no check in the request that opened it
+                wrapper.ensure_connection()
+                self.assertEqual(is_usable.call_count, 0)
+
+                wrapper.close_if_unusable_or_obsolete()
+                wrapper.ensure_connection()
+                wrapper.ensure_connection()
+
+                self.assertEqual(is_usable.call_count, 1)
+                self.assertIs(wrapper.connection, stale)
+
+                wrapper.close_if_unusable_or_obsolete()
+                wrapper.ensure_connection()
+
+                self.assertEqual(is_usable.call_count, 2)
+                self.assertIsNot(wrapper.connection, stale)
+                self.assertTrue(stale.closed)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
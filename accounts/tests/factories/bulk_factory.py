@@ -0,0 +1,133 @@
+import factory
+
+from django.db import models
+from itertools import islice, repeat
+from typing    import Iterable, Iterator, List, Optional
+
+
+class BulkFactory(factory.django.DjangoModelFactory):
+    """
+    The BulkFactory class adds a bulk mode to the model factories. Objects
+    are built in memory by the factory declarations and flushed with one
+    bulk INSERT per batch, so neither save nor django_get_or_create runs
+    for them. Foreign keys can be given as raw ids through their attname,
+    such as sender_id, which skips their SubFactory.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def bulk_create_batches(
+        cls,
+        rows: Iterable[dict],
+        *,
+        batch_size: int=1000,
+        using: Optional[str]=None,
+        ignore_conflicts: bool=False
+    ) -> Iterator[List[models.Model]]:
+        """
+        Parameters:
+            rows             -> an iterable of dictionaries holding the
+                                declarations overridden for each object
+            batch_size       -> the number of objects inserted per batch
+            using            -> the database the objects are inserted in
+            ignore_conflicts -> whether rows violating a unique constraint
+                                are skipped
+
+        Returns:
+            A generator yielding the objects of each batch once it is
+            inserted, which keeps a single batch in memory at a time
+        """
+        manager = cls._meta.model._default_manager.db_manager(using)
+        rows    = iter(rows)
+
+        while True:
+            batch: List[models.Model] = [cls._bulk_build(dict(row)) for row in islice(rows, batch_size)]
+            if not batch:
+                break
+
+            cls._bulk_prepare(batch)
+
+            manager.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+
+            cls._bulk_created(batch, using=manager.db)
+
+            yield batch
+
+    @classmethod
+    def bulk_create_rows(
+        cls,
+        rows: Iterable[dict],
+        **options: dict
+    ) -> int:
+        """
+        Parameters:
+            rows      -> an iterable of dictionaries holding the declarations
+                         overridden for each object
+            **options -> the batch_size, using and ignore_conflicts options of
+                         bulk_create_batches
+
+        Returns:
+            An integer representing the number of objects inserted, without
+            keeping any of them in memory
+        """
+        return sum(len(batch) for batch in cls.bulk_create_batches(rows, **options))
+
+    @classmethod
+    def bulk_create_batch(
+        cls,
+        size: int,
+        *,
+        batch_size: int=1000,
+        using: Optional[str]=None,
+        **kwargs: dict
+    ) -> List[models.Model]:
+        """
+        Parameters:
+            size       -> the number of objects created
+            batch_size -> the number of objects inserted per batch
+            using      -> the database the objects are inserted in
+            **kwargs   -> the declarations overridden for every object
+
+        Returns:
+            A list holding the created objects
+
+        The bulk_create_batch class method is the bulk mode counterpart of
+        create_batch.
+        """
+        return [
+            instance
+            for batch in cls.bulk_create_batches(repeat(kwargs, size), batch_size=batch_size, using=using)
+            for instance in batch
+        ]
+
+    @classmethod
+    def _bulk_build(cls, row: dict) -> models.Model:
+        # a raw foreign key id replaces the object its SubFactory would build
+        ids = {
+            field: row.pop(field.attname)
+            for field in cls._meta.model._meta.concrete_fields
+            if field.is_relation and field.attname != field.name and field.attname in row
+        }
+
+        instance = cls.build(**row, **{field.name: None for field in ids})
+
+        for field, value in ids.items():
+            setattr(instance, field.attname, value)
+
+        return instance
+
+    @classmethod
+    def _bulk_prepare(cls, batch: List[models.Model]) -> None:
+        """
+        The _bulk_prepare class method lets a factory do the work save
+        would have done on the objects of a batch before they are inserted.
+        """
+
+    @classmethod
+    def _bulk_created(cls, batch: List[models.Model], *, using: str) -> None:
+        """
+        The _bulk_created class method lets a factory insert the rows save
+        would have created alongside the objects of a batch.
+        """
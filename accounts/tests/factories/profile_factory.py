@@ -1,14 +1,20 @@
 import factory
 
-from faker import Factory
+from django.db import router, transaction
+from faker     import Factory
+from itertools import islice
+from typing    import Iterable, List, Optional, Set, Tuple
+from uuid      import UUID
 
+from accounts.indexes.friend_index         import FriendIndex
 from accounts.models.profile               import Profile
+from accounts.tests.factories.bulk_factory import BulkFactory
 from accounts.tests.factories.user_factory import UserFactory
 
 faker = Factory.create()
 
 
-class ProfileFactory(factory.django.DjangoModelFactory):
+class ProfileFactory(BulkFactory):
 
     class Meta:
         model                = Profile
@@ -17,3 +23,69 @@ class ProfileFactory(factory.django.DjangoModelFactory):
         )
 
     user = factory.SubFactory(UserFactory)
+
+    @classmethod
+    def bulk_create_friendships(
+        cls,
+        pairs: Iterable[Tuple],
+        *,
+        batch_size: int=1000,
+        using: Optional[str]=None
+    ) -> int:
+        """
+        Parameters:
+            pairs      -> an iterable of (profile id, profile id) tuples of
+                          the profiles becoming friends
+            batch_size -> the number of friendships inserted per batch
+            using      -> the database the friendships are inserted in
+
+        Returns:
+            An integer representing the number of friendships given
+
+        The bulk_create_friendships class method writes both directions of
+        every friendship to the Profile.friends through table in batches,
+        skipping the friendships that already exist. The bulk insert bypasses
+        the m2m_changed signal, so the friend_count of every profile involved
+        is recounted and its cached friends are invalidated afterwards.
+        """
+        Friends  = Profile.friends.through
+        database = using or router.db_for_write(Friends)
+        pairs    = iter(pairs)
+
+        created : int       = 0
+        touched : Set[UUID] = set()
+        with transaction.atomic(using=database):
+            while True:
+                batch: List[Tuple] = list(islice(pairs, batch_size))
+                if not batch:
+                    break
+
+                Friends.objects.using(database).bulk_create(
+                    [
+                        Friends(from_profile_id=from_profile, to_profile_id=to_profile)
+                        for pair in batch
+                        for from_profile, to_profile in (pair, pair[::-1])
+                    ],
+                    batch_size=batch_size,
+                    ignore_conflicts=True
+                )
+
+                created += len(batch)
+                touched.update(profile for pair in batch for profile in pair)
+
+            profile_ids: List[UUID] = sorted(touched)
+            for index in range(0, len(profile_ids), batch_size):
+                profiles: List[Profile] = list(
+                    Profile.objects.using(database).filter(
+                        pk__in=profile_ids[index:index + batch_size]
+                    ).with_actual_counts().only('pk', 'friend_count')
+                )
+
+                for profile in profiles:
+                    profile.friend_count = profile.actual_friend_count
+
+                Profile.objects.using(database).bulk_update(profiles, ['friend_count'])
+
+        FriendIndex.invalidate(touched, using=database)
+
+        return created
@@ -1,15 +1,17 @@
 import factory
 
-from faker import Factory
+from django.apps import apps
+from faker       import Factory
+from typing      import List
 
 from accounts.models.relationship          import Relationship
+from accounts.tests.factories.bulk_factory import BulkFactory
 from accounts.tests.factories.user_factory import UserFactory
 
 faker = Factory.create()
 
 
-class RelationshipFactory(factory.django.DjangoModelFactory):
-
+class RelationshipFactory(BulkFactory):
 
     class Meta:
         model                = Relationship
@@ -20,3 +22,21 @@ class RelationshipFactory(factory.django.DjangoModelFactory):
 
     sender   = factory.SubFactory(UserFactory)
     receiver = factory.SubFactory(UserFactory)
+
+    @classmethod
+    def _bulk_created(cls, batch: List[Relationship], *, using: str) -> None:
+        Profile = apps.get_model('accounts', 'Profile')
+
+        # Relationship.save counts every pending request against its
+        # receiver, and the counts are taken from the table rather than the
+        # batch because ignore_conflicts may have skipped some of its rows
+        profiles: List[Profile] = list(
+            Profile.objects.using(using).filter(
+                user__in={relationship.receiver_id for relationship in batch}
+            ).with_actual_counts().only('pk', 'pending_incoming_count')
+        )
+
+        for profile in profiles:
+            profile.pending_incoming_count = profile.actual_pending_incoming_count
+
+        Profile.objects.using(using).bulk_update(profiles, ['pending_incoming_count'])
@@ -1,13 +1,18 @@
 import factory
 
-from faker import Factory
+from django.apps                 import apps
+from django.contrib.auth.hashers import make_password
+from faker                       import Factory
+from typing                      import List
 
-from accounts.models.user import User
+from accounts.hashers.password_executor    import get_password_executor
+from accounts.models.user                  import User
+from accounts.tests.factories.bulk_factory import BulkFactory
 
 faker = Factory.create()
 
 
-class UserFactory(factory.django.DjangoModelFactory):
+class UserFactory(BulkFactory):
     """
     The UserFactory class will simplify making User instances
     during the execution of test cases.
@@ -28,3 +33,31 @@ class UserFactory(factory.django.DjangoModelFactory):
     username = factory.Sequence(lambda n: 'user_%d' % n)
     email    = factory.Sequence(lambda n: 'user_%d@test.com' % n)
     password = factory.Sequence(lambda n: 'password_%d' % n)
+
+    @classmethod
+    def _bulk_prepare(cls, batch: List[User]) -> None:
+        # a password of None skips the hashing, leaving the user unable to log in
+        users = [user for user in batch if user.password is not None]
+
+        passwords = get_password_executor().hash_many(
+            user.password for user in users
+        )
+
+        for user, password in zip(users, passwords):
+            user.password = password
+
+        # one unusable password per batch spares a random string per user
+        unusable = make_password(None)
+        for user in batch:
+            if user.password is None:
+                user.password = unusable
+
+    @classmethod
+    def _bulk_created(cls, batch: List[User], *, using: str) -> None:
+        Profile = apps.get_model('accounts', 'Profile')
+
+        # User.save creates the profile of every new user
+        Profile.objects.using(using).bulk_create(
+            Profile(user=user)
+            for user in batch
+        )
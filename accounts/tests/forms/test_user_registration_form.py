@@ -5,6 +5,7 @@ from typing      import Optional
 
 from accounts.exception                    import AccountsException
 from accounts.forms.user_registration_form import UserRegistrationForm
+from accounts.models.user                  import User
 
 logger = logging.getLogger('accounts.tests')
 
@@ -246,6 +247,61 @@ class TestUserRegistrationForm(TestCase):
             self.fail()
         else:
             logger.info(f'Completed Test #9 - {self._test_name}')
-            
 
+    def test_username_with_at_sign_is_rejected(self) -> None:
+        self._test_name = 'Test Username With At Sign Is Rejected'
+        try:
+            self._test_user_registration_form = UserRegistrationForm(
+                data={
+                    'username'             : 'test@user',
+                    'first_name'           : 'Raymond',
+                    'last_name'            : 'Sutton',
+                    'email'                : 'test@test.com',
+                    'password'             : 'abc12321cba',
+                    'password_confirmation': 'abc12321cba'
+                }
+            )
+
+            self.assertFalse(self._test_user_registration_form.is_valid())
+
+            self.assertEqual(
+                self._test_user_registration_form.errors['username'],
+                ['Your username must not contain the @ character.']
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #10 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #10 - {self._test_name}')
+
+    def test_email_differing_only_by_case_is_rejected(self) -> None:
+        self._test_name = 'Test Email Differing Only By Case Is Rejected'
+        try:
+            User.create_user(
+                email='Raymond.Sutton@test.com',
+                username='raymond',
+                password='abc12321cba'
+            )
+
+            self._test_user_registration_form = UserRegistrationForm(
+                data={
+                    'username'             : 'test_user',
+                    'first_name'           : 'Raymond',
+                    'last_name'            : 'Sutton',
+                    'email'                : 'raymond.sutton@test.com',
+                    'password'             : 'abc12321cba',
+                    'password_confirmation': 'abc12321cba'
+                }
+            )
 
+            self.assertFalse(self._test_user_registration_form.is_valid())
+
+            self.assertEqual(
+                self._test_user_registration_form.errors['email'],
+                ['A user with that email address already exists.']
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #11 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #11 - {self._test_name}')
@@ -0,0 +1,112 @@
+import logging
+
+from django.contrib.auth.hashers import check_password
+from django.test                 import TestCase, override_settings
+from typing                      import List, Optional
+
+from accounts.hashers.password_executor import (
+    PasswordExecutor,
+    ProcessPoolPasswordExecutor,
+    get_password_executor
+)
+from accounts.tests.factories.user_factory import UserFactory
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestPasswordExecutor(TestCase):
+    """
+    The TestPasswordExecutor class handles any necessary testing of the
+    pluggable password hashing executors.
+    """
+
+    _test_passwords: List[str]     = [f'password_{index}' for index in range(20)]
+    _test_name     : Optional[str] = None
+
+    def test_process_pool_hashes_many_passwords_in_order(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_process_pool_hashes_many_passwords_in_order method assures
+        the batch API of the process pool executor returns one encoded
+        password per raw password in the order they were given.
+        """
+        self._test_name = 'Test Process Pool Hashes Many Passwords In Order'
+        executor = ProcessPoolPasswordExecutor(max_workers=2, chunksize=4)
+        try:
+            encoded: List[str] = executor.hash_many(self._test_passwords)
+
+            self.assertEqual(len(encoded), len(self._test_passwords))
+
+            for password, encoded_password in zip(self._test_passwords, encoded):
+                self.assertTrue(check_password(password, encoded_password))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+        finally:
+            executor.shutdown()
+
+    def test_executor_is_configured_in_settings(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_executor_is_configured_in_settings method assures the
+        executor is built from the PASSWORD_EXECUTOR setting and that user
+        passwords are hashed through it.
+        """
+        self._test_name = 'Test Executor is Configured in Settings'
+        try:
+            with override_settings(PASSWORD_EXECUTOR={
+                'BACKEND': 'accounts.hashers.password_executor.PasswordExecutor'
+            }):
+                self.assertIs(type(get_password_executor()), PasswordExecutor)
+
+                user = UserFactory()
+                user.set_password('abc12321cba')
+
+                self.assertTrue(user.check_password('abc12321cba'))
+
+            self.assertIs(type(get_password_executor()), ProcessPoolPasswordExecutor)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    async def test_executors_hash_and_check_without_blocking(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_executors_hash_and_check_without_blocking method assures
+        both executors can be awaited to hash and to verify passwords.
+        """
+        self._test_name = 'Test Executors Hash and Check Without Blocking'
+        executor = ProcessPoolPasswordExecutor(max_workers=2)
+        try:
+            for test_executor in (PasswordExecutor(), executor):
+                encoded: str = await test_executor.ahash('abc12321cba')
+
+                self.assertTrue(check_password('abc12321cba', encoded))
+                self.assertTrue(await test_executor.acheck('abc12321cba', encoded))
+                self.assertFalse(await test_executor.acheck('cba12321abc', encoded))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+        finally:
+            executor.shutdown()
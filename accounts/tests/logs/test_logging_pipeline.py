@@ -0,0 +1,91 @@
+import json
+import logging
+
+from django.test import SimpleTestCase
+from typing      import List, Optional
+
+from core.logs.json_formatter         import JsonFormatter
+from core.logs.queue_listener_handler import QueueListenerHandler
+
+logger = logging.getLogger('accounts.tests')
+
+
+class CollectingHandler(logging.Handler):
+    """
+    The CollectingHandler class keeps the formatted records it handles so the
+    tests can inspect what reached the end of the pipeline.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.lines: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+
+class TestLoggingPipeline(SimpleTestCase):
+    """
+    The TestLoggingPipeline class handles any necessary testing of the queued
+    and JSON formatted accounts logging pipeline.
+    """
+
+    _test_name: Optional[str] = None
+
+    def setUp(self) -> None:
+        self.target = CollectingHandler()
+        self.target.name = 'accounts_tests_target'
+        self.target.setFormatter(JsonFormatter())
+
+        self.handler = QueueListenerHandler(['accounts_tests_target'])
+
+        self.logger = logging.getLogger('accounts.tests.pipeline')
+        self.logger.addHandler(self.handler)
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def tearDown(self) -> None:
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+        self.target.close()
+
+    def _records(self) -> List[dict]:
+        # stopping the listener flushes every queued record
+        self.handler.close()
+
+        return [json.loads(line) for line in self.target.lines]
+
+    def test_records_are_written_as_json_by_the_listener(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_records_are_written_as_json_by_the_listener method assures
+        records are handed to the named handler through the queue and written
+        as JSON objects carrying their extra fields and traceback.
+        """
+        self._test_name = 'Test Records are Written as JSON by the Listener'
+        try:
+            self.logger.info('Created %s', 'profile', extra={'profile': 'user_1'})
+
+            try:
+                raise ValueError('invalid')
+            except ValueError:
+                self.logger.exception('Rejected profile')
+
+            records: List[dict] = self._records()
+
+            self.assertEqual(len(records), 2)
+            self.assertEqual(records[0]['message'], 'Created profile')
+            self.assertEqual(records[0]['level'], 'INFO')
+            self.assertEqual(records[0]['profile'], 'user_1')
+            self.assertIn('ValueError: invalid', records[1]['exception'])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
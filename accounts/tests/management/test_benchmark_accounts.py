@@ -0,0 +1,96 @@
+import json
+import logging
+import tempfile
+
+from django.core.management      import call_command
+from django.core.management.base import CommandError
+from django.test                 import TestCase
+from io                          import StringIO
+from typing                      import Optional
+
+from accounts.models.relationship import Relationship
+from accounts.models.user         import User
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestBenchmarkAccounts(TestCase):
+    """
+    The TestBenchmarkAccounts class runs the benchmark_accounts command
+    against a small graph in the SQLite test database.
+    """
+
+    _test_name: Optional[str] = None
+
+    def test_reports_every_scenario_as_json(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_reports_every_scenario_as_json method assures the benchmark
+        reports the queries and times of every scenario as JSON within the
+        default thresholds and leaves no rows behind.
+        """
+        self._test_name = 'Test Reports Every Scenario as JSON'
+        try:
+            output = StringIO()
+            call_command('benchmark_accounts', users=50, friends=3, calls=5, stdout=output)
+
+            report: dict = json.loads(output.getvalue())
+
+            self.assertEqual(set(report['results']), set(report['thresholds']))
+            self.assertEqual(report['regressions'], [])
+
+            for result in report['results'].values():
+                self.assertEqual(result['calls'], 5)
+                self.assertGreater(result['queries_per_call'], 0)
+
+            self.assertFalse(User.objects.exists())
+            self.assertFalse(Relationship.objects.exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_fails_on_regressions(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_fails_on_regressions method assures a scenario exceeding
+        the thresholds given in a JSON file is reported as a regression and
+        fails the command once the report is written.
+        """
+        self._test_name = 'Test Fails on Regressions'
+        try:
+            with tempfile.NamedTemporaryFile('w', suffix='.json') as thresholds, \
+                 tempfile.NamedTemporaryFile('r', suffix='.json') as output:
+                json.dump({'authenticate': {'queries_per_call': 0}}, thresholds)
+                thresholds.flush()
+
+                with self.assertRaises(CommandError):
+                    call_command(
+                        'benchmark_accounts',
+                        users=20,
+                        friends=2,
+                        calls=2,
+                        thresholds=thresholds.name,
+                        output=output.name
+                    )
+
+                report: dict = json.load(output)
+
+            self.assertEqual(len(report['regressions']), 1)
+            self.assertTrue(report['regressions'][0].startswith('authenticate queries_per_call'))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
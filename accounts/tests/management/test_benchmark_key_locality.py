@@ -0,0 +1,58 @@
+import logging
+
+from django.core.management import call_command
+from django.test            import TestCase
+from io                     import StringIO
+
+from accounts.models.profile      import Profile
+from accounts.models.relationship import Relationship
+from accounts.models.user         import User
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestBenchmarkKeyLocality(TestCase):
+    """
+    The TestBenchmarkKeyLocality class runs the benchmark_key_locality
+    command against the SQLite test database, which is the stand-in for
+    PostgreSQL used in CI.
+    """
+
+    def test_reports_every_key_kind(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_reports_every_key_kind method assures the benchmark reports
+        the graph insert and join rates, the request insert rate and the
+        primary key index pages of both key kinds and leaves no rows behind.
+        """
+        self._test_name = 'Test Reports Every Key Kind'
+        try:
+            output = StringIO()
+            call_command(
+                'benchmark_key_locality',
+                users=20,
+                friends=3,
+                joins=10,
+                requests=50,
+                stdout=output
+            )
+
+            report = output.getvalue()
+
+            self.assertIn('uuid4', report)
+            self.assertIn('time-ordered', report)
+            self.assertEqual(report.count('joins/s'), 2)
+            self.assertEqual(report.count('leaf pages'), 2)
+            self.assertFalse(User.objects.exists())
+            self.assertFalse(Profile.friends.through.objects.exists())
+            self.assertFalse(Relationship.objects.exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
@@ -0,0 +1,51 @@
+import logging
+
+from django.core.management import call_command
+from django.test            import TestCase
+from io                     import StringIO
+from typing                 import Optional
+
+from accounts.models.profile import Profile
+from accounts.models.user    import User
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestBenchmarkProfileCreation(TestCase):
+    """
+    The TestBenchmarkProfileCreation class runs the benchmark_profile_creation
+    command against the SQLite test database.
+    """
+
+    _test_name: Optional[str] = None
+
+    def test_reports_both_orderings(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_reports_both_orderings method assures the benchmark reports
+        the old path at two queries per profile, the current one at a single
+        insert per profile, and leaves no rows behind.
+        """
+        self._test_name = 'Test Reports Both Orderings'
+        try:
+            output = StringIO()
+            call_command('benchmark_profile_creation', profiles=10, stdout=output)
+
+            old, new = output.getvalue().splitlines()
+
+            self.assertTrue(old.startswith('order_with_respect_to'))
+            self.assertTrue(old.endswith('2.0 queries/profile'))
+            self.assertTrue(new.startswith('created, uuid'))
+            self.assertTrue(new.endswith('1.0 queries/profile'))
+            self.assertFalse(User.objects.exists())
+            self.assertFalse(Profile.objects.exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
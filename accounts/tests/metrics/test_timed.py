@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+from django.test import TestCase, override_settings
+from typing      import Optional
+
+from accounts.tests.factories.user_factory import UserFactory
+from core.metrics.metrics_registry         import MetricsRegistry
+from core.metrics.timed                    import timed
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestTimed(TestCase):
+    """
+    The TestTimed class handles any necessary testing of the timed decorator,
+    the metrics registry and the Prometheus export of the durations.
+    """
+
+    _test_name: Optional[str] = None
+
+    def setUp(self) -> None:
+        MetricsRegistry.reset()
+
+    def test_durations_are_recorded_per_function(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_durations_are_recorded_per_function method assures every
+        call of a timed function or coroutine function is recorded, the
+        calls that raise included.
+        """
+        self._test_name = 'Test Durations are Recorded Per Function'
+        try:
+            @timed
+            def add(first: int, second: int) -> int:
+                return first + second
+
+            @timed(name='accounts.fail')
+            def fail() -> None:
+                raise ValueError
+
+            @timed
+            async def wait() -> None:
+                await asyncio.sleep(0)
+
+            for _ in range(3):
+                self.assertEqual(add(1, 2), 3)
+
+            with self.assertRaises(ValueError):
+                fail()
+
+            asyncio.run(wait())
+
+            snapshot: dict = MetricsRegistry.snapshot()
+            prefix  : str  = 'TestTimed.test_durations_are_recorded_per_function.<locals>'
+
+            self.assertEqual(snapshot[f'{prefix}.add']['count'], 3)
+            self.assertEqual(snapshot['accounts.fail']['count'], 1)
+            self.assertEqual(snapshot[f'{prefix}.wait']['count'], 1)
+            self.assertLessEqual(snapshot[f'{prefix}.add']['p50_ms'], snapshot[f'{prefix}.add']['p99_ms'])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_hot_paths_are_timed(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_hot_paths_are_timed method assures saving a user is recorded
+        under the qualified name of User.save.
+        """
+        self._test_name = 'Test Hot Paths are Timed'
+        try:
+            UserFactory.create_batch(2)
+
+            self.assertEqual(MetricsRegistry.snapshot()['User.save']['count'], 2)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_metrics_are_exported_for_prometheus(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_metrics_are_exported_for_prometheus method assures the
+        histograms are served in the Prometheus text format only when the
+        METRICS_ENABLED setting is set.
+        """
+        self._test_name = 'Test Metrics are Exported for Prometheus'
+        try:
+            MetricsRegistry.histogram('User.save').observe(0.002)
+
+            with override_settings(METRICS_ENABLED=False):
+                self.assertEqual(self.client.get('/metrics/').status_code, 404)
+
+            with override_settings(METRICS_ENABLED=True):
+                response = self.client.get('/metrics/')
+
+            content: str = response.content.decode()
+
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('# TYPE call_duration_seconds histogram', content)
+            self.assertIn('call_duration_seconds_bucket{function="User.save",le="0.001"} 0', content)
+            self.assertIn('call_duration_seconds_bucket{function="User.save",le="0.0025"} 1', content)
+            self.assertIn('call_duration_seconds_count{function="User.save"} 1', content)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
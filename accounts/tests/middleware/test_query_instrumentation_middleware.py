@@ -0,0 +1,168 @@
+import asyncio
+import logging
+
+from asgiref.sync           import async_to_sync, sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.http            import HttpRequest, HttpResponse
+from django.test            import RequestFactory, TestCase, override_settings
+from typing                 import Optional
+
+from accounts.models.user                             import User
+from accounts.tests.factories.user_factory            import UserFactory
+from core.middleware.query_instrumentation_middleware import QueryInstrumentationMiddleware
+from core.utils.coroutines                            import iscoroutinefunction
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestQueryInstrumentationMiddleware(TestCase):
+    """
+    The TestQueryInstrumentationMiddleware class handles any necessary
+    testing of the per-request query instrumentation.
+    """
+
+    _test_name: Optional[str] = None
+
+    def setUp(self) -> None:
+        self.users = UserFactory.bulk_create_batch(6, password=None)
+
+    def _loop_view(self, request: HttpRequest) -> HttpResponse:
+        # one query per user is the N+1 pattern the middleware flags
+        for user in self.users:
+            User.objects.filter(pk=user.pk).exists()
+
+        return HttpResponse()
+
+    def _single_view(self, request: HttpRequest) -> HttpResponse:
+        User.objects.filter(pk__in=[user.pk for user in self.users]).count()
+
+        return HttpResponse()
+
+    async def _async_view(self, request: HttpRequest) -> HttpResponse:
+        # the other request runs while this one waits between its queries
+        for user in self.users[:int(request.GET['count'])]:
+            await sync_to_async(User.objects.filter(pk=user.pk).exists)()
+            await asyncio.sleep(0)
+
+        return HttpResponse()
+
+    @override_settings(DEBUG=True, QUERY_INSTRUMENTATION={'TOP_N': 2, 'REPEAT_THRESHOLD': 5})
+    def test_repeated_statements_are_flagged(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_repeated_statements_are_flagged method assures a request
+        running the same statement once per row is logged as a warning with
+        its slowest and repeated statements and reported in the debug
+        headers.
+        """
+        self._test_name = 'Test Repeated Statements are Flagged'
+        try:
+            middleware = QueryInstrumentationMiddleware(self._loop_view)
+
+            with self.assertLogs('accounts', logging.WARNING) as logs:
+                response = middleware(RequestFactory().get('/accounts/user_0/'))
+
+            record = logs.records[0]
+
+            self.assertEqual(response['X-DB-Queries'], '6')
+            self.assertEqual(response['X-DB-Repeated'], '1')
+            self.assertEqual(record.queries, 6)
+            self.assertEqual(record.repeated[0]['count'], 6)
+            self.assertEqual(len(record.slowest), 2)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    @override_settings(DEBUG=True, QUERY_INSTRUMENTATION={'REPEAT_THRESHOLD': 5})
+    def test_single_statements_are_logged_as_info(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_single_statements_are_logged_as_info method assures a request
+        without repeated statements is logged as information only.
+        """
+        self._test_name = 'Test Single Statements are Logged as Info'
+        try:
+            middleware = QueryInstrumentationMiddleware(self._single_view)
+
+            with self.assertLogs('accounts', logging.INFO) as logs:
+                response = middleware(RequestFactory().get('/accounts/user_0/'))
+
+            self.assertEqual(logs.records[0].levelno, logging.INFO)
+            self.assertEqual(logs.records[0].repeated, [])
+            self.assertEqual(response['X-DB-Queries'], '1')
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    @override_settings(DEBUG=False, QUERY_INSTRUMENTATION={'SAMPLE_RATE': 0.0})
+    def test_middleware_is_removed_without_sampling(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_middleware_is_removed_without_sampling method assures the
+        middleware removes itself when no request would be sampled.
+        """
+        self._test_name = 'Test Middleware is Removed Without Sampling'
+        try:
+            with self.assertRaises(MiddlewareNotUsed):
+                QueryInstrumentationMiddleware(self._single_view)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+
+    @override_settings(DEBUG=True, QUERY_INSTRUMENTATION={'REPEAT_THRESHOLD': 10})
+    def test_async_requests_are_recorded_separately(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_async_requests_are_recorded_separately method assures the
+        middleware is a coroutine function in front of an async view, so the
+        view is not adapted to a thread, and that the statements of two
+        concurrent requests are counted against the request that ran them.
+        """
+        self._test_name = 'Test Async Requests are Recorded Separately'
+        try:
+            middleware = QueryInstrumentationMiddleware(self._async_view)
+
+            self.assertTrue(iscoroutinefunction(middleware))
+
+            async def concurrently() -> list:
+                return await asyncio.gather(
+                    middleware(RequestFactory().get('/', {'count': 2})),
+                    middleware(RequestFactory().get('/', {'count': 5}))
+                )
+
+            with self.assertLogs('accounts', logging.INFO):
+                responses = async_to_sync(concurrently)()
+
+            self.assertEqual([response['X-DB-Queries'] for response in responses], ['2', '5'])
+            self.assertFalse(iscoroutinefunction(QueryInstrumentationMiddleware(self._single_view)))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #4 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #4 - {self._test_name}')
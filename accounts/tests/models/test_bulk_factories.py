@@ -0,0 +1,138 @@
+import logging
+
+from django.test import TestCase
+from typing      import List, Optional
+
+from accounts.indexes.friend_index                 import FriendIndex
+from accounts.models.profile                       import Profile
+from accounts.models.relationship                  import Relationship
+from accounts.models.user                          import User
+from accounts.tests.factories.profile_factory      import ProfileFactory
+from accounts.tests.factories.relationship_factory import RelationshipFactory
+from accounts.tests.factories.user_factory         import UserFactory
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestBulkFactories(TestCase):
+    """
+    The TestBulkFactories class handles any necessary testing of the bulk
+    mode of the model factories.
+    """
+
+    _test_name: Optional[str] = None
+
+    def test_users_are_inserted_in_batches_with_profiles(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_users_are_inserted_in_batches_with_profiles method assures
+        the bulk mode of UserFactory inserts users and their profiles with one
+        INSERT each per batch and hashes the passwords it is given.
+        """
+        self._test_name = 'Test Users are Inserted in Batches with Profiles'
+        try:
+            with self.assertNumQueries(4):
+                users: List[User] = UserFactory.bulk_create_batch(10, batch_size=5)
+
+            self.assertEqual(User.objects.count(), 10)
+            self.assertEqual(Profile.objects.filter(user__in=users).count(), 10)
+
+            hashed  : User = UserFactory.bulk_create_batch(1, password='password')[0]
+            unusable: User = UserFactory.bulk_create_batch(1, password=None)[0]
+
+            self.assertTrue(User.objects.get(pk=hashed.pk).check_password('password'))
+            self.assertFalse(User.objects.get(pk=unusable.pk).has_usable_password())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_relationships_take_raw_ids(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_relationships_take_raw_ids method assures friend requests
+        given as raw user ids are inserted without building their users or
+        looking them up first, and the pending counts of their receivers are
+        brought up to date.
+        """
+        self._test_name = 'Test Relationships Take Raw IDs'
+        try:
+            users: List[User] = UserFactory.bulk_create_batch(4, password=None)
+
+            # the insert, then the read and the update of the receivers' pending counts
+            with self.assertNumQueries(3):
+                created: int = RelationshipFactory.bulk_create_rows(
+                    {'sender_id': sender.pk, 'receiver_id': receiver.pk}
+                    for sender, receiver in zip(users, users[1:])
+                )
+
+            self.assertEqual(created, 3)
+            self.assertEqual(User.objects.count(), 4)
+            self.assertTrue(Relationship.objects.filter(sender=users[0], receiver=users[1]).exists())
+            self.assertEqual(
+                dict(Profile.objects.filter(user__in=users).values_list('user', 'pending_incoming_count')),
+                {user.pk: int(index > 0) for index, user in enumerate(users)}
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_friendships_are_symmetric(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_friendships_are_symmetric method assures both directions of
+        every friendship are written, existing friendships are skipped and
+        the friend counts and cached friends of the profiles are refreshed.
+        """
+        self._test_name = 'Test Friendships are Symmetric'
+        try:
+            profiles: List[Profile] = [
+                user.profile for user in UserFactory.bulk_create_batch(3, password=None)
+            ]
+
+            # warms the cached adjacency the insert has to invalidate
+            self.assertEqual(FriendIndex.get(profiles[0].pk), frozenset())
+
+            ProfileFactory.bulk_create_friendships(
+                [
+                    (profiles[0].pk, profiles[1].pk),
+                    (profiles[0].pk, profiles[2].pk),
+                    (profiles[1].pk, profiles[0].pk),
+                ],
+                batch_size=2
+            )
+
+            self.assertEqual(Profile.friends.through.objects.count(), 4)
+            self.assertEqual(profiles[0].friends.count(), 2)
+            self.assertEqual(list(profiles[2].friends.all()), [profiles[0]])
+            self.assertEqual(
+                FriendIndex.get(profiles[0].pk),
+                frozenset({profiles[1].pk, profiles[2].pk})
+            )
+            self.assertEqual(
+                dict(Profile.objects.filter(pk__in=[profile.pk for profile in profiles]).values_list('pk', 'friend_count')),
+                {profiles[0].pk: 2, profiles[1].pk: 1, profiles[2].pk: 1}
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
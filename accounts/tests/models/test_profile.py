@@ -1,11 +1,17 @@
 import logging
 
-from django.test import TestCase
-from typing      import Optional
+from django.core.cache      import cache
+from django.core.management import call_command
+from django.test            import TestCase
+from io                     import StringIO
+from typing                 import Optional
 
-from accounts.exception                       import AccountsException
-from accounts.models.profile                  import Profile
-from accounts.tests.factories.profile_factory import ProfileFactory
+from accounts.exception                            import AccountsException
+from accounts.indexes.block_index                  import BlockIndex
+from accounts.indexes.friend_index                 import FriendIndex
+from accounts.models.profile                       import Profile
+from accounts.tests.factories.profile_factory      import ProfileFactory
+from accounts.tests.factories.relationship_factory import RelationshipFactory
 
 logger = logging.getLogger('accounts.tests')
 
@@ -122,3 +128,464 @@ class TestProfile(TestCase):
             self.fail()
         else:
             logger.info(f'Completed Test #4 - {self._test_name}')
+
+    def test_mutual_friends(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_mutual_friends method builds a small friends graph and
+        validates the mutual friends and mutual counts between two profiles.
+        """
+        self._test_name = 'Test Mutual Friends'
+        try:
+            other  : Profile = ProfileFactory()
+            shared : Profile = ProfileFactory()
+            outside: Profile = ProfileFactory()
+
+            self._test_profile.add_friend(shared)
+            other.add_friend(shared)
+            other.add_friend(outside)
+
+            self.assertEqual(
+                list(self._test_profile.mutual_friends(other)),
+                [shared]
+            )
+
+            self.assertEqual(
+                self._test_profile.mutual_counts([other, shared, outside]),
+                {other.pk: 1, shared.pk: 0, outside.pk: 0}
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #5 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #5 - {self._test_name}')
+
+    def test_mutual_counts_are_answered_from_the_friend_index(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_mutual_counts_are_answered_from_the_friend_index method assures
+        a batch of mutual counts costs a single query when the index is cold,
+        no queries when it is warm, and is refreshed when a friend is added.
+        """
+        self._test_name = 'Test Mutual Counts Are Answered From the Friend Index'
+        try:
+            profiles = [ProfileFactory() for _ in range(5)]
+            for profile in profiles:
+                self._test_profile.add_friend(profile)
+
+            with self.assertNumQueries(1):
+                self._test_profile.mutual_counts(profiles)
+
+            with self.assertNumQueries(0):
+                self._test_profile.mutual_counts(profiles)
+
+            profiles[0].add_friend(profiles[1])
+
+            self.assertEqual(
+                self._test_profile.mutual_counts(profiles[:2]),
+                {profiles[0].pk: 1, profiles[1].pk: 1}
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #6 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #6 - {self._test_name}')
+
+    def test_friends_of_friends_are_ranked_by_mutual_friends(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_friends_of_friends_are_ranked_by_mutual_friends method assures
+        friends of friends exclude existing friends and are ordered by the
+        number of mutual friends.
+        """
+        self._test_name = 'Test Friends of Friends are Ranked by Mutual Friends'
+        try:
+            first, second  = ProfileFactory(), ProfileFactory()
+            popular, other = ProfileFactory(), ProfileFactory()
+
+            self._test_profile.add_friend(first)
+            self._test_profile.add_friend(second)
+            first.add_friend(second)
+            first.add_friend(popular)
+            second.add_friend(popular)
+            second.add_friend(other)
+
+            self.assertEqual(
+                self._test_profile.friends_of_friends(),
+                [popular, other]
+            )
+
+            self.assertEqual(
+                self._test_profile.friends_of_friends(limit=1),
+                [popular]
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #7 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #7 - {self._test_name}')
+
+    def test_recommendations_are_precomputed(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_recommendations_are_precomputed method runs the batch
+        recommendation command over a small graph and validates that the
+        stored candidates are ranked by mutual friends and exclude blocked
+        profiles and profiles with a pending friend request.
+        """
+        self._test_name = 'Test Recommendations are Precomputed'
+        try:
+            first, second = ProfileFactory(), ProfileFactory()
+            popular, other = ProfileFactory(), ProfileFactory()
+            blocked, pending = ProfileFactory(), ProfileFactory()
+
+            self._test_profile.add_friend(first)
+            self._test_profile.add_friend(second)
+            for profile in (popular, other, blocked, pending):
+                first.add_friend(profile)
+            second.add_friend(popular)
+
+            self._test_profile.blocks.add(blocked)
+            RelationshipFactory(sender=pending.user, receiver=self._test_profile.user)
+
+            call_command('compute_recommendations', chunk_size=2, stdout=StringIO())
+            call_command('compute_recommendations', modified_within=5, stdout=StringIO())
+
+            # the block set is cached after the first read
+            BlockIndex.get(self._test_profile.user_id)
+
+            with self.assertNumQueries(1):
+                recommendations = self._test_profile.get_recommendations()
+
+            self.assertEqual(recommendations[0], popular)
+            self.assertEqual(set(recommendations), {popular, other})
+        except AssertionError as error:
+            logger.exception(f'Failed Test #8 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #8 - {self._test_name}')
+
+    def test_blocked_profiles_are_hidden(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_blocked_profiles_are_hidden method assures friends of
+        friends leave out blocked profiles and that the cached block set
+        follows blocks being added and removed.
+        """
+        self._test_name = 'Test Blocked Profiles are Hidden'
+        try:
+            friend, candidate = ProfileFactory(), ProfileFactory()
+
+            self._test_profile.add_friend(friend)
+            friend.add_friend(candidate)
+
+            self.assertEqual(self._test_profile.friends_of_friends(), [candidate])
+            self.assertFalse(BlockIndex.is_blocked(self._test_profile, candidate))
+
+            candidate.blocks.add(self._test_profile)
+
+            self.assertTrue(BlockIndex.is_blocked(self._test_profile, candidate.user))
+            self.assertEqual(self._test_profile.friends_of_friends(), [])
+            self.assertEqual(
+                BlockIndex.filter_blocked(self._test_profile.user, [friend, candidate]),
+                [friend]
+            )
+
+            self._test_profile.blocks.remove(candidate)
+
+            self.assertFalse(BlockIndex.is_blocked(candidate, self._test_profile))
+            self.assertEqual(self._test_profile.friends_of_friends(), [candidate])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #9 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #9 - {self._test_name}')
+
+    def test_primary_keys_are_time_ordered(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_primary_keys_are_time_ordered method assures profiles and
+        their users receive primary keys that sort in creation order.
+        """
+        self._test_name = 'Test Primary Keys are Time Ordered'
+        try:
+            profiles = [ProfileFactory() for _ in range(5)]
+
+            self.assertEqual(self._test_profile.pk.version, 7)
+            self.assertEqual(
+                [profile.pk for profile in profiles],
+                sorted(profile.pk for profile in profiles)
+            )
+            self.assertEqual(
+                [profile.user.pk for profile in profiles],
+                sorted(profile.user.pk for profile in profiles)
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #10 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #10 - {self._test_name}')
+
+    def test_creating_profile_is_a_single_insert(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_creating_profile_is_a_single_insert method assures creating
+        the profile of a signup does not query for an ordering value first.
+        While Profile set order_with_respect_to='user', every insert was
+        preceded by an aggregate over _order, so it cost two queries.
+        """
+        self._test_name = 'Test Creating Profile is a Single Insert'
+        try:
+            user = self._test_profile.user
+            self._test_profile.delete()
+
+            self.assertIsNone(Profile._meta.order_with_respect_to)
+
+            with self.assertNumQueries(1) as context:
+                profile = Profile.create_profile(user=user)
+
+            self.assertTrue(context.captured_queries[0]['sql'].startswith('INSERT'))
+            self.assertNotIn('_order', context.captured_queries[0]['sql'])
+            self.assertEqual(Profile.objects.get(user=user), profile)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #11 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #11 - {self._test_name}')
+
+    def test_add_friend_counts_each_friendship_once(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_add_friend_counts_each_friendship_once method assures adding
+        a friend increments the friend_count of both profiles, in memory and
+        in the database, and adding the same friend again changes neither.
+        """
+        self._test_name = 'Test Add Friend Counts Each Friendship Once'
+        try:
+            friend = ProfileFactory()
+
+            self._test_profile.add_friend(friend)
+            self._test_profile.add_friend(friend)
+
+            self.assertEqual(self._test_profile.friend_count, 1)
+            self.assertEqual(friend.friend_count, 1)
+
+            # saving a stale instance does not overwrite the counters
+            stale = Profile.objects.get(pk=friend.pk)
+            self._test_profile.add_friend(ProfileFactory())
+            stale.save()
+
+            self._test_profile.refresh_from_db()
+            friend.refresh_from_db()
+
+            self.assertEqual(self._test_profile.friend_count, 2)
+            self.assertEqual(friend.friend_count, 1)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #12 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #12 - {self._test_name}')
+
+    def test_reconcile_profile_counts_repairs_drift(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_reconcile_profile_counts_repairs_drift method assures the
+        reconcile_profile_counts command reports drifted counters in a dry
+        run and recounts them otherwise, across several chunks.
+        """
+        self._test_name = 'Test Reconcile Profile Counts Repairs Drift'
+        try:
+            friends = [ProfileFactory() for _ in range(3)]
+            for friend in friends:
+                self._test_profile.add_friend(friend)
+
+            sender = RelationshipFactory(receiver=self._test_profile.user).sender.profile
+
+            Profile.objects.update(friend_count=7, pending_incoming_count=-1)
+
+            output = StringIO()
+            call_command('reconcile_profile_counts', chunk_size=2, dry_run=True, stdout=output)
+
+            self.assertIn('Found 5 of 5 profiles', output.getvalue())
+            self.assertFalse(Profile.objects.exclude(friend_count=7).exists())
+
+            output = StringIO()
+            call_command('reconcile_profile_counts', chunk_size=2, stdout=output)
+
+            self.assertIn('Repaired 5 of 5 profiles', output.getvalue())
+            self.assertEqual(
+                dict(Profile.objects.values_list('pk', 'friend_count')),
+                {self._test_profile.pk: 3, sender.pk: 0, **{friend.pk: 1 for friend in friends}}
+            )
+            self.assertEqual(
+                dict(Profile.objects.values_list('pk', 'pending_incoming_count')),
+                {self._test_profile.pk: 1, sender.pk: 0, **{friend.pk: 0 for friend in friends}}
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #13 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #13 - {self._test_name}')
+
+    def test_friends_manager_and_deletes_keep_friend_counts(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_friends_manager_and_deletes_keep_friend_counts method
+        assures adding, removing and clearing friends through the friends
+        manager, and deleting a profile or its user, keep every friend_count
+        equal to the friendship rows it counts.
+        """
+        self._test_name = 'Test Friends Manager and Deletes Keep Friend Counts'
+        try:
+            friends = [ProfileFactory() for _ in range(4)]
+
+            def drifted() -> list:
+                return [
+                    profile.pk for profile in Profile.objects.with_actual_counts()
+                    if profile.friend_count != profile.actual_friend_count
+                ]
+
+            self._test_profile.friends.add(*friends)
+            self._test_profile.friends.add(friends[0])
+            self.assertEqual(drifted(), [])
+
+            # removing a profile that is not a friend changes no count
+            self._test_profile.friends.remove(friends[0], ProfileFactory())
+            self.assertEqual(drifted(), [])
+
+            friends[1].friends.add(friends[2])
+            friends[1].delete()
+            self.assertEqual(drifted(), [])
+
+            friends[2].user.delete()
+            self.assertEqual(drifted(), [])
+
+            self._test_profile.friends.clear()
+            self.assertEqual(drifted(), [])
+
+            self._test_profile.refresh_from_db()
+            self.assertEqual(self._test_profile.friend_count, 0)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #14 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #14 - {self._test_name}')
+
+    def test_saving_keeps_the_default_insert_and_update_paths(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_saving_keeps_the_default_insert_and_update_paths method
+        assures leaving the counters out of the UPDATE of a profile does not
+        change how save inserts, so a forced insert of a copy and a save of a
+        profile whose row was deleted both insert it with its counters.
+        """
+        self._test_name = 'Test Saving Keeps the Default Insert and Update Paths'
+        try:
+            user = self._test_profile.user
+            self._test_profile.friend_count = 3
+
+            Profile.objects.filter(pk=self._test_profile.pk).delete()
+            self._test_profile.save()
+
+            self.assertEqual(Profile.objects.get(user=user).friend_count, 3)
+
+            Profile.objects.filter(pk=self._test_profile.pk).delete()
+            self._test_profile.save(force_insert=True)
+
+            self.assertEqual(Profile.objects.get(user=user).friend_count, 3)
+
+            # naming a counter writes it
+            self._test_profile.friend_count = 5
+            self._test_profile.save(update_fields=['friend_count'])
+
+            self.assertEqual(Profile.objects.get(user=user).friend_count, 5)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #15 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #15 - {self._test_name}')
+
+    def test_friend_index_is_invalidated_on_commit(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_friend_index_is_invalidated_on_commit method assures an
+        adjacency entry cached by a concurrent lookup before a new friendship
+        is committed is removed once the transaction commits.
+        """
+        self._test_name = 'Test Friend Index is Invalidated on Commit'
+        try:
+            friend = ProfileFactory()
+
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                self._test_profile.add_friend(friend)
+
+                # the lookup of another worker caches the adjacency it read before the commit
+                cache.set(FriendIndex._key(self._test_profile.pk), frozenset(), FriendIndex.timeout)
+
+            self.assertTrue(callbacks)
+            self.assertEqual(FriendIndex.get(self._test_profile.pk), frozenset({friend.pk}))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #16 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #16 - {self._test_name}')
@@ -1,10 +1,17 @@
 import logging
 
-from django.conf import settings
-from django.test import TestCase
-from typing      import Optional
-
+from django.conf       import settings
+from django.db         import IntegrityError, transaction
+from django.test       import TestCase
+from django.utils.http import urlsafe_base64_encode
+from typing            import Optional
+from unittest          import mock
+
+from accounts.exception                            import AccountsException
+from accounts.indexes.block_index                  import BlockIndex
+from accounts.models.profile                       import Profile
 from accounts.models.relationship                  import Relationship
+from accounts.querysets.relationship_queryset      import RelationshipQuerySet
 from accounts.tests.factories.relationship_factory import RelationshipFactory
 
 logger = logging.getLogger('accounts.tests')
@@ -285,3 +292,484 @@ class TestRelationship(TestCase):
             self.fail()
         else:
             logger.info(f'Completed Test #10 - {self._test_name}')
+
+    def test_bulk_accepting_relationships(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_bulk_accepting_relationships method accepts several friend
+        requests at once and verifies every pair became friends and every
+        accepted request was removed from the database.
+        """
+        self._test_name = 'Test Bulk Accepting Relationships'
+        try:
+            relationships = [self._test_relationship] + [
+                RelationshipFactory(receiver=self._test_relationship.receiver)
+                for _ in range(3)
+            ]
+
+            accepted: int = Relationship.bulk_accept(
+                (relationship.sender, relationship.receiver)
+                for relationship in relationships
+            )
+
+            self.assertEqual(accepted, 4)
+            self.assertFalse(Relationship.objects.exists())
+
+            receiver_profile: Profile = self._test_relationship.receiver.profile
+
+            self.assertEqual(
+                set(receiver_profile.get_friends().all()),
+                {relationship.sender.profile for relationship in relationships}
+            )
+
+            for relationship in relationships:
+                self.assertEqual(
+                    list(relationship.sender.profile.get_friends().all()),
+                    [receiver_profile]
+                )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #11 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #11 - {self._test_name}')
+
+    def test_bulk_accept_ignores_unknown_pairs(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_bulk_accept_ignores_unknown_pairs method assures that pairs
+        without a pending friend request, including the reverse of an existing
+        request, are not accepted.
+        """
+        self._test_name = 'Test Bulk Accept Ignores Unknown Pairs'
+        try:
+            accepted: int = Relationship.bulk_accept([
+                (self._test_relationship.receiver, self._test_relationship.sender)
+            ])
+
+            self.assertEqual(accepted, 0)
+            self.assertTrue(Relationship.objects.exists())
+            self.assertFalse(
+                self._test_relationship.sender.profile.get_friends().exists()
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #12 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #12 - {self._test_name}')
+
+    def test_incoming_and_outgoing_relationships(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_incoming_and_outgoing_relationships method validates the
+        inbox and sent requests of a user, including status filtering.
+        """
+        self._test_name = 'Test Incoming and Outgoing Relationships'
+        try:
+            receiver = self._test_relationship.receiver
+            viewed   = RelationshipFactory(receiver=receiver)
+            sent     = RelationshipFactory(sender=receiver)
+
+            viewed.update_status(status=Relationship.RequestOptions.VIEWED)
+
+            self.assertEqual(
+                list(Relationship.objects.incoming(user=receiver)),
+                [viewed, self._test_relationship]
+            )
+
+            self.assertEqual(
+                list(Relationship.objects.incoming(
+                    user=receiver,
+                    status=Relationship.RequestOptions.SENT
+                )),
+                [self._test_relationship]
+            )
+
+            self.assertEqual(
+                list(Relationship.objects.outgoing(user=receiver)),
+                [sent]
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #13 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #13 - {self._test_name}')
+
+    def test_keyset_pagination_of_incoming_relationships(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_keyset_pagination_of_incoming_relationships method walks
+        every page of an inbox whose requests share the same creation time
+        and assures each request is returned exactly once.
+        """
+        self._test_name = 'Test Keyset Pagination of Incoming Relationships'
+        try:
+            receiver = self._test_relationship.receiver
+            for _ in range(6):
+                RelationshipFactory(receiver=receiver)
+
+            Relationship.objects.update(created=self._test_relationship.created)
+
+            inbox  = Relationship.objects.incoming(user=receiver)
+            seen   = []
+            cursor = None
+
+            while True:
+                with self.assertNumQueries(1):
+                    page = inbox.page(cursor=cursor, limit=3)
+
+                seen.extend(page.relationships)
+                cursor = page.next_cursor
+
+                if cursor is None:
+                    break
+
+            self.assertEqual(seen, list(inbox))
+            self.assertEqual(len(seen), 7)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #14 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #14 - {self._test_name}')
+
+    def test_bulk_status_transitions(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_bulk_status_transitions method marks an inbox as viewed,
+        rejects it and cancels it, assuring each step runs a fixed number of
+        queries however many friend requests it affects and reports that
+        number. Rejecting and cancelling also read the affected requests and
+        update the pending count of their receivers inside a savepoint.
+        """
+        self._test_name = 'Test Bulk Status Transitions'
+        try:
+            receiver = self._test_relationship.receiver
+            rejected = RelationshipFactory(receiver=receiver)
+            RelationshipFactory(receiver=receiver)
+
+            rejected.update_status(status=Relationship.RequestOptions.REJECTED)
+
+            inbox = Relationship.objects.incoming(user=receiver)
+
+            with self.assertNumQueries(1):
+                self.assertEqual(inbox.mark_viewed(), 2)
+
+            self.assertEqual(
+                Relationship.objects.get(pk=rejected.pk).status,
+                Relationship.RequestOptions.REJECTED
+            )
+
+            with self.assertNumQueries(5):
+                self.assertEqual(inbox.reject(), 2)
+
+            self.assertFalse(
+                inbox.exclude(status=Relationship.RequestOptions.REJECTED).exists()
+            )
+
+            # every request left is rejected, so no pending count changes
+            with self.assertNumQueries(4):
+                self.assertEqual(inbox.cancel(), 3)
+
+            self.assertFalse(inbox.exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #15 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #15 - {self._test_name}')
+
+    def test_sender_and_receiver_must_differ(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_sender_and_receiver_must_differ method assures a user cannot
+        send themselves a friend request, both through Relationship.save and
+        through a bulk insert that bypasses it.
+        """
+        self._test_name = 'Test Sender and Receiver Must Differ'
+        try:
+            sender_id = self._test_relationship.sender_id
+
+            with self.assertRaises(AccountsException):
+                Relationship.create_relationship(
+                    sender=self._test_relationship.sender,
+                    receiver=self._test_relationship.sender
+                )
+
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                Relationship.objects.bulk_create([
+                    Relationship(sender_id=sender_id, receiver_id=sender_id)
+                ])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #16 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #16 - {self._test_name}')
+
+    def test_creating_relationship_from_ids_does_not_load_the_users(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_creating_relationship_from_ids_does_not_load_the_users
+        method assures creating a friend request from raw user ids with a
+        cached block set takes four queries and loads neither user: the
+        savepoint, the insert, the increment of the receiver's pending count
+        and the savepoint release.
+        """
+        self._test_name = 'Test Creating Relationship From Ids Does Not Load the Users'
+        try:
+            sender_id   = self._test_relationship.receiver_id
+            receiver_id = self._test_relationship.sender_id
+
+            # the block set is cached after the first read
+            BlockIndex.get(sender_id)
+
+            with self.assertNumQueries(4) as context:
+                Relationship.objects.create(
+                    sender_id=sender_id,
+                    receiver_id=receiver_id
+                )
+
+            self.assertFalse(
+                any(query['sql'].startswith('SELECT') for query in context.captured_queries)
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #17 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #17 - {self._test_name}')
+
+    def test_creating_relationship_between_blocked_users(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_creating_relationship_between_blocked_users method assures
+        a friend request cannot be sent in either direction once one user has
+        blocked the other.
+        """
+        self._test_name = 'Test Creating Relationship Between Blocked Users'
+        try:
+            sender   = self._test_relationship.sender
+            receiver = self._test_relationship.receiver
+
+            self._test_relationship.cancel()
+            receiver.profile.blocks.add(sender.profile)
+
+            with self.assertRaises(AccountsException):
+                Relationship.create_relationship(sender=sender, receiver=receiver)
+
+            with self.assertRaises(AccountsException):
+                Relationship.create_relationship(sender=receiver, receiver=sender)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #18 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #18 - {self._test_name}')
+
+    def test_pending_and_friend_counts_follow_relationships(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_pending_and_friend_counts_follow_relationships method
+        assures creating, viewing, rejecting, cancelling and accepting friend
+        requests keep the pending_incoming_count of the receiver and the
+        friend_count of both users equal to the rows they count.
+        """
+        self._test_name = 'Test Pending and Friend Counts Follow Relationships'
+        try:
+            receiver = self._test_relationship.receiver
+            requests = [self._test_relationship] + [
+                RelationshipFactory(receiver=receiver)
+                for _ in range(3)
+            ]
+
+            def counts(user) -> tuple:
+                user.profile.refresh_from_db()
+                return user.profile.friend_count, user.profile.pending_incoming_count
+
+            self.assertEqual(counts(receiver), (0, 4))
+
+            requests[0].update_status(status=Relationship.RequestOptions.VIEWED)
+            self.assertEqual(counts(receiver), (0, 4))
+
+            requests[0].update_status(status=Relationship.RequestOptions.REJECTED)
+            requests[0].reject()
+            self.assertEqual(counts(receiver), (0, 3))
+
+            # cancelling a rejected request leaves the pending count alone
+            requests[0].cancel()
+            requests[1].cancel()
+            self.assertEqual(counts(receiver), (0, 2))
+
+            requests[2].accept()
+            self.assertEqual(counts(receiver), (1, 1))
+            self.assertEqual(counts(requests[2].sender), (1, 0))
+
+            # accepting a request between friends does not count them twice
+            RelationshipFactory(sender=receiver, receiver=requests[2].sender).accept()
+            self.assertEqual(counts(receiver), (1, 1))
+            self.assertEqual(counts(requests[2].sender), (1, 0))
+
+            Relationship.bulk_accept([(requests[3].sender, receiver)])
+            self.assertEqual(counts(receiver), (2, 0))
+            self.assertEqual(counts(requests[3].sender), (1, 0))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #19 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #19 - {self._test_name}')
+
+    def test_deleting_requests_releases_pending_counts(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_deleting_requests_releases_pending_counts method assures
+        deleting a pending friend request, whether through the instance,
+        through a QuerySet or through the cascade of deleting its sender,
+        decrements the pending_incoming_count of its receiver.
+        """
+        self._test_name = 'Test Deleting Requests Releases Pending Counts'
+        try:
+            receiver = self._test_relationship.receiver
+            requests = [self._test_relationship] + [
+                RelationshipFactory(receiver=receiver)
+                for _ in range(3)
+            ]
+
+            def pending() -> int:
+                receiver.profile.refresh_from_db()
+                return receiver.profile.pending_incoming_count
+
+            self.assertEqual(requests[0].delete(), (1, {'accounts.Relationship': 1}))
+            self.assertEqual(pending(), 3)
+
+            Relationship.objects.filter(pk=requests[1].pk).delete()
+            self.assertEqual(pending(), 2)
+
+            requests[2].sender.delete()
+            self.assertFalse(Relationship.objects.filter(pk=requests[2].pk).exists())
+            self.assertEqual(pending(), 1)
+
+            # the cascade of deleting the receiver leaves no row to count
+            receiver.delete()
+            self.assertFalse(Relationship.objects.exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #20 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #20 - {self._test_name}')
+
+    def test_bulk_accept_only_accepts_pending_exact_pairs(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_bulk_accept_only_accepts_pending_exact_pairs method assures
+        bulk_accept leaves rejected friend requests and the requests crossing
+        two of the given pairs alone, and that pairs beyond PAIR_BATCH_SIZE
+        are looked up in further batches.
+        """
+        self._test_name = 'Test Bulk Accept Only Accepts Pending Exact Pairs'
+        try:
+            sender   = self._test_relationship.sender
+            receiver = self._test_relationship.receiver
+            rejected = RelationshipFactory(receiver=receiver)
+            other    = RelationshipFactory()
+            crossing = RelationshipFactory(sender=sender, receiver=other.receiver)
+
+            rejected.reject()
+
+            with mock.patch.object(RelationshipQuerySet, 'PAIR_BATCH_SIZE', 1):
+                accepted: int = Relationship.bulk_accept([
+                    (sender, receiver),
+                    (rejected.sender, receiver),
+                    (other.sender, other.receiver)
+                ])
+
+            self.assertEqual(accepted, 2)
+            self.assertEqual(
+                set(Relationship.objects.values_list('pk', flat=True)),
+                {rejected.pk, crossing.pk}
+            )
+            self.assertFalse(
+                rejected.sender.profile.get_friends().exists()
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #21 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #21 - {self._test_name}')
+
+    def test_invalid_pagination_cursors(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_invalid_pagination_cursors method assures a cursor that
+        cannot be decoded and a cursor whose primary key is not a UUID are
+        both rejected with an AccountsException before any query runs.
+        """
+        self._test_name = 'Test Invalid Pagination Cursors'
+        try:
+            inbox = Relationship.objects.incoming(user=self._test_relationship.receiver)
+
+            for cursor in (
+                'not a cursor',
+                urlsafe_base64_encode(f'{self._test_relationship.created.isoformat()}|not-a-uuid'.encode())
+            ):
+                with self.assertNumQueries(0), self.assertRaises(AccountsException):
+                    inbox.page(cursor=cursor, limit=3)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #22 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #22 - {self._test_name}')
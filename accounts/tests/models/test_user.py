@@ -1,10 +1,11 @@
 import logging
 
-from django.db   import IntegrityError
+from django.db   import IntegrityError, transaction
 from django.test import TestCase
 from typing      import Optional
 
 from accounts.exception                    import AccountsException
+from accounts.models.profile               import Profile
 from accounts.models.user                  import User
 from accounts.tests.factories.user_factory import UserFactory
 
@@ -260,3 +261,82 @@ class TestUser(TestCase):
         else:
             logger.info(f'Completed Test #10 - {self._test_name}')
 
+
+    def test_bulk_creating_users(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_bulk_creating_users method provisions users in several
+        batches and validates each one was given a hashed password and a
+        connected Profile instance.
+        """
+        self._test_name = 'Test Bulk Creating Users'
+        try:
+            created: int = User.objects.bulk_create_users(
+                (
+                    {
+                        'username': f'bulk_user_{index}',
+                        'email'   : f'Bulk_User_{index}@TEST.com',
+                        'password': f'password_{index}'
+                    }
+                    for index in range(5)
+                ),
+                batch_size=2
+            )
+
+            self.assertEqual(created, 5)
+
+            users = User.objects.filter(username__startswith='bulk_user_')
+
+            self.assertEqual(users.count(), 5)
+            self.assertEqual(
+                Profile.objects.filter(user__in=users).count(),
+                5
+            )
+
+            user: User = users.get(username='bulk_user_3')
+
+            self.assertEqual(user.email, 'Bulk_User_3@test.com')
+            self.assertTrue(user.check_password('password_3'))
+        except AssertionError as error:
+            logger.exception(f'Failed Test #11 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #11 - {self._test_name}')
+
+    def test_logins_are_unique_regardless_of_case(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_logins_are_unique_regardless_of_case method attempts to
+        create users whose email or username only differ in case from the
+        user created in setUp, so find_by_login never matches several users.
+        """
+        self._test_name = 'Test Logins are Unique Regardless of Case'
+        try:
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                User.create_user(
+                    email=self._test_user.email.upper(),
+                    username='Test User #2',
+                    password='test password'
+                )
+
+            with self.assertRaises(IntegrityError), transaction.atomic():
+                User.create_user(
+                    email='test_user_2@test.com',
+                    username=self._test_user.username.swapcase(),
+                    password='test password'
+                )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #12 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #12 - {self._test_name}')
@@ -0,0 +1,303 @@
+import logging
+
+from asgiref.sync                       import async_to_sync, sync_to_async
+from django.apps                        import apps
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.db                          import connections
+from django.http                        import HttpResponse
+from django.test                        import RequestFactory, TestCase, override_settings
+from typing                             import List, Optional
+
+from accounts.models.profile                       import Profile
+from accounts.models.relationship                  import Relationship
+from accounts.models.user                          import User
+from accounts.tests.factories.relationship_factory import RelationshipFactory
+from accounts.tests.factories.user_factory         import UserFactory
+from core.middleware.replica_stickiness_middleware import ReplicaStickinessMiddleware
+from core.routers.replica_router                   import ReplicaRouter
+from core.utils.coroutines                         import iscoroutinefunction
+
+logger = logging.getLogger('accounts.tests')
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class TestReplicaRouting(TestCase):
+    """
+    The TestReplicaRouting class assures the read-only queryset methods are
+    the only ones routed to a configured replica.
+    """
+
+    _test_relationship: Optional[Relationship] = None
+    _test_name        : Optional[str]          = None
+
+    def setUp(self) -> None:
+        try:
+            self._test_relationship = RelationshipFactory()
+        except Exception as error:
+            logger.exception('Failed Test Relationship Initialization')
+            self.fail()
+
+    def test_read_only_methods_use_the_replica(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_read_only_methods_use_the_replica method assures find,
+        incoming, outgoing and the profile page reads are read from the
+        replica.
+        """
+        self._test_name = 'Test Read Only Methods Use the Replica'
+        try:
+            sender   = self._test_relationship.sender
+            receiver = self._test_relationship.receiver
+
+            self.assertEqual(User.objects.find(username=sender.username, email='').db, 'replica')
+            self.assertEqual(Relationship.objects.find(sender=sender, receiver=receiver).db, 'replica')
+            self.assertEqual(Relationship.objects.incoming(user=receiver).db, 'replica')
+            self.assertEqual(Relationship.objects.outgoing(user=sender).db, 'replica')
+            self.assertEqual(Profile.objects.friends_page(profile=sender.profile).db, 'replica')
+            self.assertEqual(Profile.objects.for_detail_page().db, 'replica')
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_other_queries_use_the_primary(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_other_queries_use_the_primary method assures unmarked reads
+        and every write go to the primary database, including writes made
+        through a QuerySet that was marked for the replica.
+        """
+        self._test_name = 'Test Other Queries Use the Primary'
+        try:
+            sender   = self._test_relationship.sender
+            receiver = self._test_relationship.receiver
+
+            self.assertEqual(User.objects.filter(pk=sender.pk).db, 'default')
+            self.assertEqual(User.objects.find_by_login(identifier=sender.username).db, 'default')
+
+            self.assertEqual(
+                Relationship.objects.find(sender=sender, receiver=receiver).accept_all(),
+                1
+            )
+            self.assertIn(receiver.profile, sender.profile.friends.all())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+
+@override_settings(REPLICA_DATABASES=['replica'], REPLICA_STICKY_SECONDS=60)
+class TestReplicaStickiness(TestCase):
+    """
+    The TestReplicaStickiness class runs the accounts queries against two
+    SQLite databases, the test database standing in for the primary and an
+    empty in-memory database standing in for a replica that has not caught
+    up yet, so every read answered by the replica misses the rows written.
+    """
+
+    _test_relationship: Optional[Relationship] = None
+    _test_name        : Optional[str]          = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+
+        # the replica is added after the test databases are set up, so its
+        # queries are neither blocked nor wrapped in the test transaction
+        connections.settings['replica'] = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME'  : ':memory:'
+        }
+        connections.ensure_defaults('replica')
+        connections.prepare_test_settings('replica')
+
+        with connections['replica'].schema_editor() as editor:
+            for model in apps.get_models():
+                editor.create_model(model)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+
+        super().tearDownClass()
+
+    def setUp(self) -> None:
+        try:
+            self._test_relationship = RelationshipFactory()
+        except Exception as error:
+            logger.exception('Failed Test Relationship Initialization')
+            self.fail()
+
+    def _find(self) -> Optional[Relationship]:
+        return Relationship.get_relationship(
+            sender=self._test_relationship.sender,
+            receiver=self._test_relationship.receiver
+        ).first()
+
+    def test_reads_without_a_state_use_the_replica(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_reads_without_a_state_use_the_replica method assures marked
+        reads made outside of any ReplicaState are answered by the replica
+        while writes land on the primary database.
+        """
+        self._test_name = 'Test Reads Without a State Use the Replica'
+        try:
+            self.assertIsNone(self._find())
+            self.assertFalse(User.get_user(username=self._test_relationship.sender.username).exists())
+            self.assertTrue(Relationship.objects.filter(pk=self._test_relationship.pk).exists())
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_writes_pin_reads_to_the_primary(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_writes_pin_reads_to_the_primary method assures a unit of
+        work reads its own writes once it has written, whether the write is
+        a friend request, an accepted friend request or a ban.
+        """
+        self._test_name = 'Test Writes Pin Reads to the Primary'
+        try:
+            with ReplicaRouter.state() as state:
+                self.assertIsNone(self._find())
+
+                user = UserFactory()
+                user.ban()
+
+                self.assertTrue(state.wrote)
+                self.assertEqual(self._find(), self._test_relationship)
+                self.assertTrue(User.get_user(username=user.username).get().is_banned)
+
+            with ReplicaRouter.state():
+                self._test_relationship.accept()
+
+                self.assertIsNone(self._find())
+                self.assertEqual(
+                    list(Profile.objects.friends_page(profile=self._test_relationship.sender.profile)),
+                    [self._test_relationship.receiver.profile]
+                )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_session_is_sticky_after_a_write(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_session_is_sticky_after_a_write method assures requests of a
+        session that just wrote read from the primary database until the
+        sticky window has passed.
+        """
+        self._test_name = 'Test Session is Sticky After a Write'
+        try:
+            databases: List[str] = []
+
+            def read(request) -> HttpResponse:
+                databases.append(Relationship.objects.find(
+                    sender=self._test_relationship.sender,
+                    receiver=self._test_relationship.receiver
+                ).db)
+                return HttpResponse()
+
+            def write(request) -> HttpResponse:
+                UserFactory()
+                return HttpResponse()
+
+            request = RequestFactory().get('/')
+            SessionMiddleware(read).process_request(request)
+
+            ReplicaStickinessMiddleware(read)(request)
+            ReplicaStickinessMiddleware(write)(request)
+            ReplicaStickinessMiddleware(read)(request)
+
+            with self.settings(REPLICA_STICKY_SECONDS=0):
+                ReplicaStickinessMiddleware(write)(request)
+                ReplicaStickinessMiddleware(read)(request)
+
+            self.assertEqual(databases, ['replica', 'default', 'replica'])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+
+    def test_async_session_is_sticky_after_a_write(self) -> None:
+        """
+        Parameters:
+            None
+
+        Returns:
+            None
+
+        The test_async_session_is_sticky_after_a_write method assures the
+        middleware serves async views without adapting them and that the
+        ReplicaState it activates reaches the sync_to_async calls of the
+        view, both to record a write and to pin the reads that follow it.
+        """
+        self._test_name = 'Test Async Session is Sticky After a Write'
+        try:
+            databases: List[str] = []
+
+            def find() -> str:
+                return Relationship.objects.find(
+                    sender=self._test_relationship.sender,
+                    receiver=self._test_relationship.receiver
+                ).db
+
+            async def read(request) -> HttpResponse:
+                databases.append(await sync_to_async(find)())
+                return HttpResponse()
+
+            async def write(request) -> HttpResponse:
+                await sync_to_async(UserFactory)()
+                databases.append(await sync_to_async(find)())
+                return HttpResponse()
+
+            request = RequestFactory().get('/')
+            SessionMiddleware(read).process_request(request)
+
+            self.assertTrue(iscoroutinefunction(ReplicaStickinessMiddleware(read)))
+
+            async_to_sync(ReplicaStickinessMiddleware(read))(request)
+            async_to_sync(ReplicaStickinessMiddleware(write))(request)
+            async_to_sync(ReplicaStickinessMiddleware(read))(request)
+
+            self.assertEqual(databases, ['replica', 'default', 'default'])
+        except AssertionError as error:
+            logger.exception(f'Failed Test #4 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #4 - {self._test_name}')
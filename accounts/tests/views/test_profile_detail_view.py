@@ -0,0 +1,143 @@
+import logging
+
+from django.http.response import HttpResponse
+from django.test          import TestCase
+from http                 import HTTPStatus
+from typing               import Optional
+
+from accounts.models.profile                  import Profile
+from accounts.tests.factories.profile_factory import ProfileFactory
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestProfileDetailView(TestCase):
+
+    _test_response: Optional[HttpResponse] = None
+    _test_profile : Optional[Profile]      = None
+    _test_name    : Optional[str]          = None
+
+    def setUp(self) -> None:
+        try:
+            self._test_profile = ProfileFactory()
+        except Exception as error:
+            logger.exception('Failed Test Profile Initialization')
+            self.fail()
+
+    def test_get(self) -> None:
+        self._test_name = 'Test Get Method For ProfileDetailView'
+        try:
+            self._test_response = self.client.get(
+                f'/accounts/{self._test_profile.user.username}/'
+            )
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.OK
+            )
+
+            self.assertTemplateUsed(
+                self._test_response,
+                'accounts/profile_detail_template.html'
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    def test_get_unknown_username(self) -> None:
+        self._test_name = 'Test Get Method For an Unknown Username'
+        try:
+            self._test_response = self.client.get('/accounts/unknown_user/')
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.NOT_FOUND
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    def test_query_count_does_not_grow_with_friends(self) -> None:
+        self._test_name = 'Test Query Count Does Not Grow With Friends'
+        try:
+            friends = [ProfileFactory() for _ in range(5)]
+            for friend in friends:
+                self._test_profile.add_friend(friend)
+
+            url: str = f'/accounts/{self._test_profile.user.username}/'
+
+            # one query for the profile, its user and its friend count, one for the friends page
+            with self.assertNumQueries(2):
+                self._test_response = self.client.get(url)
+
+            self.assertEqual(
+                self._test_response.context['profile'].friend_count,
+                5
+            )
+
+            for friend in friends:
+                self.assertContains(self._test_response, friend.user.username)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+
+    def test_rendered_page_is_cached_until_the_profile_changes(self) -> None:
+        self._test_name = 'Test Rendered Page is Cached Until the Profile Changes'
+        try:
+            user = self._test_profile.user
+            url: str = f'/accounts/{user.username}/'
+
+            self.client.get(url)
+
+            # the friends page is not queried when the rendered page is cached
+            with self.assertNumQueries(1):
+                self.client.get(url)
+
+            friend: Profile = ProfileFactory()
+            self._test_profile.add_friend(friend)
+
+            self._test_response = self.client.get(url)
+            self.assertContains(self._test_response, friend.user.username)
+
+            user.email = 'changed@test.com'
+            user.save()
+
+            self._test_response = self.client.get(url)
+            self.assertContains(self._test_response, 'changed@test.com')
+        except AssertionError as error:
+            logger.exception(f'Failed Test #4 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #4 - {self._test_name}')
+
+    def test_blocked_viewer_cannot_see_the_profile(self) -> None:
+        self._test_name = 'Test Blocked Viewer Cannot See the Profile'
+        try:
+            viewer: Profile = ProfileFactory()
+            friend: Profile = ProfileFactory()
+            self._test_profile.add_friend(friend)
+            viewer.blocks.add(friend)
+
+            url: str = f'/accounts/{self._test_profile.user.username}/'
+
+            self.client.force_login(viewer.user)
+
+            self._test_response = self.client.get(url)
+            self.assertEqual(self._test_response.status_code, HTTPStatus.OK)
+            self.assertNotContains(self._test_response, friend.user.username)
+
+            self._test_profile.blocks.add(viewer)
+
+            self._test_response = self.client.get(url)
+            self.assertEqual(self._test_response.status_code, HTTPStatus.NOT_FOUND)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #5 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #5 - {self._test_name}')
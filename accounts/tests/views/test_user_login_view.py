@@ -0,0 +1,114 @@
+import logging
+
+from django.http.response import HttpResponse
+from django.test          import TestCase
+from http                 import HTTPStatus
+from typing               import Optional
+from urllib.parse         import urlencode
+
+from accounts.models.user import User
+
+logger = logging.getLogger('accounts.tests')
+
+
+class TestUserLoginView(TestCase):
+
+    _test_response: Optional[HttpResponse] = None
+    _test_user    : Optional[User]         = None
+    _test_name    : Optional[str]          = None
+
+    def setUp(self) -> None:
+        try:
+            self._test_user = User.create_user(
+                email='test@test.com',
+                username='Test_User',
+                password='abc12321cba'
+            )
+        except Exception as error:
+            logger.exception('Failed Test User Initialization')
+            self.fail()
+
+    async def test_get(self) -> None:
+        self._test_name = 'Test Get Method For UserLoginView'
+        try:
+            self._test_response = await self.async_client.get('/accounts/login/')
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.OK
+            )
+        except AssertionError as error:
+            logger.exception(f'Failed Test #1 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #1 - {self._test_name}')
+
+    async def test_post_logs_the_user_in(self) -> None:
+        self._test_name = 'Test Post Method Logs the User In'
+        try:
+            # the async client of Django 3.2 cannot stream multipart bodies
+            self._test_response = await self.async_client.post(
+                '/accounts/login/',
+                data=urlencode({
+                    'username': 'test_user',
+                    'password': 'abc12321cba'
+                }),
+                content_type='application/x-www-form-urlencoded'
+            )
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.FOUND
+            )
+            self.assertIn('sessionid', self._test_response.cookies)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #2 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #2 - {self._test_name}')
+
+    async def test_post_with_wrong_password(self) -> None:
+        self._test_name = 'Test Post Method With Wrong Password'
+        try:
+            self._test_response = await self.async_client.post(
+                '/accounts/login/',
+                data=urlencode({
+                    'username': 'test@test.com',
+                    'password': 'cba12321abc'
+                }),
+                content_type='application/x-www-form-urlencoded'
+            )
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.OK
+            )
+            self.assertNotIn('sessionid', self._test_response.cookies)
+        except AssertionError as error:
+            logger.exception(f'Failed Test #3 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #3 - {self._test_name}')
+
+    async def test_disallowed_method(self) -> None:
+        self._test_name = 'Test Disallowed Method For UserLoginView'
+        try:
+            self._test_response = await self.async_client.put('/accounts/login/')
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.METHOD_NOT_ALLOWED
+            )
+
+            self._test_response = await self.async_client.options('/accounts/login/')
+
+            self.assertEqual(
+                self._test_response.status_code,
+                HTTPStatus.OK
+            )
+            self.assertEqual(self._test_response['Allow'], 'GET, POST, HEAD, OPTIONS')
+        except AssertionError as error:
+            logger.exception(f'Failed Test #4 - {self._test_name}')
+            self.fail()
+        else:
+            logger.info(f'Completed Test #4 - {self._test_name}')
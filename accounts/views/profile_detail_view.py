@@ -1,37 +1,68 @@
-import logging
+from asgiref.sync     import sync_to_async
+from django.http      import Http404, HttpRequest, HttpResponse
+from django.shortcuts import get_object_or_404
+from typing           import Optional
 
-from django.core.handlers.wsgi import WSGIRequest
-from django.http               import HttpResponse
-from django.shortcuts          import get_object_or_404, render
-from django.views              import View
-from typing                    import Optional
+from accounts.indexes.block_index import BlockIndex
+from accounts.models.profile      import Profile
+from accounts.models.user         import User
+from core.caches.fragment_cache   import FragmentCache
+from core.metrics.timed           import timed
+from core.views.async_view        import AsyncView
 
-from accounts.models.profile import Profile
-from accounts.models.user    import User
 
-logger = logging.getLogger('accounts')
-
-class ProfileDetailView(View):
+class ProfileDetailView(AsyncView):
+    """
+    The ProfileDetailView class is served asynchronously. The cache and
+    database work of a page runs on the database thread while the event loop
+    keeps serving other requests.
+    """
 
     user   : Optional[User]    = None
     profile: Optional[Profile] = None
 
-    def get(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
-        logger.info('Started ProfileDetailView.get method')
+    @timed
+    async def get(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        return await sync_to_async(self._render)(request, username=kwargs['username'])
+
+    def _render(self, request: HttpRequest, *, username: str) -> HttpResponse:
+        # the profile, its user and its friend count are loaded in one query
+        self.profile = get_object_or_404(
+            Profile.objects.for_detail_page(),
+            user__username=username
+        )
+        self.user = self.profile.user
 
-        user    = request.user
-        profile = get_object_or_404(Profile, user=user)
+        blocked = BlockIndex.get(request.user.pk) if request.user.is_authenticated else frozenset()
 
-        if profile:
-            return render(request, 'accounts/profile_detail_template.html', {
-                    'profile': profile,
-                    'user'   : user
-                }
+        if self.user.pk in blocked:
+            raise Http404('No Profile matches the given query.')
+
+        # every value rendered from the profile row is part of the key, so any
+        # Profile or User save that changes the page also changes the key, and
+        # viewers with blocks get their own filtered friends list
+        response = FragmentCache.render(
+            request,
+            'accounts/profile_detail_template.html',
+            lambda: {
+                'profile': self.profile,
+                'user'   : self.user,
+                'friends': [
+                    friend for friend in self.profile.get_friends_page()
+                    if friend.user_id not in blocked
+                ]
+            },
+            key=FragmentCache.key(
+                'profile_detail',
+                self.profile.uuid,
+                self.profile.modified.isoformat(),
+                self.profile.friend_count,
+                self.user.username,
+                self.user.email,
+                sorted(blocked)
             )
-        else:
-            ...
+        )
 
-        logger.info('Completed ProfileDetailView.get method')
+        return response
 
 ProfileDetailView = ProfileDetailView.as_view()
-
@@ -1,44 +1,51 @@
-from django.contrib.auth       import authenticate, login
+from asgiref.sync              import sync_to_async
+from django.contrib.auth       import login
 from django.contrib.auth.forms import AuthenticationForm
-from django.core.handlers.wsgi import WSGIRequest
-from django.http               import HttpResponse
+from django.http               import HttpRequest, HttpResponse
 from django.shortcuts          import render, redirect
-from django.views              import View
 from typing                    import Optional
 
-from accounts.models.user import User
+from accounts.backends.async_authentication import aauthenticate
+from accounts.models.user                   import User
+from core.views.async_view                  import AsyncView
 
 
-class UserLoginView(View):
+class UserLoginView(AsyncView):
+    """
+    The UserLoginView class is served asynchronously. The password check is
+    awaited on the password executor and every database or session access
+    runs on the database thread, so a single ASGI worker can keep many
+    logins in flight.
+    """
 
     form: Optional[AuthenticationForm] = None
     user: Optional[User]               = None
 
-    def _build_default_context(self, request: WSGIRequest) -> HttpResponse:
+    async def _build_default_context(self, request: HttpRequest) -> HttpResponse:
 
         self.form = AuthenticationForm()
 
-        return render(request, 'accounts/user_login_template.html', {
+        return await sync_to_async(render)(request, 'accounts/user_login_template.html', {
                 'form': self.form
             }
         )
 
-    def get(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
-        return self._build_default_context(request=request)
+    async def get(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        return await self._build_default_context(request=request)
 
-    def post(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+    async def post(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
 
         self.form = AuthenticationForm(request.POST)
 
         username: str = request.POST['username']
         password: str = request.POST['password']
         
-        self.user = authenticate(username=username, password=password)
+        self.user = await aauthenticate(request, username=username, password=password)
 
         if self.user:
-            login(request, self.user)
+            await sync_to_async(login)(request, self.user)
             return redirect('home')
         else:
-            return self._build_default_context(request=request)
+            return await self._build_default_context(request=request)
 
 UserLoginView = UserLoginView.as_view()
@@ -1,35 +1,40 @@
-from django.core.handlers.wsgi import WSGIRequest
-from django.http               import HttpResponse
+from asgiref.sync              import sync_to_async
+from django.http               import HttpRequest, HttpResponse
 from django.shortcuts          import render, redirect
-from django.views              import View
 from typing                    import Optional
 
 from accounts.forms.user_registration_form import UserRegistrationForm
+from core.views.async_view                 import AsyncView
 
 
-class UserRegistrationView(View):
+class UserRegistrationView(AsyncView):
+    """
+    The UserRegistrationView class is served asynchronously. The form is
+    validated on the database thread and the password is hashed by the
+    password executor while the event loop serves other requests.
+    """
 
     form: Optional[UserRegistrationForm] = None
 
-    def _build_default_context(self, request: WSGIRequest) -> HttpResponse:
+    async def _build_default_context(self, request: HttpRequest) -> HttpResponse:
         self.form = UserRegistrationForm()
 
-        return render(request, 'accounts/user_registration_template.html', {
+        return await sync_to_async(render)(request, 'accounts/user_registration_template.html', {
                 'form' : self.form
             }
         )
 
-    def get(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
-        return self._build_default_context(request=request)
+    async def get(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        return await self._build_default_context(request=request)
 
-    def post(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+    async def post(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
         self.form = UserRegistrationForm(request.POST)
 
-        if self.form.is_valid():
-            self.form.save()
+        if await sync_to_async(self.form.is_valid)():
+            await self.form.asave()
             return redirect('accounts:login')
         else:
-            return self._build_default_context(request=request)
+            return await self._build_default_context(request=request)
 
 UserRegistrationView = UserRegistrationView.as_view()
 
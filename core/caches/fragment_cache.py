@@ -0,0 +1,69 @@
+import hashlib
+
+from django.core.cache         import caches
+from django.core.handlers.wsgi import WSGIRequest
+from django.http               import HttpResponse
+from django.template.loader    import render_to_string
+from typing                    import Callable
+
+
+class FragmentCache:
+    """
+    The FragmentCache class stores rendered templates in the cache configured
+    under the 'pages' alias. Cache keys are built from everything the rendered
+    content depends on, such as a primary key and a modified timestamp, so
+    saving the underlying rows moves readers onto a new key and stale entries
+    simply expire.
+    """
+
+    alias  : str = 'pages'
+    timeout: int = 60 * 5
+
+    @classmethod
+    def key(
+        cls,
+        name: str,
+        *parts: object
+    ) -> str:
+        """
+        Parameters:
+            name   -> the name of the cached fragment
+            *parts -> the values the rendered fragment depends on
+
+        Returns:
+            A string representing the cache key of the fragment
+        """
+        digest: str = hashlib.md5(
+            '|'.join(str(part) for part in parts).encode()
+        ).hexdigest()
+
+        return f'{cls.alias}:{name}:{digest}'
+
+    @classmethod
+    def render(
+        cls,
+        request: WSGIRequest,
+        template_name: str,
+        get_context: Callable[[], dict],
+        *,
+        key: str
+    ) -> HttpResponse:
+        """
+        Parameters:
+            request       -> the request the template is rendered for
+            template_name -> the template being rendered
+            get_context   -> a callable building the template context, which is
+                             only called when the fragment is not cached
+            key           -> the cache key built with FragmentCache.key
+
+        Returns:
+            An HttpResponse holding the cached or freshly rendered template
+        """
+        cache   = caches[cls.alias]
+        content = cache.get(key)
+
+        if content is None:
+            content = render_to_string(template_name, get_context(), request)
+            cache.set(key, content, cls.timeout)
+
+        return HttpResponse(content)
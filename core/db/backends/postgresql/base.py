@@ -0,0 +1,160 @@
+import psycopg2
+import threading
+
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
+from functools                          import partial
+from psycopg2.pool                      import ThreadedConnectionPool
+from typing                             import Callable, Dict, Optional
+
+
+class ConnectionPool(ThreadedConnectionPool):
+    """
+    The ConnectionPool class is a psycopg2 ThreadedConnectionPool whose new
+    connections are opened by Django, so they are configured exactly like
+    the connections Django opens without a pool. Every connection handed
+    back is kept idle for the next checkout, up to the maximum size.
+    """
+
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        new_connection: Callable
+    ) -> None:
+        self._new_connection = new_connection
+        super().__init__(minconn, maxconn)
+
+    def _connect(self, key: Optional[str]=None):
+        connection = self._new_connection()
+
+        if key is not None:
+            self._used[key] = connection
+            self._rused[id(connection)] = key
+        else:
+            self._pool.append(connection)
+
+        return connection
+
+    def _putconn(self, conn, key: Optional[str]=None, close: bool=False) -> None:
+        # psycopg2 only keeps minconn idle connections and closes the others,
+        # so every connection up to maxconn is kept and MIN_SIZE only sets the
+        # number opened upfront. putconn holds the lock of the pool
+        minconn, self.minconn = self.minconn, self.maxconn
+
+        try:
+            super()._putconn(conn, key, close)
+        finally:
+            self.minconn = minconn
+
+
+_pools     : Dict[str, ConnectionPool] = {}
+_pools_lock: threading.Lock            = threading.Lock()
+
+
+class DatabaseWrapper(PostgreSQLDatabaseWrapper):
+    """
+    The DatabaseWrapper class extends the PostgreSQL backend with the two
+    connection settings Django 3.2 lacks:
+
+        CONN_HEALTH_CHECKS -> a persistent connection is pinged before its
+                              first use in each request, and a pooled one
+                              when it is checked out of the pool, and either
+                              is replaced if the server has dropped it
+        POOL               -> a dictionary holding the MIN_SIZE and MAX_SIZE
+                              of an in-process connection pool shared by the
+                              threads of the worker. Closing a connection hands
+                              it back to the pool instead of disconnecting, so
+                              CONN_MAX_AGE is best left at 0 when it is enabled
+    """
+
+    health_check_done: bool = False
+    discard_on_close : bool = False
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        return _pools.get(self.alias)
+
+    def get_new_connection(self, conn_params: dict):
+        max_size: int = self.settings_dict.get('POOL', {}).get('MAX_SIZE', 0)
+
+        if not max_size:
+            return super().get_new_connection(conn_params)
+
+        with _pools_lock:
+            if self.alias not in _pools:
+                _pools[self.alias] = ConnectionPool(
+                    self.settings_dict['POOL'].get('MIN_SIZE', 0),
+                    max_size,
+                    partial(super().get_new_connection, conn_params)
+                )
+
+        connection = self.pool.getconn()
+
+        if self.settings_dict.get('CONN_HEALTH_CHECKS') and not self._ping(connection):
+            self.pool.putconn(connection, close=True)
+            connection = self.pool.getconn()
+
+        self.isolation_level = self.settings_dict['OPTIONS'].get(
+            'isolation_level',
+            connection.isolation_level
+        )
+
+        return connection
+
+    @staticmethod
+    def _ping(connection) -> bool:
+        """
+        Parameters:
+            connection -> a psycopg2 connection checked out of the pool
+
+        Returns:
+            A boolean representing whether the server answered on the
+            connection, which is left outside of any transaction
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+
+            if not connection.autocommit:
+                connection.rollback()
+        except psycopg2.Error:
+            return False
+
+        return True
+
+    def connect(self) -> None:
+        super().connect()
+
+        self.health_check_done = True
+        self.discard_on_close  = False
+
+    def ensure_connection(self) -> None:
+        if (
+            self.connection is not None
+            and self.settings_dict.get('CONN_HEALTH_CHECKS')
+            and not self.health_check_done
+            and not self.in_atomic_block
+        ):
+            if not self.is_usable():
+                self.discard_on_close = True
+                self.close()
+
+            self.health_check_done = True
+
+        super().ensure_connection()
+
+    def close_if_unusable_or_obsolete(self) -> None:
+        super().close_if_unusable_or_obsolete()
+
+        # close_if_unusable_or_obsolete runs when a request starts and finishes
+        self.health_check_done = False
+
+    def _close(self) -> None:
+        if self.pool is None or self.connection is None:
+            return super()._close()
+
+        with self.wrap_database_errors:
+            self.pool.putconn(
+                self.connection,
+                close=self.discard_on_close or self.errors_occurred
+            )
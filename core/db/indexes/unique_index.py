@@ -0,0 +1,26 @@
+from django.db.backends.ddl_references import Statement
+from django.db.models                  import Index
+
+
+class UniqueIndex(Index):
+    """
+    The UniqueIndex class is an Index whose values must be unique. Django 3.2
+    only accepts plain fields in UniqueConstraint, so a functional unique
+    constraint, such as one on Lower('username'), is declared as this index
+    in Meta.indexes, which keeps it owned by makemigrations.
+    """
+
+    def create_sql(self, model, schema_editor, using: str='', **kwargs: dict) -> Statement:
+        """
+        Parameters:
+            model         -> the model the index belongs to
+            schema_editor -> the schema editor of the database
+            using         -> the index method clause
+
+        Returns:
+            The CREATE UNIQUE INDEX statement of the index
+        """
+        statement = super().create_sql(model, schema_editor, using=using, **kwargs)
+        statement.template = statement.template.replace('CREATE INDEX', 'CREATE UNIQUE INDEX', 1)
+
+        return statement
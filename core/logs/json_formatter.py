@@ -0,0 +1,41 @@
+import json
+import logging
+
+from datetime import datetime, timezone
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    The JsonFormatter class writes every record as a single JSON object per
+    line. Any attribute added to the record through the extra argument or
+    by a filter, such as the query figures of QueryInstrumentationMiddleware,
+    becomes a field of the object.
+    """
+
+    # the attributes every LogRecord carries, which are not extra fields
+    reserved = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict = {
+            'time'    : datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level'   : record.levelname,
+            'logger'  : record.name,
+            'message' : record.getMessage(),
+            'module'  : record.module,
+            'function': record.funcName,
+            'line'    : record.lineno,
+            'process' : record.process,
+            'thread'  : record.thread,
+        }
+
+        entry.update(
+            (key, value) for key, value in vars(record).items()
+            if key not in self.reserved
+        )
+
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+
+        return json.dumps(entry, default=str)
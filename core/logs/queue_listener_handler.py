@@ -0,0 +1,81 @@
+import atexit
+import copy
+import logging
+import queue
+import threading
+
+from logging.handlers import QueueHandler, QueueListener
+from typing           import List, Optional
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    The QueueListenerHandler class only puts records on an in-memory queue,
+    so the thread that logs never waits on disk I/O. A QueueListener thread
+    hands the queued records to the handlers named in the handlers argument.
+    The listener is started by the first record, once dictConfig has
+    configured the named handlers, and stopped when the process exits so
+    queued records are flushed.
+    """
+
+    def __init__(
+        self,
+        handlers: List[str],
+        respect_handler_level: bool=True
+    ) -> None:
+        super().__init__(queue.SimpleQueue())
+
+        self.handler_names        : List[str]               = list(handlers)
+        self.respect_handler_level: bool                    = respect_handler_level
+        self.listener             : Optional[QueueListener] = None
+        self._listener_lock       : threading.Lock          = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.listener is None:
+            self._start_listener()
+
+        super().enqueue(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Parameters:
+            record -> the record logged by the calling thread
+
+        Returns:
+            A copy of the record that can be formatted on the listener thread,
+            with its message merged and its traceback rendered as exc_text
+        """
+        record = copy.copy(record)
+
+        record.message = record.getMessage()
+        record.msg     = record.message
+        record.args    = None
+
+        if record.exc_info:
+            record.exc_text = record.exc_text or logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+    def close(self) -> None:
+        with self._listener_lock:
+            if self.listener is not None:
+                self.listener.stop()
+                self.listener = None
+
+        super().close()
+
+    def _start_listener(self) -> None:
+        with self._listener_lock:
+            if self.listener is not None:
+                return
+
+            # dictConfig names every handler it configures
+            self.listener = QueueListener(
+                self.queue,
+                *(logging._handlers[name] for name in self.handler_names),
+                respect_handler_level=self.respect_handler_level
+            )
+            self.listener.start()
+
+            atexit.register(self.close)
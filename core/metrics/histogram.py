@@ -0,0 +1,79 @@
+import threading
+
+from bisect import bisect_left
+from typing import List, Tuple
+
+
+class Histogram:
+    """
+    The Histogram class counts observed durations in fixed buckets, the way
+    a Prometheus histogram does. Observing a duration costs a bisection and
+    a locked increment, which keeps it cheap enough to stay on in
+    production, and percentiles are estimated from the buckets.
+    """
+
+    # seconds, from half a millisecond to ten seconds
+    BUCKETS: Tuple[float, ...] = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(self, buckets: Tuple[float, ...]=BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts : List[int]         = [0] * (len(self.buckets) + 1)
+        self.sum    : float             = 0.0
+        self.count  : int               = 0
+        self._lock  : threading.Lock    = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            self.counts[index] += 1
+            self.sum           += value
+            self.count         += 1
+
+    def cumulative_counts(self) -> List[int]:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A list holding the number of observations at or below each bucket
+            bound, the last one counting every observation
+        """
+        with self._lock:
+            counts = list(self.counts)
+
+        for index in range(1, len(counts)):
+            counts[index] += counts[index - 1]
+
+        return counts
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Parameters:
+            percentile -> the percentile estimated, between 0 and 100
+
+        Returns:
+            A float representing the estimated duration in seconds, which is
+            interpolated linearly within the bucket holding the percentile
+        """
+        counts = self.cumulative_counts()
+        target = counts[-1] * percentile / 100
+
+        if not counts[-1]:
+            return 0.0
+
+        for index, count in enumerate(counts):
+            if count >= target:
+                # observations above the last bound are reported at that bound
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+
+                lower    : float = self.buckets[index - 1] if index else 0.0
+                previous : int   = counts[index - 1] if index else 0
+                in_bucket: int   = count - previous
+
+                return lower + (self.buckets[index] - lower) * (target - previous) / in_bucket
+
+        return self.buckets[-1]
@@ -0,0 +1,91 @@
+import threading
+
+from typing import Dict, List
+
+from core.metrics.histogram import Histogram
+
+
+class MetricsRegistry:
+    """
+    The MetricsRegistry class holds the duration histogram of every function
+    decorated with timed in the current process. The histograms are exported
+    in the Prometheus text format by MetricsView, and each worker process
+    exposes its own, so the scraper aggregates them across workers.
+    """
+
+    metric: str = 'call_duration_seconds'
+
+    _histograms: Dict[str, Histogram] = {}
+    _lock      : threading.Lock       = threading.Lock()
+
+    @classmethod
+    def histogram(cls, name: str) -> Histogram:
+        """
+        Parameters:
+            name -> the name of the timed function
+
+        Returns:
+            The Histogram of the function, which is created on first use
+        """
+        histogram = cls._histograms.get(name)
+
+        if histogram is None:
+            with cls._lock:
+                histogram = cls._histograms.setdefault(name, Histogram())
+
+        return histogram
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, float]]:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A dictionary holding the count, the mean and the estimated 50th,
+            95th and 99th percentile durations in milliseconds of every timed
+            function
+        """
+        return {
+            name: {
+                'count'  : histogram.count,
+                'mean_ms': round(histogram.sum / histogram.count * 1000, 3) if histogram.count else 0.0,
+                'p50_ms' : round(histogram.percentile(50) * 1000, 3),
+                'p95_ms' : round(histogram.percentile(95) * 1000, 3),
+                'p99_ms' : round(histogram.percentile(99) * 1000, 3),
+            }
+            for name, histogram in sorted(cls._histograms.items())
+        }
+
+    @classmethod
+    def render(cls) -> str:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A string holding every histogram in the Prometheus text exposition
+            format, labelled by function
+        """
+        lines: List[str] = [
+            f'# HELP {cls.metric} Duration of the timed functions in seconds.',
+            f'# TYPE {cls.metric} histogram',
+        ]
+
+        for name, histogram in sorted(cls._histograms.items()):
+            counts = histogram.cumulative_counts()
+            bounds = [repr(bound) for bound in histogram.buckets] + ['+Inf']
+
+            lines.extend(
+                f'{cls.metric}_bucket{{function="{name}",le="{bound}"}} {count}'
+                for bound, count in zip(bounds, counts)
+            )
+            lines.append(f'{cls.metric}_sum{{function="{name}"}} {histogram.sum!r}')
+            lines.append(f'{cls.metric}_count{{function="{name}"}} {counts[-1]}')
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._histograms.clear()
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+from functools import wraps
+from typing    import Callable, Optional
+
+from core.metrics.metrics_registry import MetricsRegistry
+
+
+def timed(
+    function: Optional[Callable]=None,
+    *,
+    name: Optional[str]=None
+) -> Callable:
+    """
+    Parameters:
+        function -> the function being timed, when used without arguments
+        name     -> the name the durations are recorded under, which defaults
+                    to the qualified name of the function
+
+    Returns:
+        The decorated function, or a decorator when only a name is given
+
+    The timed decorator records the duration of every call of a function or
+    coroutine function, including the calls that raise, in its histogram
+    of the MetricsRegistry.
+    """
+    def decorate(function: Callable) -> Callable:
+        label: str = name or function.__qualname__
+
+        if asyncio.iscoroutinefunction(function):
+            @wraps(function)
+            async def wrapper(*args: tuple, **kwargs: dict) -> object:
+                started = time.perf_counter()
+                try:
+                    return await function(*args, **kwargs)
+                finally:
+                    MetricsRegistry.histogram(label).observe(time.perf_counter() - started)
+        else:
+            @wraps(function)
+            def wrapper(*args: tuple, **kwargs: dict) -> object:
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    MetricsRegistry.histogram(label).observe(time.perf_counter() - started)
+
+        return wrapper
+
+    return decorate(function) if function is not None else decorate
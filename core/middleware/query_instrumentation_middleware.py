@@ -0,0 +1,254 @@
+import logging
+import random
+import time
+
+from asgiref.sync              import sync_to_async
+from collections               import Counter, defaultdict
+from contextvars               import ContextVar
+from django.conf               import settings
+from django.core.exceptions    import MiddlewareNotUsed
+from django.core.handlers.wsgi import WSGIRequest
+from django.db                 import connections
+from django.http               import HttpResponse
+from typing                    import Callable, Dict, List, Optional, Tuple
+
+from core.utils.coroutines import iscoroutinefunction, markcoroutinefunction
+
+logger = logging.getLogger('accounts')
+
+
+class QueryRecorder:
+    """
+    The QueryRecorder class is the execute_wrapper counting and timing every
+    statement run while it is installed. Statements are grouped by their SQL
+    without parameters, so the same statement run for every row of a loop
+    shows up as one repeated statement.
+    """
+
+    def __init__(self) -> None:
+        self.count     : int                     = 0
+        self.elapsed   : float                   = 0.0
+        self.statements: List[Tuple[float, str]] = []
+        self.repeats   : Counter                 = Counter()
+
+    def __call__(
+        self,
+        execute: Callable,
+        sql: str,
+        params: tuple,
+        many: bool,
+        context: dict
+    ) -> object:
+        started = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+
+            self.count   += 1
+            self.elapsed += elapsed
+            self.statements.append((elapsed, sql))
+            self.repeats[sql] += 1
+
+    def slowest(self, count: int) -> List[Dict[str, object]]:
+        """
+        Parameters:
+            count -> the number of statements returned
+
+        Returns:
+            A list holding the SQL and time in milliseconds of the slowest
+            statements, slowest first
+        """
+        return [
+            {'sql': sql, 'ms': round(elapsed * 1000, 3)}
+            for elapsed, sql in sorted(self.statements, reverse=True)[:count]
+        ]
+
+    def repeated(self, threshold: int) -> List[Dict[str, object]]:
+        """
+        Parameters:
+            threshold -> the number of runs from which a statement is flagged
+
+        Returns:
+            A list holding the SQL, the number of runs and the total time in
+            milliseconds of every statement run at least threshold times
+        """
+        totals: Dict[str, float] = defaultdict(float)
+        for elapsed, sql in self.statements:
+            totals[sql] += elapsed
+
+        return [
+            {'sql': sql, 'count': count, 'ms': round(totals[sql] * 1000, 3)}
+            for sql, count in self.repeats.most_common()
+            if count >= threshold
+        ]
+
+
+_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar('query_recorder', default=None)
+
+
+def record_queries(
+    execute: Callable,
+    sql: str,
+    params: tuple,
+    many: bool,
+    context: dict
+) -> object:
+    """
+    Parameters:
+        execute -> the next execute callable of the connection
+        sql     -> the statement being run
+        params  -> the parameters of the statement
+        many    -> whether the statement runs with executemany
+        context -> the connection and cursor running the statement
+
+    Returns:
+        The result of the statement
+
+    The record_queries function is the execute_wrapper left on the
+    connections of every thread that ran a sampled request. It hands each
+    statement to the QueryRecorder of the request running it, which is found
+    through a ContextVar, so the statements of concurrent async requests
+    sharing the database thread are told apart.
+    """
+    recorder: Optional[QueryRecorder] = _recorder.get()
+
+    if recorder is None:
+        return execute(sql, params, many, context)
+
+    return recorder(execute, sql, params, many, context)
+
+
+def install_recorder() -> None:
+    """
+    Parameters:
+        None
+
+    Returns:
+        None
+
+    The install_recorder function adds record_queries to the connections of
+    the current thread that do not have it yet.
+    """
+    for connection in connections.all():
+        if record_queries not in connection.execute_wrappers:
+            connection.execute_wrappers.append(record_queries)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    The QueryInstrumentationMiddleware class records the SQL statements run
+    by a sample of the requests on every configured database. The query
+    count, the total database time and the slowest statements of a sampled
+    request are logged through the accounts logger, and a request running
+    the same statement REPEAT_THRESHOLD times or more, the footprint of an
+    N+1 pattern, is logged as a warning. In debug every request is sampled
+    and the figures are also sent as response headers.
+
+    The middleware is configured by the QUERY_INSTRUMENTATION setting, a
+    dictionary holding the SAMPLE_RATE, TOP_N and REPEAT_THRESHOLD, and
+    removes itself when no request would be sampled. It should be placed
+    first so the queries of the other middleware are recorded too.
+
+    The middleware is async capable, so it does not force the async views
+    onto a thread under ASGI. Their queries run on the database thread of
+    sync_to_async, where record_queries is installed before the request is
+    handled.
+    """
+
+    sync_capable : bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable) -> None:
+        options: dict = getattr(settings, 'QUERY_INSTRUMENTATION', {})
+
+        self.sample_rate     : float = options.get('SAMPLE_RATE', 0.0)
+        self.top_n           : int   = options.get('TOP_N', 5)
+        self.repeat_threshold: int   = options.get('REPEAT_THRESHOLD', 5)
+
+        if not settings.DEBUG and not self.sample_rate:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: WSGIRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self._sampled():
+            return self.get_response(request)
+
+        install_recorder()
+
+        recorder = QueryRecorder()
+        token    = _recorder.set(recorder)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            _recorder.reset(token)
+
+        return self._report(request, response, recorder)
+
+    async def __acall__(self, request: WSGIRequest) -> HttpResponse:
+        if not self._sampled():
+            return await self.get_response(request)
+
+        await sync_to_async(install_recorder)()
+
+        recorder = QueryRecorder()
+        token    = _recorder.set(recorder)
+
+        try:
+            response = await self.get_response(request)
+        finally:
+            _recorder.reset(token)
+
+        return self._report(request, response, recorder)
+
+    def _sampled(self) -> bool:
+        return settings.DEBUG or random.random() < self.sample_rate
+
+    def _report(
+        self,
+        request: WSGIRequest,
+        response: HttpResponse,
+        recorder: QueryRecorder
+    ) -> HttpResponse:
+        """
+        Parameters:
+            request  -> the sampled request
+            response -> the response of the sampled request
+            recorder -> the statements run by the sampled request
+
+        Returns:
+            The response, with the debug headers in debug
+        """
+        repeated: List[Dict[str, object]] = recorder.repeated(self.repeat_threshold)
+
+        logger.log(
+            logging.WARNING if repeated else logging.INFO,
+            'Queried %s %s with %d statements in %.1f ms',
+            request.method,
+            request.path,
+            recorder.count,
+            recorder.elapsed * 1000,
+            extra={
+                'path'    : request.path,
+                'queries' : recorder.count,
+                'db_ms'   : round(recorder.elapsed * 1000, 3),
+                'slowest' : recorder.slowest(self.top_n),
+                'repeated': repeated,
+            }
+        )
+
+        if settings.DEBUG:
+            response['X-DB-Queries']  = str(recorder.count)
+            response['X-DB-Time-Ms']  = f'{recorder.elapsed * 1000:.3f}'
+            response['X-DB-Repeated'] = str(len(repeated))
+
+        return response
@@ -0,0 +1,66 @@
+import time
+
+from asgiref.sync              import sync_to_async
+from django.conf               import settings
+from django.core.exceptions    import MiddlewareNotUsed
+from django.core.handlers.wsgi import WSGIRequest
+from django.http               import HttpResponse
+from typing                    import Callable
+
+from core.routers.replica_router import ReplicaRouter
+from core.utils.coroutines       import iscoroutinefunction, markcoroutinefunction
+
+
+class ReplicaStickinessMiddleware:
+    """
+    The ReplicaStickinessMiddleware class activates a ReplicaState for every
+    request. A request that writes pins the reads of its session to the
+    primary database for the next REPLICA_STICKY_SECONDS, so the session
+    never reads from a replica that has not caught up with its own writes.
+    The middleware removes itself when no replica is configured and must
+    be placed after SessionMiddleware.
+
+    The middleware is async capable. The ReplicaState lives in a ContextVar,
+    so the state activated around an async view is the one the router sees
+    in the sync_to_async calls running its queries, and the writes they make
+    mark that same state.
+    """
+
+    session_key  : str  = '_replica_pinned_until'
+    sync_capable : bool = True
+    async_capable: bool = True
+
+    def __init__(self, get_response: Callable) -> None:
+        if not getattr(settings, 'REPLICA_DATABASES', []):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: WSGIRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        pinned_until: float = request.session.get(self.session_key, 0)
+
+        with ReplicaRouter.state(pinned=time.time() < pinned_until) as state:
+            response = self.get_response(request)
+
+        if state.wrote:
+            request.session[self.session_key] = time.time() + settings.REPLICA_STICKY_SECONDS
+
+        return response
+
+    async def __acall__(self, request: WSGIRequest) -> HttpResponse:
+        # loading the session may query the database
+        pinned_until: float = await sync_to_async(request.session.get)(self.session_key, 0)
+
+        with ReplicaRouter.state(pinned=time.time() < pinned_until) as state:
+            response = await self.get_response(request)
+
+        if state.wrote:
+            request.session[self.session_key] = time.time() + settings.REPLICA_STICKY_SECONDS
+
+        return response
@@ -1,9 +1,14 @@
-from django.db import models
+from django.db                import models
+from django.utils.translation import ugettext_lazy as _
+
+from core.utils.time_ordered_uuid import time_ordered_uuid
 
 class TimeStamp(models.Model):
     """
     An abstract base class model that provides self-updating
-    'created' and 'modified' fields.
+    'created' and 'modified' fields and a time-ordered 'uuid'
+    primary key, so new rows append to the primary key index
+    in the same order as 'created'.
     """
 
     created = models.DateTimeField(
@@ -14,6 +19,13 @@ class TimeStamp(models.Model):
         auto_now=True
     )
 
+    uuid = models.UUIDField(
+        _('UUID'),
+        primary_key=True,
+        default=time_ordered_uuid,
+        editable=False
+    )
+
     class Meta:
         """
         TimeStamp.Meta class designating that his class is abstract 
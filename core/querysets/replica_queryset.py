@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class ReplicaQuerySet(models.QuerySet):
+    """
+    The ReplicaQuerySet class is the base class of QuerySets whose read-only
+    methods may be answered by a read replica. Those methods chain through
+    on_replica, which leaves a hint the ReplicaRouter looks for. Every other
+    read keeps going to the primary database.
+    """
+
+    def on_replica(self) -> ReplicaQuerySet:
+        """
+        Parameters:
+            None
+
+        Returns:
+            A chainable QuerySet the ReplicaRouter may read from a replica
+        """
+        queryset = self._chain()
+
+        # the hints dictionary is shared between clones, so it is replaced
+        queryset._hints = {**queryset._hints, 'replica': True}
+
+        return queryset
@@ -0,0 +1,120 @@
+import random
+
+from contextlib  import contextmanager
+from contextvars import ContextVar
+from django.conf import settings
+from django.db   import DEFAULT_DB_ALIAS, models
+from typing      import Iterator, List, Optional
+
+
+class ReplicaState:
+    """
+    The ReplicaState class tracks whether the reads of the current unit of
+    work, usually a request, must stay on the primary database. It is
+    pinned when the session wrote within the sticky window and it records
+    every write made while it is active.
+    """
+
+    def __init__(self, *, pinned: bool=False) -> None:
+        self.pinned: bool = pinned
+        self.wrote : bool = False
+
+    @property
+    def use_primary(self) -> bool:
+        return self.pinned or self.wrote
+
+
+_replica_state: ContextVar[Optional[ReplicaState]] = ContextVar('replica_state', default=None)
+
+
+class ReplicaRouter:
+    """
+    The ReplicaRouter class sends the reads of QuerySets marked with
+    ReplicaQuerySet.on_replica to one of the databases listed in the
+    REPLICA_DATABASES setting. Writes and every read that was not marked
+    are left to Django, which sends them to the primary database or to the
+    database of the instance they concern, and rows read from a replica are
+    written back to the primary database. When no replica is configured
+    every query goes to the primary database.
+
+    So a session always reads its own writes, marked reads stay on the
+    primary database after a write within the active ReplicaState and while
+    that state is pinned. ReplicaStickinessMiddleware pins the state of every
+    request made within REPLICA_STICKY_SECONDS of the session's last write,
+    which should cover the replication lag of the replicas.
+    """
+
+    @property
+    def replicas(self) -> List[str]:
+        return getattr(settings, 'REPLICA_DATABASES', [])
+
+    @staticmethod
+    @contextmanager
+    def state(*, pinned: bool=False) -> Iterator[ReplicaState]:
+        """
+        Parameters:
+            pinned -> whether every read must stay on the primary database
+
+        Returns:
+            A context manager activating a new ReplicaState for the code it
+            wraps and yielding it
+        """
+        state = ReplicaState(pinned=pinned)
+        token = _replica_state.set(state)
+
+        try:
+            yield state
+        finally:
+            _replica_state.reset(token)
+
+    def db_for_read(
+        self,
+        model: models.Model,
+        **hints: dict
+    ) -> Optional[str]:
+        if not hints.get('replica') or not self.replicas:
+            return None
+
+        state: Optional[ReplicaState] = _replica_state.get()
+
+        if state is not None and state.use_primary:
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(self.replicas)
+
+    def db_for_write(
+        self,
+        model: models.Model,
+        **hints: dict
+    ) -> Optional[str]:
+        state: Optional[ReplicaState] = _replica_state.get()
+
+        if state is not None:
+            state.wrote = True
+
+        instance: Optional[models.Model] = hints.get('instance')
+
+        # rows read from a replica are written back to the primary database
+        if instance is not None and instance._state.db in self.replicas:
+            return DEFAULT_DB_ALIAS
+
+        return None
+
+    def allow_relation(
+        self,
+        first: models.Model,
+        second: models.Model,
+        **hints: dict
+    ) -> Optional[bool]:
+        # replicas hold the same rows as the primary database
+        return True
+
+    def allow_migrate(
+        self,
+        db: str,
+        app_label: str,
+        model_name: Optional[str]=None,
+        **hints: dict
+    ) -> Optional[bool]:
+        # replicas receive the schema through replication
+        return db not in self.replicas
@@ -50,8 +50,10 @@ INSTALLED_APPS = [
 ] + CUSTOM_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    'core.middleware.query_instrumentation_middleware.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.replica_stickiness_middleware.ReplicaStickinessMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -59,6 +61,16 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# a sample of the requests, and every request in debug, has its queries recorded
+QUERY_INSTRUMENTATION = {
+    'SAMPLE_RATE'     : float(os.getenv('QUERY_SAMPLE_RATE', '0.01')),
+    'TOP_N'           : int(os.getenv('QUERY_TOP_N', '5')),
+    'REPEAT_THRESHOLD': int(os.getenv('QUERY_REPEAT_THRESHOLD', '5')),
+}
+
+# the durations recorded by core.metrics.timed are served at /metrics/ for Prometheus
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'False') == 'True'
+
 ROOT_URLCONF = 'core.urls'
 
 TEMPLATES = [
@@ -79,18 +91,39 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'core.wsgi.application'
 
+# the accounts views are async, so ASGI lets one worker overlap many requests
+ASGI_APPLICATION = 'core.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
+# Django's PostgreSQL backend unless a pool size is set, which opts into the
+# backend extended with CONN_HEALTH_CHECKS and POOL
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '0'))
+
 DATABASES = {
     'default': {
-        'ENGINE'  : 'django.db.backends.postgresql_psycopg2', 
-        'NAME'    : os.getenv('DB_NAME'),
-        'USER'    : os.getenv('DB_USER'),
-        'PASSWORD': os.getenv('DB_PASSWORD'),
-        'HOST'    : 'localhost',
-        'PORT'    : ''
+        'ENGINE'            : 'core.db.backends.postgresql' if DB_POOL_MAX_SIZE else 'django.db.backends.postgresql',
+        'NAME'              : os.getenv('DB_NAME'),
+        'USER'              : os.getenv('DB_USER'),
+        'PASSWORD'          : os.getenv('DB_PASSWORD'),
+        'HOST'              : os.getenv('DB_HOST', 'localhost'),
+        'PORT'              : os.getenv('DB_PORT', ''),
+        # seconds a connection is reused across requests, 0 closes it after each
+        # request. Under ASGI every request thread keeps its own persistent
+        # connection, so it is only worth raising under WSGI
+        'CONN_MAX_AGE'      : int(os.getenv('DB_CONN_MAX_AGE', '0')),
+        # pooled connections are pinged before their first use in a request
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
+        # an in-process connection pool per worker, a MAX_SIZE of 0 disables it
+        'POOL'              : {
+            'MIN_SIZE': int(os.getenv('DB_POOL_MIN_SIZE', '0')),
+            'MAX_SIZE': DB_POOL_MAX_SIZE,
+        },
+        'OPTIONS'           : {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+        }
     },
     'default_sqllite': {
         'ENGINE': 'django.db.backends.sqlite3',
@@ -98,6 +131,50 @@ DATABASES = {
     }
 }
 
+if os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': os.getenv('DB_REPLICA_HOST'),
+        'PORT': os.getenv('DB_REPLICA_PORT', ''),
+        'TEST': {
+            'MIRROR': 'default'
+        }
+    }
+
+# the aliases ReplicaRouter may send reads marked with on_replica to
+REPLICA_DATABASES = [alias for alias in DATABASES if alias.startswith('replica')]
+
+# seconds a session reads from the primary database after writing, which
+# should exceed the replication lag of the replicas
+REPLICA_STICKY_SECONDS = int(os.getenv('DB_REPLICA_STICKY_SECONDS', '5'))
+
+DATABASE_ROUTERS = [
+    'core.routers.replica_router.ReplicaRouter'
+]
+
+# Caches
+# https://docs.djangoproject.com/en/3.1/topics/cache/
+
+# the friend and block indexes and the login cache are only shared by the
+# workers when the default cache is, so deployments running several workers
+# should set CACHE_BACKEND to a shared cache such as Memcached
+
+CACHES = {
+    'default': {
+        'BACKEND' : os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'default'),
+    },
+    'pages': {
+        'BACKEND' : os.getenv('PAGE_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('PAGE_CACHE_LOCATION', 'pages'),
+    }
+}
+
+# unknown logins are only cached when the default cache is shared by every
+# worker, since a miss cached in the memory of one process would keep
+# rejecting a user who signed up through another
+AUTHENTICATION_CACHE_MISSES = 'locmem' not in CACHES['default']['BACKEND']
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
@@ -137,6 +214,13 @@ USE_TZ = True
 STATIC_URL = '/static/'
 
 AUTH_USER_MODEL = 'accounts.User'
+PASSWORD_EXECUTOR = {
+    'BACKEND': 'accounts.hashers.password_executor.ProcessPoolPasswordExecutor',
+    'OPTIONS': {
+        'max_workers': os.cpu_count(),
+        'chunksize'  : 16
+    }
+}
 AUTHENTICATION_BACKENDS = [
     'accounts.backends.accounts_backend.AccountsBackend'
 ]
@@ -155,6 +239,9 @@ LOGGING = {
     'formatters': {
         'verbose': {
             'format': '%(levelname)s %(asctime)s [%(filename)s %(funcName)s %(lineno)d] %(message)s'
+        },
+        'json': {
+            '()': 'core.logs.json_formatter.JsonFormatter'
         }
     },
     'handlers': {
@@ -163,10 +250,18 @@ LOGGING = {
             'filters': [
                 'require_debug_true'
             ],
+            'class': 'core.logs.queue_listener_handler.QueueListenerHandler',
+            'handlers': [
+                'accounts_file'
+            ]
+        },
+        'accounts_file': {
+            'level': 'INFO',
             'class': 'logging.FileHandler',
             'filename': 'logs/accounts/accounts.log',
-            'formatter': 'verbose',
-            'mode': 'w'
+            'formatter': 'json',
+            'mode': 'a',
+            'delay': True
         },
         'accounts_tests': {
             'level': 'INFO',
@@ -17,9 +17,11 @@ from django.contrib import admin
 from django.urls    import path, include
 
 from core.views.home_page_view import HomePageView
+from core.views.metrics_view   import MetricsView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', HomePageView, name='home'),
+    path('metrics/', MetricsView, name='metrics'),
     path('accounts/', include(('accounts.urls', 'accounts'), namespace='accounts'))
 ]
@@ -0,0 +1,23 @@
+import asyncio
+
+from typing import Callable
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:
+    # asgiref 3.6 added both, the fallbacks do what they do before Python 3.12
+    iscoroutinefunction = asyncio.iscoroutinefunction
+
+    def markcoroutinefunction(function: Callable) -> Callable:
+        """
+        Parameters:
+            function -> the callable returning a coroutine
+
+        Returns:
+            The same callable, marked so iscoroutinefunction reports it as a
+            coroutine function
+        """
+        function._is_coroutine = asyncio.coroutines._is_coroutine
+
+        return function
+
@@ -0,0 +1,31 @@
+from django.http  import HttpRequest, HttpResponse
+from django.views import View
+from typing       import Callable
+
+from core.utils.coroutines import markcoroutinefunction
+
+
+class AsyncView(View):
+    """
+    The AsyncView class is the base class of class-based views whose handlers
+    are coroutines. Django 3.2 only serves function views asynchronously, so
+    the function returned by as_view is marked as a coroutine function for
+    the request handler to await it instead of running it on a thread.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs: dict) -> Callable:
+        return markcoroutinefunction(super().as_view(**initkwargs))
+
+    async def http_method_not_allowed(
+        self,
+        request: HttpRequest,
+        *args: tuple,
+        **kwargs: dict
+    ) -> HttpResponse:
+        # dispatch returns whatever the handler returns, so every handler of
+        # an awaited view has to be a coroutine
+        return super().http_method_not_allowed(request, *args, **kwargs)
+
+    async def options(self, request: HttpRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        return super().options(request, *args, **kwargs)
@@ -3,10 +3,23 @@ from django.http               import HttpResponse
 from django.shortcuts          import render
 from django.views              import View
 
+from core.caches.fragment_cache import FragmentCache
+
 
 class HomePageView(View):
 
     def get(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        if not request.user.is_authenticated:
+            # every anonymous visitor is served the same page
+            return FragmentCache.render(
+                request,
+                'home_page_template.html',
+                lambda: {
+                    'user': request.user
+                },
+                key=FragmentCache.key('home_page', 'anonymous')
+            )
+
         return render(request, 'home_page_template.html', {
                 'user': request.user
             }
@@ -0,0 +1,25 @@
+from django.conf               import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.http               import Http404, HttpResponse
+from django.views              import View
+
+from core.metrics.metrics_registry import MetricsRegistry
+
+
+class MetricsView(View):
+    """
+    The MetricsView class exports the durations recorded by the timed
+    decorator in the Prometheus text format. It is only served when the
+    METRICS_ENABLED setting is set, since the figures are meant for the
+    scraper and not for visitors.
+    """
+
+    content_type: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def get(self, request: WSGIRequest, *args: tuple, **kwargs: dict) -> HttpResponse:
+        if not getattr(settings, 'METRICS_ENABLED', False):
+            raise Http404
+
+        return HttpResponse(MetricsRegistry.render(), content_type=self.content_type)
+
+MetricsView = MetricsView.as_view()